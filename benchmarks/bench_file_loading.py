@@ -0,0 +1,88 @@
+"""Compare the bytes read and time taken to load a Method before and after reading each file only once.
+
+On a network share the time to load a file is dominated by the number of bytes pulled over the wire, so the
+projected time uses the bytes read from `/proc/self/io` and the `--share-mbps` bandwidth. Pages of a memory-mapped
+file are faulted in rather than `read()`, so they do not show up in `/proc/self/io`; each page is pulled exactly
+once, so the file size is reported for that row instead.
+
+Usage: PYTHONPATH=src python benchmarks/bench_file_loading.py [--steps 3000] [--share-mbps 100]
+"""
+import argparse
+import os
+import time
+from typing import Callable
+from typing import Optional
+
+from lxml.etree import parse
+from robolint import utils
+from robolint.utils import parse_xml_module_from_file
+from robolint.utils import XmlModule
+from synthetic_method import temporary_synthetic_method
+
+
+def legacy_parse_xml_module_from_file(filepath: str) -> XmlModule:
+    """The loader before the change: one pass in text mode to count lines, then `lxml` reads the file again."""
+    line_count = 0
+    with open(filepath, encoding="utf-8") as xml_file:
+        for _, _ in enumerate(xml_file):
+            line_count += 1
+    xml = XmlModule()
+    xml.tolineno = line_count + 1
+    xml.file = filepath
+    xml.tree = parse(filepath)
+    return xml
+
+
+def _bytes_read_so_far() -> int:
+    try:
+        with open("/proc/self/io", encoding="utf-8") as io_file:
+            for line in io_file:
+                if line.startswith("rchar:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+def _measure(loader: Callable[[str], XmlModule], filepath: str, repeats: int) -> tuple[float, int]:
+    best_seconds = float("inf")
+    bytes_read = 0
+    for _ in range(repeats):
+        before_bytes = _bytes_read_so_far()
+        start = time.perf_counter()
+        loader(filepath)
+        best_seconds = min(best_seconds, time.perf_counter() - start)
+        bytes_read = _bytes_read_so_far() - before_bytes
+    return best_seconds, bytes_read
+
+
+def main() -> None:
+    """Load a synthetic Method with the legacy loader, then with a single `read()` and with a single `mmap`."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--steps", type=int, default=3000)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--share-mbps", type=float, default=100.0, help="Bandwidth of the simulated network share.")
+    args = parser.parse_args()
+
+    with temporary_synthetic_method(args.steps) as filepath:
+        file_size = os.path.getsize(filepath)
+        loaders: list[tuple[str, Callable[[str], XmlModule], Optional[int]]] = [
+            ("legacy (read twice)", legacy_parse_xml_module_from_file, None),
+            ("single read()", parse_xml_module_from_file, file_size + 1),
+            ("single mmap", parse_xml_module_from_file, 0),
+        ]
+        for label, loader, mmap_threshold in loaders:
+            if mmap_threshold is not None:
+                utils.MMAP_THRESHOLD_BYTES = mmap_threshold
+            seconds, bytes_read = _measure(loader, filepath, args.repeats)
+            if mmap_threshold == 0:
+                bytes_read = file_size
+            projected_share_seconds = bytes_read * 8 / (args.share_mbps * 1e6)
+            print(  # allow-print
+                f"{label:>20}: {seconds * 1000:8.1f} ms local, {bytes_read / 1e6:6.1f} MB read, "
+                f"~{projected_share_seconds * 1000:8.1f} ms of transfer at {args.share_mbps:g} Mbps"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Compare the start-up time of the `robolint` console script with lazily and eagerly imported checker plugins.
+
+Before the `robolint.checkers` entry points, starting `robolint` imported every checker module (from `load-plugins`
+and `robolint/__init__.py`) and `pytest` (through `pylint.testutils`, from `robolint.utils`).  The eager row imports
+those modules on top of the console script's; the lint rows run the console script on a small synthetic Method with
+every plugin loaded, and one or every message enabled.  Each row is measured in a fresh interpreter.
+
+Usage: PYTHONPATH=src python benchmarks/bench_import_time.py [--repeat 10]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from robolint.plugins import get_plugin_declarations
+from synthetic_method import write_synthetic_method
+
+PLUGIN_MODNAMES = (
+    "robolint.checkers.hardcoded_values",
+    "robolint.checkers.labware",
+    "robolint.checkers.looping",
+    "robolint.checkers.parameter_rules",
+    "robolint.checkers.robocase",
+    "robolint.checkers.tip_checkers",
+)
+
+
+def _count_modules_code(imports: str) -> str:
+    return (
+        f"{imports}; import sys; print(len(sys.modules), 'pytest' in sys.modules, "
+        "sum(name.startswith('robolint.checkers.') for name in sys.modules))"
+    )
+
+
+def _best_seconds(command: list[str], repeat: int) -> tuple[float, str]:
+    timings = []
+    output = ""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        output = subprocess.run(command, check=False, capture_output=True, text=True).stdout
+        timings.append(time.perf_counter() - start)
+    return min(timings), output
+
+
+def main() -> None:
+    """Time importing robolint with lazy and eager plugins, then linting a small synthetic Method."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    if not get_plugin_declarations():
+        print("No `robolint.checkers` entry points, reinstall robolint with `pip install -e .`")  # allow-print
+
+    eager_imports = "; ".join(f"import {modname}" for modname in ("pylint.testutils", *PLUGIN_MODNAMES))
+    for label, imports in (
+        ("lazy (robolint.run)", "import robolint.run"),
+        ("eager (as before)", f"import robolint.run; {eager_imports}"),
+    ):
+        seconds, output = _best_seconds([sys.executable, "-c", _count_modules_code(imports)], args.repeat)
+        module_count, imports_pytest, checker_module_count = output.split()
+        print(  # allow-print
+            f"{label:>22}: best {seconds * 1000:6.0f} ms of {args.repeat}, {module_count} modules, "
+            f"{checker_module_count} checker modules, pytest imported: {imports_pytest}"
+        )
+
+    with tempfile.TemporaryDirectory() as directory:
+        filepath = write_synthetic_method(100, directory)
+        rcfile = os.path.join(directory, "robolintrc")
+        with open(rcfile, "w", encoding="utf-8") as rc_file:
+            rc_file.write(f"[MAIN]\nload-plugins={','.join(PLUGIN_MODNAMES)}\ndisable=all\npersistent=no\n")
+        for label, enable in (
+            ("lint, one message", "--enable=invalid-loop-start-index"),
+            ("lint, every message", "--enable=all"),
+        ):
+            command = [sys.executable, "-m", "robolint.run", f"--rcfile={rcfile}", enable, "--exit-zero", filepath]
+            seconds, _ = _best_seconds(command, args.repeat)
+            print(f"{label:>22}: best {seconds * 1000:6.0f} ms of {args.repeat}")  # allow-print
+
+
+if __name__ == "__main__":
+    main()
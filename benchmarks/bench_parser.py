@@ -0,0 +1,53 @@
+"""Compare parse time and memory of a large Method with `lxml`'s default parser versus `METHOD_XML_PARSER`.
+
+Each parser runs in a fresh interpreter, see `fresh_interpreter`.
+
+Usage: PYTHONPATH=src python benchmarks/bench_parser.py [--steps 10000] [--repeat 3]
+"""
+import argparse
+import time
+
+from fresh_interpreter import measure_each_in_fresh_interpreter
+from fresh_interpreter import peak_rss_mb
+from lxml.etree import parse
+from lxml.etree import XMLParser
+from robolint.utils import METHOD_XML_PARSER
+from synthetic_method import temporary_synthetic_method
+
+PARSERS = {"default": XMLParser(), "method": METHOD_XML_PARSER}
+
+
+def measure(parser_name: str, filepath: str, repeat: int) -> None:
+    """Print the best time to parse the Method with one of the parsers, and the memory it took."""
+    baseline_mb = peak_rss_mb()
+    parser = PARSERS[parser_name]
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        element_tree = parse(filepath, parser)
+        timings.append(time.perf_counter() - start)
+        del element_tree
+    print(  # allow-print
+        f"{parser_name:>8}: best {min(timings):5.2f} s of {repeat}, peak RSS +{peak_rss_mb() - baseline_mb:7.1f} MB"
+    )
+
+
+def main() -> None:
+    """Parse a synthetic Method with each parser, or with the parser to `--measure` only."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--steps", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--measure", choices=PARSERS, help=argparse.SUPPRESS)
+    parser.add_argument("--file", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        measure(args.measure, args.file, args.repeat)
+        return
+
+    with temporary_synthetic_method(args.steps) as filepath:
+        measure_each_in_fresh_interpreter(__file__, PARSERS, filepath, "--repeat", str(args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Compare matching motion profile names against a `regexp_csv` option one pattern at a time versus `RegexpCsvMatcher`.
+
+The names are drawn from a handful of distinct motion profiles, as in real Methods, most of which match none of the
+patterns (the worst case for trying each pattern in turn).
+
+Usage: PYTHONPATH=src python benchmarks/bench_regexp_csv.py [--steps 10000] [--patterns 5]
+"""
+import argparse
+import itertools
+import re
+import time
+from typing import Callable
+
+from robolint.utils import RegexpCsvMatcher
+
+PROFILE_NAMES = ("Tip Load", "Tip Load Slow", "Mid Speed", "Fast Aspirate", "Slow Dispense", "Default")
+
+
+def _best_of(function: Callable[[], int], repeats: int) -> tuple[float, int]:
+    best_seconds = float("inf")
+    matched = 0
+    for _ in range(repeats):
+        start = time.perf_counter()
+        matched = function()
+        best_seconds = min(best_seconds, time.perf_counter() - start)
+    return best_seconds, matched
+
+
+def main() -> None:
+    """Time matching the motion profile names one pattern at a time, then with `RegexpCsvMatcher`."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--steps", type=int, default=10000)
+    parser.add_argument("--patterns", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    patterns = [re.compile(f"Tip Load {index}.*") for index in range(args.patterns - 1)] + [re.compile("Tip Load.*")]
+    names = list(itertools.islice(itertools.cycle(PROFILE_NAMES), args.steps))
+
+    def one_pattern_at_a_time() -> int:
+        return sum(any(pattern.match(name) for pattern in patterns) for name in names)
+
+    def matcher() -> int:
+        regexp_csv_matcher = RegexpCsvMatcher(patterns)  # built once per run, when the checker is opened
+        return sum(regexp_csv_matcher.matches(name) for name in names)
+
+    for label, function in (("one pattern at a time", one_pattern_at_a_time), ("RegexpCsvMatcher", matcher)):
+        seconds, matched = _best_of(function, args.repeat)
+        print(  # allow-print
+            f"{label:>22}: best {seconds * 1000:7.2f} ms of {args.repeat}, {matched} of {args.steps} matched"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Compare the memory needed to hold every step of a large Method as `MM4Step`s, as compact `MM4StepRecord`s, and to
+stream them one at a time.
+
+Each mode runs in a fresh interpreter, see `fresh_interpreter`.
+
+Usage: PYTHONPATH=src python benchmarks/bench_step_memory.py [--steps 10000]
+"""
+import argparse
+import time
+
+from fresh_interpreter import measure_each_in_fresh_interpreter
+from fresh_interpreter import peak_rss_mb
+from robolint.utils import iterparse_steps
+from robolint.utils import parse_step_records
+from robolint.utils import parse_steps
+from synthetic_method import temporary_synthetic_method
+
+MODES = ("steps", "records", "streamed")
+
+
+def measure(mode: str, filepath: str) -> None:
+    """Print the memory taken to read every step of the Method in one of the modes, and the time it took."""
+    baseline_mb = peak_rss_mb()
+    start = time.perf_counter()
+    if mode == "steps":
+        steps = parse_steps(filepath)
+        for step in steps:
+            step.parameters  # pylint: disable=pointless-statement # decode the parameter cache that checkers would build
+        step_count = len(steps)
+    elif mode == "records":
+        step_count = len(parse_step_records(filepath))
+    else:
+        step_count = 0
+        for step in iterparse_steps(filepath):
+            step.parameters  # pylint: disable=pointless-statement # as above, but for the current step only
+            step_count += 1
+    elapsed = time.perf_counter() - start
+    print(  # allow-print
+        f"{mode:>8}: {step_count} steps read, peak RSS +{peak_rss_mb() - baseline_mb:7.1f} MB, {elapsed:5.2f} s"
+    )
+
+
+def main() -> None:
+    """Read the steps of a synthetic Method in each mode, or in the mode to `--measure` only."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--steps", type=int, default=10000)
+    parser.add_argument("--measure", choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument("--file", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        measure(args.measure, args.file)
+        return
+
+    with temporary_synthetic_method(args.steps) as filepath:
+        measure_each_in_fresh_interpreter(__file__, MODES, filepath)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Compare evaluating the checkers' XPaths as strings (compiled by `lxml` on every call) versus the registry.
+
+Times the XPath work `LabwareNameChecker` and `VariableNameChecker` do for a single file. The string variant uses the
+expressions as they were before the registry, including the EXSLT `re:match` for well volume variables.
+
+Usage: PYTHONPATH=src python benchmarks/bench_xpath.py [--steps 3000]
+"""
+import argparse
+import tempfile
+import time
+from typing import Callable
+from typing import cast
+
+from lxml.etree import _Element
+from robolint.checkers.variables import VariableNameChecker
+from robolint.utils import parse_xml_module_from_file
+from robolint.utils import XmlModule
+from robolint.xpaths import get_xpath
+from robolint.xpaths import LABWARE_NAME
+from robolint.xpaths import LABWARE_STACK_ELEMENT_NAME
+from robolint.xpaths import LABWARE_STACK_ELEMENT_PROPERTIES
+from robolint.xpaths import XPATH_NAMESPACES
+from synthetic_method import write_synthetic_method
+
+LEGACY_VARIABLE_XPATHS = VariableNameChecker.variable_xpaths[:-1] + [
+    r"Items/Item/Simple[re:match(@value, '^[A-Z]{1,2}\d{2}\.volumeVariable$')]/../Simple[2]"
+]
+
+
+def string_xpaths(xml_module: XmlModule) -> int:
+    """Count the nodes the XPaths find, passing them to `.xpath()` as strings."""
+    found = 0
+    for props_elem in cast(list[_Element], xml_module.tree.xpath(LABWARE_STACK_ELEMENT_PROPERTIES.path)):
+        found += len(cast(list[_Element], props_elem.xpath(LABWARE_NAME.path)))
+        found += len(cast(list[_Element], props_elem.xpath(LABWARE_STACK_ELEMENT_NAME.path)))
+    for step in xml_module.steps:
+        for xpath in LEGACY_VARIABLE_XPATHS:
+            found += len(cast(list[_Element], step.parameters_node.xpath(xpath, namespaces=dict(XPATH_NAMESPACES))))
+    return found
+
+
+def compiled_xpaths(xml_module: XmlModule) -> int:
+    """Count the nodes the XPaths find, evaluating the compiled XPaths of the registry."""
+    found = 0
+    for props_elem in cast(list[_Element], LABWARE_STACK_ELEMENT_PROPERTIES(xml_module.tree)):
+        found += len(cast(list[_Element], LABWARE_NAME(props_elem)))
+        found += len(cast(list[_Element], LABWARE_STACK_ELEMENT_NAME(props_elem)))
+    for step in xml_module.steps:
+        for xpath in VariableNameChecker.variable_xpaths:
+            found += len(cast(list[_Element], get_xpath(xpath)(step.parameters_node)))
+    return found
+
+
+def _best_of(function: Callable[[XmlModule], int], xml_module: XmlModule, repeats: int) -> tuple[float, int]:
+    best_seconds = float("inf")
+    found = 0
+    for _ in range(repeats):
+        start = time.perf_counter()
+        found = function(xml_module)
+        best_seconds = min(best_seconds, time.perf_counter() - start)
+    return best_seconds, found
+
+
+def main() -> None:
+    """Time the XPaths as strings and as compiled XPaths on a synthetic Method, checking they find the same nodes."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--steps", type=int, default=3000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        xml_module = parse_xml_module_from_file(write_synthetic_method(args.steps, directory))
+        for step in xml_module.steps:
+            step.parameters_node  # pylint: disable=pointless-statement # both variants share the same parsed steps
+        string_seconds, string_found = _best_of(string_xpaths, xml_module, args.repeats)
+        compiled_seconds, compiled_found = _best_of(compiled_xpaths, xml_module, args.repeats)
+    assert string_found == compiled_found
+    print(f"Synthetic Method: {args.steps} steps, {string_found} nodes matched")  # allow-print
+    print(f"  string XPaths: {string_seconds * 1000:8.1f} ms per file")  # allow-print
+    print(f"compiled XPaths: {compiled_seconds * 1000:8.1f} ms per file")  # allow-print
+    print(f"          saved: {(string_seconds - compiled_seconds) * 1000:8.1f} ms per file")  # allow-print
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+"""Measure each variant of a benchmark in a fresh interpreter, so that the peak resident set size of one does not hide
+the other.
+
+`lxml` allocates its tree outside of the Python heap, so the resident set size is measured rather than using
+`tracemalloc`.
+"""
+import resource
+import subprocess
+import sys
+from typing import Iterable
+
+
+def peak_rss_mb() -> float:
+    """Return the peak resident set size of this process so far, in MB."""
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        return peak_rss / 1e6  # bytes on macOS
+    return peak_rss / 1e3  # kilobytes on Linux
+
+
+def measure_each_in_fresh_interpreter(script: str, variants: Iterable[str], filepath: str, *args: str) -> None:
+    """Run `script --measure <variant> --file <filepath> [args]` for each variant, one interpreter after the other."""
+    for variant in variants:
+        subprocess.run([sys.executable, script, "--measure", variant, "--file", filepath, *args], check=True)
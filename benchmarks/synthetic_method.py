@@ -0,0 +1,166 @@
+"""Generate synthetic MM4 Methods of arbitrary size for benchmarking."""
+import contextlib
+import os
+import tempfile
+from typing import Iterator
+from xml.sax.saxutils import quoteattr
+
+from robolint.constants import ASPIRATE_VVP96_STEP_ID
+from robolint.constants import BEGIN_LOOP_STEP_ID
+from robolint.constants import COMMENT_STEPS_ID
+from robolint.constants import DISPENSE_VVP96_STEP_ID
+from robolint.constants import TIP_EJECT_STEP_ID
+from robolint.constants import TIP_LOAD_STEP_ID
+
+STRING_TYPE = "System.String, mscorlib"
+DOUBLE_TYPE = "System.Double, mscorlib"
+BOOLEAN_TYPE = "System.Boolean, mscorlib"
+INT32_TYPE = "System.Int32, mscorlib"
+UINT32_TYPE = "System.UInt32, mscorlib"
+
+Parameter = tuple[str, str, str]  # name, type, value
+
+
+def _liquid_handling_parameters(step_idx: int) -> list[Parameter]:
+    parameters: list[Parameter] = [
+        ("plate", STRING_TYPE, "96 Deep Well Corning 3960_01"),
+        ("plateVariable", STRING_TYPE, ""),
+        ("flowrateOrPressure", STRING_TYPE, "5ul-300ul"),
+        ("aspirateHeight", DOUBLE_TYPE, "2"),
+        ("dispenseHeight", DOUBLE_TYPE, "2"),
+        ("disposeTips", BOOLEAN_TYPE, "True"),
+    ]
+    for col_idx in range(12):
+        for row_idx in range(8):
+            well_name = f"{chr(65 + row_idx)}{str(col_idx + 1).zfill(2)}"
+            parameters.append((f"{well_name}.enable", BOOLEAN_TYPE, "True"))
+            if (step_idx + row_idx) % 5 == 0:
+                parameters.append((f"{well_name}.volume", DOUBLE_TYPE, "10"))
+            else:
+                parameters.append((f"{well_name}.volumeVariable", STRING_TYPE, "TransferVolume"))
+    return parameters
+
+
+def _step_template(step_idx: int) -> tuple[str, str, list[Parameter]]:
+    kind = step_idx % 6
+    if kind == 0:
+        return ASPIRATE_VVP96_STEP_ID, "Aspirate(VVP96)", _liquid_handling_parameters(step_idx)
+    if kind == 1:
+        return DISPENSE_VVP96_STEP_ID, "Dispense(VVP96)", _liquid_handling_parameters(step_idx)
+    if kind == 2:
+        return (
+            TIP_LOAD_STEP_ID,
+            "Load Tips",
+            [
+                ("plate", STRING_TYPE, "96 Tips Agilent 19477-022_01"),
+                ("motionProfileName", STRING_TYPE, "Tip Load Slow"),
+                ("tipLoadForce", DOUBLE_TYPE, "30"),
+            ],
+        )
+    if kind == 3:
+        return (
+            TIP_EJECT_STEP_ID,
+            "Eject Tips",
+            [
+                ("plate", STRING_TYPE, "Tip Waste_01"),
+                ("motionProfileName", STRING_TYPE, "Tip Eject Slow"),
+                ("height", UINT32_TYPE, "50"),
+            ],
+        )
+    if kind == 4:
+        return (
+            BEGIN_LOOP_STEP_ID,
+            "Begin Loop",
+            [
+                ("VariableName", STRING_TYPE, "LoopCounter_01"),
+                ("VariableValue", INT32_TYPE, "0"),
+                ("VariableValueVariable", STRING_TYPE, ""),
+            ],
+        )
+    return COMMENT_STEPS_ID, "Comment", [("Comment", STRING_TYPE, f"Transfer number {step_idx}")]
+
+
+def _iter_step_lines(step_idx: int) -> Iterator[str]:
+    command_id, command_name, parameters = _step_template(step_idx)
+    yield "        <Complex>"
+    yield "          <Properties>"
+    yield '            <Simple name="DeviceId" value="2776287b-aaeb-4fcc-9481-c994542e4ade" />'
+    yield f'            <Simple name="CommandId" value="{command_id}" />'
+    yield f'            <Simple name="CommandName" value="{command_name}" />'
+    yield '            <Simple name="Enabled" value="True" />'
+    yield '            <Dictionary name="Parameters">'
+    yield "              <Items>"
+    for name, type_name, value in parameters:
+        yield "                <Item>"
+        yield f"                  <Simple value={quoteattr(name)} />"
+        yield f"                  <Simple type={quoteattr(type_name)} value={quoteattr(value)} />"
+        yield "                </Item>"
+    yield "              </Items>"
+    yield "            </Dictionary>"
+    yield "          </Properties>"
+    yield "        </Complex>"
+
+
+def _iter_worktable_lines(labware_count: int) -> Iterator[str]:
+    yield '    <Collection name="WorktableResourceMaps">'
+    yield "      <Items>"
+    yield '        <Complex type="MethodManager.Core.Domain.MMWorktableResourceMap, MethodManager.Core">'
+    yield "          <Properties>"
+    yield '            <Collection name="ResourceStacks">'
+    yield "              <Items>"
+    for labware_idx in range(labware_count):
+        labware_name = "96 Deep Well Corning 3960" if labware_idx % 2 == 0 else "96 deep well corning"
+        yield "                <Complex>"
+        yield "                  <Properties>"
+        yield '                    <Collection name="LabwareStackElems">'
+        yield "                      <Items>"
+        yield "                        <Complex>"
+        yield "                          <Properties>"
+        yield f'                            <Simple name="Name" value="Plate_{labware_idx:02}" />'
+        yield f'                            <Simple name="LabwareName" value="{labware_name}" />'
+        yield "                          </Properties>"
+        yield "                        </Complex>"
+        yield "                      </Items>"
+        yield "                    </Collection>"
+        yield "                  </Properties>"
+        yield "                </Complex>"
+    yield "              </Items>"
+    yield "            </Collection>"
+    yield "          </Properties>"
+    yield "        </Complex>"
+    yield "      </Items>"
+    yield "    </Collection>"
+
+
+def iter_synthetic_method_lines(step_count: int, labware_count: int = 24) -> Iterator[str]:
+    """Generate the lines of a synthetic Method, repeating a handful of step types, with some invalid labware names."""
+    yield '<Complex name="Root" type="MethodManager.Data.Dto.MethodDto, MethodManager.Data">'
+    yield "  <Properties>"
+    yield '    <Collection name="Steps">'
+    yield "      <Items>"
+    for step_idx in range(step_count):
+        yield from _iter_step_lines(step_idx)
+    yield "      </Items>"
+    yield "    </Collection>"
+    yield from _iter_worktable_lines(labware_count)
+    yield "  </Properties>"
+    yield "</Complex>"
+
+
+def write_synthetic_method(step_count: int, directory: str, labware_count: int = 24) -> str:
+    """Write a synthetic Method to `directory` and return its path."""
+    filepath = os.path.join(directory, f"synthetic-{step_count}-steps.met")
+    with open(filepath, "w", encoding="utf-8") as method_file:
+        for line in iter_synthetic_method_lines(step_count, labware_count):
+            method_file.write(line)
+            method_file.write("\n")
+    return filepath
+
+
+@contextlib.contextmanager
+def temporary_synthetic_method(step_count: int) -> Iterator[str]:
+    """Write a synthetic Method to a temporary directory, print its size and give its path for the `with` block."""
+    with tempfile.TemporaryDirectory() as directory:
+        filepath = write_synthetic_method(step_count, directory)
+        print(f"Synthetic Method: {step_count} steps, {os.path.getsize(filepath) / 1e6:.1f} MB")  # allow-print
+        yield filepath
@@ -1,16 +1,54 @@
-"""RoboLint."""
-from . import utils
-from .checkers.base_checkers import StepChecker
-from .checkers.hardcoded_values import HardcodedValuesChecker
-from .checkers.looping import LoopIndexChecker
-from .checkers.robocase import RobocaseVariableNameChecker
-from .checkers.tip_checkers import TipEjectChecker
-from .checkers.tip_checkers import TipLoadChecker
-from .checkers.tip_checkers import TipWasteEjectHeightChecker
-from .exceptions import NoStepTypeIdError
-from .robolinter import RoboLinter
-from .utils import MM4Step
-from .utils import parse_steps
-from .utils import parse_steps_from_etree
-from .utils import parse_xml_module_from_file
-from .utils import XmlModule
+"""RoboLint.
+
+The names below are imported from their modules on first use, so the `robolint` console script only imports the
+checkers of the messages that are enabled.
+"""
+import importlib
+from typing import Any
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import utils
+    from .checkers.base_checkers import StepChecker
+    from .checkers.hardcoded_values import HardcodedValuesChecker
+    from .checkers.looping import LoopIndexChecker
+    from .checkers.parameter_rules import ParameterRulesChecker
+    from .checkers.robocase import RobocaseVariableNameChecker
+    from .checkers.tip_checkers import NoTipsLoadedChecker
+    from .checkers.tip_checkers import TipEjectChecker
+    from .checkers.tip_checkers import TipLoadChecker
+    from .checkers.tip_checkers import TipWasteEjectHeightChecker
+    from .exceptions import NoStepTypeIdError
+    from .robolinter import RoboLinter
+    from .utils import MM4Step
+    from .utils import parse_steps
+    from .utils import parse_steps_from_etree
+    from .utils import parse_xml_module_from_file
+    from .utils import XmlModule
+
+_MODULE_OF_NAME = {
+    "StepChecker": ".checkers.base_checkers",
+    "HardcodedValuesChecker": ".checkers.hardcoded_values",
+    "LoopIndexChecker": ".checkers.looping",
+    "ParameterRulesChecker": ".checkers.parameter_rules",
+    "RobocaseVariableNameChecker": ".checkers.robocase",
+    "NoTipsLoadedChecker": ".checkers.tip_checkers",
+    "TipEjectChecker": ".checkers.tip_checkers",
+    "TipLoadChecker": ".checkers.tip_checkers",
+    "TipWasteEjectHeightChecker": ".checkers.tip_checkers",
+    "NoStepTypeIdError": ".exceptions",
+    "RoboLinter": ".robolinter",
+    "MM4Step": ".utils",
+    "parse_steps": ".utils",
+    "parse_steps_from_etree": ".utils",
+    "parse_xml_module_from_file": ".utils",
+    "XmlModule": ".utils",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name == "utils":
+        return importlib.import_module(".utils", __name__)
+    if name not in _MODULE_OF_NAME:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(_MODULE_OF_NAME[name], __name__), name)
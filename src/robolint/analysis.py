@@ -0,0 +1,85 @@
+"""Analysis passes: data derived from a whole module that any checker can use.
+
+A pass is computed the first time it is requested for a module and the result is kept on the module, so every rule that
+needs the same data shares a single traversal.
+"""
+import functools
+from typing import Callable
+from typing import NamedTuple
+from typing import TypeVar
+
+from lxml.etree import _Element
+
+from .constants import BLOCK_DIRECTIVE_REGEX
+from .constants import COMMENT_STEPS_ID
+from .constants import DIRECTIVE_REGEX
+from .utils import MM4Step
+from .utils import XmlModule
+from .xpaths import LABWARE_NAME
+from .xpaths import LABWARE_STACK_ELEMENT_NAME
+from .xpaths import LABWARE_STACK_ELEMENT_PROPERTIES
+
+T = TypeVar("T")
+
+
+def analysis_pass(function: Callable[[XmlModule], T]) -> Callable[[XmlModule], T]:
+    """Make a function of a module an analysis pass, run at most once per module."""
+
+    @functools.wraps(function)
+    def run_once(node: XmlModule) -> T:
+        try:
+            return node.analyses[function]  # type: ignore[no-any-return]
+        except KeyError:
+            pass
+        result = function(node)
+        node.analyses[function] = result
+        return result
+
+    return run_once
+
+
+@analysis_pass
+def labware_stack_elements(node: XmlModule) -> list[tuple[str, str]]:
+    """The `(Name, LabwareName)` of every labware stack element in the worktable, in document order."""
+    props_elems: list[_Element] = LABWARE_STACK_ELEMENT_PROPERTIES(node.tree)  # type: ignore[assignment]
+    return [
+        (
+            LABWARE_STACK_ELEMENT_NAME(props_elem)[0].get("value", ""),  # type: ignore[index,union-attr]
+            LABWARE_NAME(props_elem)[0].get("value", ""),  # type: ignore[index,union-attr]
+        )
+        for props_elem in props_elems
+    ]
+
+
+class Directive(NamedTuple):
+    """A `# robolint: <action>=<rule names>` directive in a Comment step."""
+
+    step_index: int
+    action: str  # `disable` (the next step), `disable-block` or `enable-block`
+    rule_names: list[str]
+
+
+def _split_rule_names(rule_names: str) -> list[str]:
+    return [rule_name.strip() for rule_name in rule_names.split(",")]
+
+
+def get_step_directives(step: MM4Step) -> list[Directive]:
+    """The directives in a step, if it is a Comment with any."""
+    if step.step_type_id != COMMENT_STEPS_ID:
+        return []
+    comment = step.get_parameter("Comment")
+    if "robolint" not in comment:
+        return []
+    step_directives = []
+    match = DIRECTIVE_REGEX.search(comment)
+    if match is not None:
+        step_directives.append(Directive(step.step_index, "disable", _split_rule_names(match.group(1))))
+    for match in BLOCK_DIRECTIVE_REGEX.finditer(comment):
+        step_directives.append(Directive(step.step_index, match.group(1), _split_rule_names(match.group(2))))
+    return step_directives
+
+
+@analysis_pass
+def directives(node: XmlModule) -> list[Directive]:
+    """Every directive in the Method, in step order."""
+    return [directive for step in node.steps_of_types({COMMENT_STEPS_ID}) for directive in get_step_directives(step)]
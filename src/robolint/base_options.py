@@ -0,0 +1,74 @@
+"""Options for the `RoboLinter`, in addition to the ones `pylint` provides."""
+from pylint.typing import Options
+
+
+def make_robolint_options() -> Options:
+    """Return the options used in a `RoboLinter` class."""
+    return (
+        (
+            "stream-steps",
+            {
+                "default": False,
+                "type": "yn",
+                "metavar": "<y or n>",
+                "help": "Read the steps of each Method one at a time instead of building the whole document tree, so "
+                "memory use stays flat for very large Methods. Only used when every enabled checker is able to check "
+                "a step using only the data within that step.",
+            },
+        ),
+        (
+            "rule-profiles",
+            {
+                "default": "",
+                "type": "string",
+                "metavar": "<profiles>",
+                "help": "Named rule profiles to check in a single run, one per line as `<name>: [--enable=<msgs>] "
+                "[--disable=<msgs>] [--exit-zero]`. Each profile starts from the messages enabled by the rest of the "
+                "configuration and gets its own report. The exit code combines those of the profiles without "
+                "`--exit-zero`.",
+            },
+        ),
+        (
+            "fail-fast",
+            {
+                "default": False,
+                "type": "yn",
+                "metavar": "<y or n>",
+                "help": "Stop linting after the first Method with a message that makes the run fail. Methods that "
+                "failed when last linted are linted first, then the most recently modified ones. Which Methods failed "
+                "is only recorded when `persistent` is enabled.",
+            },
+        ),
+        (
+            "file-time-budget",
+            {
+                "default": 0,
+                "type": "float",
+                "metavar": "<seconds>",
+                "help": "Lint each Method in a worker process, reporting `file-budget-exceeded` instead of waiting for "
+                "it when it takes longer than this many seconds. 0 for no limit. Not enforced on Windows.",
+            },
+        ),
+        (
+            "file-memory-budget",
+            {
+                "default": 0,
+                "type": "int",
+                "metavar": "<MB>",
+                "help": "Lint each Method in a worker process, reporting `file-budget-exceeded` when it needs more than "
+                "this many more megabytes of memory. 0 for no limit. Only enforced on Linux.",
+            },
+        ),
+        (
+            "workspace-config",
+            {
+                "default": False,
+                "type": "yn",
+                "metavar": "<y or n>",
+                "help": "Lint each Method with the `robolintrc` (or `.robolintrc`) closest to it, in its directory or "
+                "the ones above it up to the directory of this configuration file, instead of with this one. Options "
+                "given on the command line apply to every `robolintrc`. The Methods of each `robolintrc` are linted "
+                "together in this run.",
+            },
+        ),
+    )
@@ -0,0 +1,144 @@
+"""Per-file time and memory budgets: lint a Method in a worker process that is stopped when it exceeds them.
+
+The worker is a fork of the linter, so it needs nothing to be pickled on the way in.  Where processes can't be forked
+(Windows), the budgets are not enforced.  The memory budget is enforced with an address space limit, which only Linux
+both enforces and lets the current size be measured for.
+"""
+import multiprocessing
+from multiprocessing.connection import Connection
+import os
+import signal
+import sys
+import traceback
+from typing import Any
+from typing import Callable
+from typing import Optional
+from typing import TypeVar
+
+from pylint.checkers import BaseChecker
+
+from .exceptions import WorkerCrashedError
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+T = TypeVar("T")
+
+CAN_FORK = "fork" in multiprocessing.get_all_start_methods()
+_STATM_PATH = "/proc/self/statm"
+# how a process dies when an allocation beyond its address space limit isn't a `MemoryError`, or the OOM killer stops it
+_OUT_OF_MEMORY_SIGNALS = frozenset(
+    getattr(signal, name) for name in ("SIGKILL", "SIGSEGV", "SIGBUS", "SIGABRT") if hasattr(signal, name)
+)
+
+# what a worker sends back: its result, why it exceeded its budget, or the traceback of its crash
+_RESULT = "result"
+_EXCEEDED_BUDGET = "exceeded budget"
+_CRASHED = "crashed"
+
+
+class _WorkerTraceback(Exception):
+    """The formatted traceback of an exception in a worker process, as the cause of the `WorkerCrashedError`."""
+
+
+def get_address_space_bytes() -> Optional[int]:
+    """Return the virtual memory size of this process, if it can be measured."""
+    try:
+        with open(_STATM_PATH, encoding="ascii") as statm_file:
+            return int(statm_file.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _limit_memory(memory_budget_mb: int) -> None:
+    """Limit the address space of this process to its current size plus the budget."""
+    address_space_bytes = get_address_space_bytes()
+    if resource is None or address_space_bytes is None:
+        return
+    limit = address_space_bytes + memory_budget_mb * 1024 * 1024
+    _, hard_limit = resource.getrlimit(resource.RLIMIT_AS)
+    if hard_limit != resource.RLIM_INFINITY:
+        limit = min(limit, hard_limit)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard_limit))
+
+
+def _run_in_worker(function: Callable[[], Any], memory_budget_mb: int, connection: Connection) -> None:
+    if memory_budget_mb:
+        _limit_memory(memory_budget_mb)
+    try:
+        connection.send((_RESULT, function()))
+    except MemoryError:
+        connection.send((_EXCEEDED_BUDGET, f"it used more than its memory budget of {memory_budget_mb} MB"))
+    except Exception:  # pylint: disable=broad-except # e.g. a result that can't be pickled, reported by the parent
+        connection.send((_CRASHED, traceback.format_exc()))
+    connection.close()
+
+
+def _describe_signal(signal_number: int) -> str:
+    try:
+        return f"signal {signal_number} ({signal.Signals(signal_number).name})"
+    except ValueError:
+        return f"signal {signal_number}"
+
+
+def run_within_budget(
+    function: Callable[[], T], time_budget_seconds: float, memory_budget_mb: int
+) -> tuple[Optional[T], Optional[str]]:
+    """Call a function in a forked worker process, stopping it if it exceeds the time or memory budget (0 for none).
+
+    Return what the function returned, or `None` and why the worker was stopped.  The result must be picklable.
+    Raise `WorkerCrashedError` if the worker failed for any other reason: an exception (whose traceback is the cause),
+    an exit without a result, or a signal that isn't how a process runs out of memory.
+    """
+    sys.stdout.flush()  # so the worker doesn't write out what this process has buffered
+    sys.stderr.flush()
+    receiving_connection, sending_connection = multiprocessing.Pipe(duplex=False)
+    worker = multiprocessing.get_context("fork").Process(
+        target=_run_in_worker, args=(function, memory_budget_mb, sending_connection), daemon=True
+    )
+    worker.start()
+    sending_connection.close()
+    outcome, value = None, None
+    try:
+        if not receiving_connection.poll(time_budget_seconds or None):
+            worker.kill()
+            return None, f"it took longer than its time budget of {time_budget_seconds:g} seconds"
+        try:
+            outcome, value = receiving_connection.recv()
+        except EOFError:
+            pass  # the worker died without sending anything, see below
+    finally:
+        worker.join()
+        receiving_connection.close()
+    if outcome == _RESULT:
+        return value, None
+    if outcome == _EXCEEDED_BUDGET:
+        return None, value
+    if outcome == _CRASHED:
+        raise WorkerCrashedError("it raised an exception") from _WorkerTraceback(value)
+    exit_code = worker.exitcode
+    if exit_code is not None and exit_code < 0:
+        signal_number = -exit_code
+        if memory_budget_mb and signal_number in _OUT_OF_MEMORY_SIGNALS:
+            return None, f"it was killed by {_describe_signal(signal_number)}, likely for exceeding its memory budget"
+        raise WorkerCrashedError(f"it was killed by {_describe_signal(signal_number)}")
+    raise WorkerCrashedError(f"it exited with code {exit_code} without a result")
+
+
+class BudgetChecker(BaseChecker):
+    """The message for a Method that exceeded its `file-time-budget` or `file-memory-budget`.
+
+    The linters report it themselves, this checker only defines it.
+    """
+
+    name = "file-budgets"
+    msgs = {
+        "F9012": (
+            "Linting this Method was stopped: %s.",
+            "file-budget-exceeded",
+            "Used when linting a Method takes longer than `file-time-budget` or uses more memory than "
+            "`file-memory-budget`.",
+        ),
+    }
@@ -3,6 +3,7 @@
 import abc
 from typing import Any
 from typing import Optional
+from typing import TypeVar
 
 from astroid import nodes
 from overrides import EnforceOverrides
@@ -11,16 +12,23 @@ from pylint.checkers import BaseRawFileChecker
 from pylint.interfaces import Confidence
 
 from ..exceptions import NoStepTypeIdError
+from ..flow import FlowAnalysis
+from ..flow import FlowWalker
 from ..robolinter import RoboLinter
 from ..utils import MM4Step
-from ..utils import parse_steps_from_etree
 from ..utils import XmlModule
 
+S = TypeVar("S")
+
 
 class StepChecker(BaseRawFileChecker, EnforceOverrides):
     """Checks individual steps."""
 
     step_type_id: Optional[set[str]] = None  # TODO (Eli 20230222): rename this to `step_type_ids`
+    step_type_msgs: dict[str, set[str]] = {}  # the messages each step type can produce, if they differ by step type
+    streamable: bool = True  # whether the checker only needs data from the current step, so steps can be streamed
+    flow_analyses: tuple[type[FlowAnalysis[Any]], ...] = ()  # the analyses whose states the checker reads
+    flow_walker: FlowWalker  # set by whatever walks the steps, see `flow_state`
     _current_step_index: int
 
     def __init__(self, linter: RoboLinter) -> None:
@@ -32,23 +40,61 @@ class StepChecker(BaseRawFileChecker, EnforceOverrides):
     def check_step(self, step: MM4Step) -> None:
         raise NotImplementedError()
 
+    def get_checked_step_type_ids(self) -> set[str]:
+        """Return the step types that can produce one of the enabled messages of this checker.
+
+        Empty if the checker is interested in every step.  This only narrows `step_type_id` when the checker declares
+        `step_type_msgs`, otherwise `pylint` already skips checkers whose messages are all disabled.
+        """
+        if not self.step_type_id or not self.step_type_msgs:
+            return self.step_type_id or set()
+        return {
+            step_type_id
+            for step_type_id in self.step_type_id
+            if any(self.linter.is_message_enabled(msgid) for msgid in self.step_type_msgs[step_type_id])
+        }
+
+    def has_steps_to_check(self) -> bool:
+        """Return whether a step could produce one of the enabled messages, so the checker needs to visit steps at all.
+
+        The linter asks this before it reads `step_type_id` to dispatch steps to the checker.
+        """
+        return not self.step_type_id or bool(self.get_checked_step_type_ids())
+
+    def open_module(self, node: XmlModule) -> None:
+        """Prepare to check the steps of a module, before the first of them is visited."""
+
+    def flow_state(self, analysis_class: type[FlowAnalysis[S]]) -> S:
+        """The state of one of the `flow_analyses` before the step being checked."""
+        return self.flow_walker.state(analysis_class)
+
     def visit_step(self, step: MM4Step) -> None:
         self._current_step_index = step.step_index
         self.check_step(step)
 
     @override(check_signature=False)  # this uses `XmlModule` instead of an `astroid` node
     def process_module(self, node: XmlModule) -> None:
-        """Process a module."""
-        steps = parse_steps_from_etree(node.tree.getroot())
+        """Process a module on its own.
+
+        `RoboLinter` doesn't call this, it walks the steps of a module once for all checkers with a `StepDispatcher`.
+        """
         if self.step_type_id is None:
             raise NotImplementedError(
                 "At this point, step type ID should never be none, it should have been set as a class attribute."
             )
 
-        for step in steps:
-            if self.step_type_id and step.step_type_id not in self.step_type_id:
-                continue
-            self.visit_step(step)
+        self.open_module(node)
+        self.flow_walker = FlowWalker(self.flow_analyses)
+        self.flow_walker.open_module()
+        flow_step_type_ids = self.flow_walker.step_type_ids
+        if not self.step_type_id or flow_step_type_ids is None:
+            walked_step_type_ids: set[str] = set()
+        else:
+            walked_step_type_ids = set(self.step_type_id).union(flow_step_type_ids)
+        for step in node.steps_of_types(walked_step_type_ids):
+            if not self.step_type_id or step.step_type_id in self.step_type_id:
+                self.visit_step(step)
+            self.flow_walker.advance(step)
 
     @override
     def add_message(
@@ -2,7 +2,6 @@
 
 from overrides import override
 from pylint.lint.pylinter import PyLinter
-from stdlib_utils import NoMatchingXmlElementError
 
 from .base_checkers import StepChecker
 from ..constants import ASPIRATE_VVP96_STEP_ID
@@ -10,6 +9,8 @@ from ..constants import DISPENSE_VVP96_STEP_ID
 from ..constants import MIX_VVP96_STEP_ID
 from ..utils import MM4Step
 
+WELL_NAMES = tuple(f"{chr(65+row_idx)}{str(col_idx+1).zfill(2)}" for col_idx in range(12) for row_idx in range(8))
+
 
 class HardcodedValuesChecker(StepChecker):
     """Checks aspirate steps for hardcoded values."""
@@ -35,6 +36,11 @@ class HardcodedValuesChecker(StepChecker):
     options = ()
 
     step_type_id = {ASPIRATE_VVP96_STEP_ID, DISPENSE_VVP96_STEP_ID, MIX_VVP96_STEP_ID}
+    step_type_msgs = {
+        ASPIRATE_VVP96_STEP_ID: {"hardcoded-aspirate-volume"},
+        DISPENSE_VVP96_STEP_ID: {"hardcoded-dispense-volume"},
+        MIX_VVP96_STEP_ID: {"hardcoded-mix-volume"},
+    }
 
     @override
     def check_step(self, step: MM4Step) -> None:
@@ -44,22 +50,12 @@ class HardcodedValuesChecker(StepChecker):
         if a well is disabled, it is removed from the XML.
         """
         bad_wells: list[str] = []
-        for col_idx in range(12):
-            for row_idx in range(8):
-                well_name = f"{chr(65+row_idx)}{str(col_idx+1).zfill(2)}"
-                try:
-                    step.get_parameter(f"{well_name}.volume")
-                except NoMatchingXmlElementError:
-                    continue
-
-                try:
-                    step.get_parameter(f"{well_name}.volumeVariable")
-                    continue
-                except NoMatchingXmlElementError:
-                    pass
-
-                hardcoded_volume = step.get_parameter(f"{well_name}.volume")
-                bad_wells.append(f"{well_name}: {hardcoded_volume} uL")
+        parameters = step.parameters
+        for well_name in WELL_NAMES:
+            hardcoded_volume = parameters.get(f"{well_name}.volume")
+            if hardcoded_volume is None or f"{well_name}.volumeVariable" in parameters:
+                continue
+            bad_wells.append(f"{well_name}: {hardcoded_volume} uL")
         if len(bad_wells) == 0:
             return
         message_name = "hardcoded-aspirate-volume"
@@ -1,19 +1,20 @@
 """Checker for lab-ware names."""
 import inspect
-import re
 
-from lxml.etree import _Element
 from overrides import override
 from pylint.lint.pylinter import PyLinter
-from stdlib_utils import NoMatchingXmlElementError
 
 from .base_checkers import StepChecker
+from ..analysis import labware_stack_elements
 from ..constants import ASPIRATE_VVP96_STEP_ID
 from ..constants import DISPENSE_VVP96_STEP_ID
 from ..constants import MIX_VVP96_STEP_ID
 from ..constants import MOVE_TO_PLATE_GRIPPER_STEP_ID
 from ..constants import MOVE_TO_PLATE_STEP_ID
 from ..constants import MULTI_DISPENSE_STEP
+from ..exceptions import RegexTimeoutError
+from ..regex_safety import find_risky_constructs
+from ..regex_safety import match_within_budget
 from ..utils import MM4Step
 from ..utils import XmlModule
 
@@ -55,6 +56,12 @@ class LabwareNameChecker(StepChecker):
             name,
             "Used to ensure that Labware naming meets the proscribed pattern.",
         ),
+        "W9013": (
+            "The 'labware-rgx' option may backtrack catastrophically: %s.",
+            "unsafe-labware-rgx",
+            "Used when the 'labware-rgx' pattern has a construct that can take exponential time on a labware name that "
+            "nearly matches, or when matching a labware name took longer than 'labware-rgx-timeout'.",
+        ),
     }
     options = (
         (
@@ -66,6 +73,16 @@ class LabwareNameChecker(StepChecker):
                 "help": "Regular expression for allowed labware names.",
             },
         ),
+        (
+            "labware-rgx-timeout",
+            {
+                "default": 1.0,
+                "type": "float",
+                "metavar": "<seconds>",
+                "help": "Longest time matching a single labware name against 'labware-rgx' may take before it is "
+                "given up and reported as unsafe-labware-rgx, 0 for no limit. Not enforced on Windows.",
+            },
+        ),
     )
 
     step_type_id = {
@@ -76,37 +93,44 @@ class LabwareNameChecker(StepChecker):
         MOVE_TO_PLATE_STEP_ID,
         MULTI_DISPENSE_STEP,
     }
+    streamable = False  # the labware names are defined in the worktable, outside of the steps
 
     def __init__(self, linter: PyLinter) -> None:
         super().__init__(linter)
         self._found_invalid_labware: dict[str, str] = {}  # `Name: LabwareName`
 
-    @override(check_signature=False)  # this uses `XmlModule` instead of an `astroid` node
-    def process_module(self, xml_module: XmlModule) -> None:  # pylint: disable=arguments-renamed
+    @override
+    def open(self) -> None:
+        risks = find_risky_constructs(self.linter.config.labware_rgx)
+        if risks:
+            # reported like `pylint`'s own messages about the configuration, before the first Method is checked
+            self.linter.set_current_module("Command line or configuration file")
+        for risk in risks:
+            self.linter.add_message("unsafe-labware-rgx", line=0, args=(risk,))
+
+    @override
+    def open_module(self, node: XmlModule) -> None:
         self._found_invalid_labware.clear()  # ensure no persistence between modules
-        props_xpath = (
-            "/Complex/Properties/Collection[@name='WorktableResourceMaps']/Items"
-            "/Complex/Properties/Collection[@name='ResourceStacks']/Items"
-            "/Complex/Properties/Collection[@name='LabwareStackElems']/Items"
-            "/Complex/Properties"
-        )
-        props_elems: list[_Element] = xml_module.tree.xpath(props_xpath)  # type: ignore[assignment]
-        for props_elem in props_elems:
-            labware = props_elem.xpath("./Simple[@name='LabwareName']")[0].get("value", "")  # type: ignore[index,union-attr]
-            name = props_elem.xpath("./Simple[@name='Name']")[0].get("value", "")  # type: ignore[index,union-attr]
-            pattern = self.linter.config.labware_rgx
-            if not re.match(pattern, labware):
+        pattern = self.linter.config.labware_rgx
+        timeout = self.linter.config.labware_rgx_timeout
+        for name, labware in labware_stack_elements(node):
+            try:
+                match = match_within_budget(pattern, labware, timeout)
+            except RegexTimeoutError:
+                # give up on this labware name rather than on the whole Method
+                self.linter.add_message(
+                    "unsafe-labware-rgx",
+                    line=0,
+                    args=(f"matching the labware name '{labware}' took longer than {timeout:g} seconds",),
+                )
+                continue
+            if not match:
                 self._found_invalid_labware[name] = labware
 
-        super().process_module(xml_module)
-
     @override
     def check_step(self, step: MM4Step) -> None:
-        try:
-            step.get_parameter("plateVariable")
+        if step.has_parameter("plateVariable"):
             return  # if the `labware` is specified by a variable, then this rule does not apply
-        except NoMatchingXmlElementError:
-            pass
         # there should always be a plate in an aspirate step
         plate = step.get_parameter("plate")
 
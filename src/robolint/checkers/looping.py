@@ -39,7 +39,7 @@ class LoopIndexChecker(StepChecker):
         if step.get_parameter("VariableValueVariable") != "":
             # if the loop start index is bound to a variable, don't check further
             return
-        actual_loop_start = int(step.get_parameter("VariableValue"))
+        actual_loop_start = step.get_number_parameter("VariableValue")
         expected_loop_start = self.linter.config.loop_start_index
         if actual_loop_start != expected_loop_start:
             self.add_message("invalid-loop-start-index", args=(actual_loop_start, expected_loop_start))
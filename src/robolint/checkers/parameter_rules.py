@@ -0,0 +1,227 @@
+"""Checker for the site-specific parameter rules declared in the `parameter-rules` option.
+
+Each rule is one line: `<name>: <step type ID> <parameter> <operator> <value> [if <parameter> <operator> <value>]`.
+The operators are `==` and `!=` (numeric when the value is a number), and `=~` and `!~` (the value is a regular
+expression matched at the start of the parameter, like the `regexp_csv` options).  A value with spaces is quoted, and
+backslashes are kept as they are. E.g.
+`waste-height: 6ba4bf72-4115-3e40-0495-ad84983cf2e8 height == 50 if plate =~ .*Waste.*`.
+
+The rules are compiled into predicates once, and evaluated for the steps of their types during the shared step walk.
+"""
+import re
+import shlex
+from typing import Callable
+from typing import NamedTuple
+from typing import Optional
+from typing import Union
+from uuid import UUID
+
+from overrides import override
+from pylint.lint.pylinter import PyLinter
+
+from .base_checkers import StepChecker
+from ..exceptions import InvalidParameterRuleError
+from ..utils import MM4Step
+
+
+StepPredicate = Callable[[MM4Step], bool]
+
+OPERATORS = ("==", "!=", "=~", "!~")
+
+
+class ParameterRule(NamedTuple):
+    """A compiled rule of the `parameter-rules` option."""
+
+    name: str
+    step_type_id: str
+    parameter_name: str
+    requirement: str  # e.g. `== 50`, for the message
+    is_satisfied: StepPredicate  # `True` when the parameter is absent, there's nothing to check
+    applies_to: Optional[StepPredicate]  # `False` when the parameter is absent
+
+
+def _parse_number(value: str) -> Optional[Union[int, float]]:
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def make_predicate(parameter_name: str, operator: str, value: str, if_absent: bool) -> StepPredicate:
+    """Compile a `<parameter> <operator> <value>` comparison into a predicate on steps."""
+    if operator in ("=~", "!~"):
+        pattern = re.compile(value)
+        matches = operator == "=~"
+
+        def matches_pattern(step: MM4Step) -> bool:
+            actual = step.parameters.get(parameter_name)
+            if actual is None:
+                return if_absent
+            return (pattern.match(actual) is not None) is matches
+
+        return matches_pattern
+    equals = operator == "=="
+    number = _parse_number(value)
+    if number is None:
+
+        def equals_string(step: MM4Step) -> bool:
+            actual = step.parameters.get(parameter_name)
+            if actual is None:
+                return if_absent
+            return (actual == value) is equals
+
+        return equals_string
+
+    def equals_number(step: MM4Step) -> bool:
+        if parameter_name not in step.parameters:
+            return if_absent
+        try:
+            actual = step.get_number_parameter(parameter_name)
+        except (TypeError, ValueError):  # e.g. a labware name, which isn't equal to any number
+            return not equals
+        return (actual == number) is equals
+
+    return equals_number
+
+
+def _parse_comparison(line: str, tokens: list[str]) -> tuple[str, str, str]:
+    if len(tokens) != 3 or tokens[1] not in OPERATORS:
+        raise InvalidParameterRuleError(line, f"expected '<parameter> <{'|'.join(OPERATORS)}> <value>'")
+    parameter_name, operator, value = tokens
+    if operator in ("=~", "!~"):
+        try:
+            re.compile(value)
+        except re.error as e:
+            raise InvalidParameterRuleError(line, f"invalid regular expression '{value}': {e}") from e
+    return parameter_name, operator, value
+
+
+def _split_rule(rule_text: str) -> list[str]:
+    r"""Split a rule like a shell would, but keep the backslashes that regular expressions need, e.g. `^\d+Waste`."""
+    lexer = shlex.shlex(rule_text, posix=True)
+    lexer.whitespace_split = True
+    lexer.commenters = ""
+    lexer.escape = ""
+    return list(lexer)
+
+
+def parse_parameter_rules(value: str) -> list[ParameterRule]:
+    """Parse and compile the `parameter-rules` option, one rule per line."""
+    rules: list[ParameterRule] = []
+    for line in value.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        name, separator, rule_text = line.partition(":")
+        name = name.strip()
+        if not separator or not name:
+            raise InvalidParameterRuleError(line, "expected '<name>: <step type ID> <parameter> <operator> <value>'")
+        if any(rule.name == name for rule in rules):
+            raise InvalidParameterRuleError(line, f"the rule '{name}' is defined more than once")
+        try:
+            tokens = _split_rule(rule_text)
+        except ValueError as e:
+            raise InvalidParameterRuleError(line, str(e)) from e
+        if not tokens:
+            raise InvalidParameterRuleError(line, "expected a step type ID")
+        step_type_id, *comparison = tokens
+        try:
+            UUID(step_type_id)
+        except ValueError as e:
+            raise InvalidParameterRuleError(line, f"the step type ID '{step_type_id}' is not a GUID") from e
+        condition: list[str] = []
+        if "if" in comparison:
+            if_index = comparison.index("if")
+            comparison, condition = comparison[:if_index], comparison[if_index + 1 :]
+        parameter_name, operator, expected = _parse_comparison(line, comparison)
+        applies_to = None
+        if condition:
+            applies_to = make_predicate(*_parse_comparison(line, condition), if_absent=False)
+        rules.append(
+            ParameterRule(
+                name,
+                step_type_id.lower(),  # MM4 writes the `CommandId` in lower case
+                parameter_name,
+                f"{operator} '{expected}'",
+                make_predicate(parameter_name, operator, expected, if_absent=True),
+                applies_to,
+            )
+        )
+    return rules
+
+
+class ParameterRulesChecker(StepChecker):
+    """Checks steps against the rules of the `parameter-rules` option."""
+
+    name = "invalid-parameter-value"
+    msgs = {
+        "C9010": (
+            "The parameter '%s' was '%s', rule '%s' requires %s.",
+            name,
+            "Identifies when a step parameter breaks one of the rules in the 'parameter-rules' configuration option.",
+        ),
+    }
+    options = (
+        (
+            "parameter-rules",
+            {
+                "default": "",
+                "type": "string",
+                "metavar": "<rules>",
+                "help": "Rules for step parameters, one per line: `<name>: <step type ID> <parameter> <operator> "
+                "<value> [if <parameter> <operator> <value>]`, where the operator is one of `==`, `!=`, `=~` or `!~`.",
+            },
+        ),
+    )
+
+    step_type_id: set[str] = set()  # set from the rules once they are compiled
+
+    def __init__(self, linter: PyLinter) -> None:
+        super().__init__(linter)
+        self._rules_value: Optional[str] = None
+        self._rules_by_step_type: dict[str, list[ParameterRule]] = {}
+
+    def compile_rules(self) -> None:
+        """Compile the rules of the current configuration, unless they already are."""
+        rules_value = self.linter.config.parameter_rules
+        if rules_value == self._rules_value:
+            return
+        try:
+            rules = parse_parameter_rules(rules_value)
+        except InvalidParameterRuleError as e:
+            self.linter._arg_parser.error(str(e))  # pylint: disable=protected-access
+        self._rules_by_step_type = {}
+        for rule in rules:
+            self._rules_by_step_type.setdefault(rule.step_type_id, []).append(rule)
+        self.step_type_id = set(self._rules_by_step_type)
+        self._rules_value = rules_value
+
+    @override
+    def has_steps_to_check(self) -> bool:
+        self.compile_rules()
+        return bool(self._rules_by_step_type)
+
+    @override
+    def open(self) -> None:
+        self.compile_rules()
+
+    @override
+    def check_step(self, step: MM4Step) -> None:
+        for rule in self._rules_by_step_type.get(step.step_type_id, ()):
+            if rule.applies_to is not None and not rule.applies_to(step):
+                continue
+            if not rule.is_satisfied(step):
+                actual = step.get_parameter(rule.parameter_name)
+                self.add_message(self.name, args=(rule.parameter_name, actual, rule.name, rule.requirement))
+
+
+def register(linter: PyLinter) -> None:
+    """Register the checker during initialization.
+
+    :param linter: The linter to register the checker to.
+    """
+    linter.register_checker(ParameterRulesChecker(linter))
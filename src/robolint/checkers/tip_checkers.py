@@ -1,25 +1,39 @@
 """Checker for issues with tips."""
-import re
-
 from overrides import override
 from pylint.lint.pylinter import PyLinter
 
 from .base_checkers import StepChecker
+from ..constants import ASPIRATE_VVP96_STEP_ID
+from ..constants import DISPENSE_VVP96_STEP_ID
+from ..constants import MIX_VVP96_STEP_ID
 from ..constants import TIP_EJECT_STEP_ID
 from ..constants import TIP_LOAD_STEP_ID
+from ..flow import TipAnalysis
 from ..utils import MM4Step
+from ..utils import RegexpCsvMatcher
+
+
+class MotionProfileChecker(StepChecker):
+    """Checks that a step's motion profile matches the patterns of the checker's option."""
+
+    option_name: str
 
+    def __init__(self, linter: PyLinter) -> None:
+        super().__init__(linter)
+        self._profile_matcher = RegexpCsvMatcher([])
 
-def check_tip_checker_step(checker: StepChecker, step: MM4Step, option_name: str) -> None:
-    option_name = re.sub(r"^(in)?valid-", "", option_name)
-    actual = step.get_parameter("motionProfileName")
-    patterns: list[re.Pattern[str]] = getattr(checker.linter.config, option_name.replace("-", "_"))
-    if patterns and not any(pattern.match(actual) for pattern in patterns):
-        patterns_str = ",".join(pattern.pattern for pattern in patterns)
-        checker.add_message(type(checker).name, args=(actual, patterns_str))
+    @override
+    def open(self) -> None:
+        self._profile_matcher = RegexpCsvMatcher(getattr(self.linter.config, self.option_name.replace("-", "_")))
+
+    @override
+    def check_step(self, step: MM4Step) -> None:
+        actual = step.get_parameter("motionProfileName")
+        if self._profile_matcher and not self._profile_matcher.matches(actual):
+            self.add_message(type(self).name, args=(actual, self._profile_matcher.patterns_str))
 
 
-class TipLoadChecker(StepChecker):
+class TipLoadChecker(MotionProfileChecker):
     """Checks that the Load Tips step has the Tip Load motion profile."""
 
     name = "invalid-tip-load-profile"
@@ -43,13 +57,10 @@ class TipLoadChecker(StepChecker):
     )
 
     step_type_id = {TIP_LOAD_STEP_ID}
-
-    @override
-    def check_step(self, step: MM4Step) -> None:
-        check_tip_checker_step(self, step, type(self).name)
+    option_name = "tip-load-profile"
 
 
-class TipEjectChecker(StepChecker):
+class TipEjectChecker(MotionProfileChecker):
     """Checks that the Eject Tips step has the Tip Eject motion profile."""
 
     name = "invalid-tip-eject-profile"
@@ -73,10 +84,7 @@ class TipEjectChecker(StepChecker):
     )
 
     step_type_id = {TIP_EJECT_STEP_ID}
-
-    @override
-    def check_step(self, step: MM4Step) -> None:
-        check_tip_checker_step(self, step, type(self).name)
+    option_name = "tip-eject-profile"
 
 
 class TipWasteEjectHeightChecker(StepChecker):
@@ -112,17 +120,48 @@ class TipWasteEjectHeightChecker(StepChecker):
 
     step_type_id = {TIP_EJECT_STEP_ID}
 
+    def __init__(self, linter: PyLinter) -> None:
+        super().__init__(linter)
+        self._waste_chute_matcher = RegexpCsvMatcher([])
+
+    @override
+    def open(self) -> None:
+        self._waste_chute_matcher = RegexpCsvMatcher(self.linter.config.tip_waste_chute_name)
+
     @override
     def check_step(self, step: MM4Step) -> None:
         plate = step.get_parameter("plate")
-        patterns: list[re.Pattern[str]] = getattr(self.linter.config, "tip_waste_chute_name")
-        if patterns and any(pattern.match(plate) for pattern in patterns):
-            height = int(step.get_parameter("height"))
+        if self._waste_chute_matcher and self._waste_chute_matcher.matches(plate):
+            height = step.get_number_parameter("height")
             expected_height = self.linter.config.tip_waste_eject_height
             if height != expected_height:
                 self.add_message("invalid-tip-waste-eject-height", args=(height, expected_height))
 
 
+class NoTipsLoadedChecker(StepChecker):
+    """Checks that tips are loaded for the steps that handle liquid."""
+
+    name = "no-tips-loaded"
+    msgs = {
+        "C9011": (
+            "No tips are loaded, they were ejected at step %s and not loaded again.",
+            name,
+            "Identifies when an aspirate, dispense or mix step follows an Eject Tips step without a Load Tips step in "
+            "between.",
+        ),
+    }
+    options = ()
+
+    step_type_id = {ASPIRATE_VVP96_STEP_ID, DISPENSE_VVP96_STEP_ID, MIX_VVP96_STEP_ID}
+    flow_analyses = (TipAnalysis,)
+
+    @override
+    def check_step(self, step: MM4Step) -> None:
+        tip_state = self.flow_state(TipAnalysis)
+        if tip_state.loaded is False:
+            self.add_message(type(self).name, args=(tip_state.eject_step_index,))
+
+
 def register(linter: PyLinter) -> None:
     """Register the checker during initialization.
 
@@ -131,3 +170,4 @@ def register(linter: PyLinter) -> None:
     linter.register_checker(TipLoadChecker(linter))
     linter.register_checker(TipEjectChecker(linter))
     linter.register_checker(TipWasteEjectHeightChecker(linter))
+    linter.register_checker(NoTipsLoadedChecker(linter))
@@ -8,6 +8,8 @@ from robolint.robolinter import RoboLinter
 
 from .base_checkers import StepChecker
 from ..utils import MM4Step
+from ..xpaths import get_xpath
+from ..xpaths import WELL_VOLUME_VARIABLE_XPATH
 
 
 class VariableNameChecker(StepChecker):
@@ -61,7 +63,7 @@ class VariableNameChecker(StepChecker):
         r"Items/Item/Simple[@value='ValueVariable']/../Simple[2]",
         r"Items/Item/Simple[@value='AssignToVariable']/../Simple[2]",
         r"Items/Item/Simple[@value='plateVariable']/../Simple[2]",
-        r"Items/Item/Simple[re:match(@value, '^[A-Z]{1,2}\d{2}\.volumeVariable$')]/../Simple[2]",
+        WELL_VOLUME_VARIABLE_XPATH,
     ]
 
     def __init__(self, linter: RoboLinter) -> None:
@@ -103,7 +105,7 @@ class VariableNameChecker(StepChecker):
 
         self._variables_observed_in_step = set()
         for xpath in type(self).variable_xpaths:
-            for node in step.parameters_node.xpath(xpath, namespaces={"re": "http://exslt.org/regular-expressions"}):  # type: ignore[union-attr]
+            for node in get_xpath(xpath)(step.parameters_node):  # type: ignore[union-attr]
                 name = node.get("value", default="")  # type: ignore[union-attr]
                 self.variables_observed.add(name)
                 self._run_checks(name)
@@ -0,0 +1,151 @@
+"""Cache the options of a configuration file as they were resolved, so later runs load them in one step.
+
+Parsing a robolintrc through `argparse` transforms every option value, compiling the regular expression ones, and
+enables or disables messages one at a time, each time rebuilding the `enable` and `disable` options from the state of
+every message.  The result only depends on the options of the file, the messages and options registered before it is
+parsed, the state of those messages, and the source of `robolint` and the versions of the other plugins loaded, so it is
+kept in `PYLINT_HOME`, keyed by a hash of those, when `persistent` is on.
+"""
+import argparse
+import functools
+import hashlib
+import json
+import os
+import pickle
+import sys
+from typing import Any
+from typing import Iterator
+from typing import NamedTuple
+from typing import Optional
+from typing import Sequence
+
+import pylint
+from pylint.config.callback_actions import _CallbackAction
+from pylint.config.callback_actions import _DoNothingAction
+from pylint.config.callback_actions import _OutputFormatAction
+from pylint.config.callback_actions import _XableAction
+from pylint.constants import PYLINT_HOME
+from pylint.message import MessageDefinitionStore
+
+from .plugins import get_plugin_versions
+
+CONFIG_CACHE_PATH = os.path.join(PYLINT_HOME, "robolint-config-cache.pickle")
+MAX_CACHED_CONFIGS = 8
+
+# the callback options whose effect is cached (`enable` and `disable`, in the state of the messages) or replayed
+CACHEABLE_CALLBACK_ACTIONS = (_XableAction, _DoNothingAction, _OutputFormatAction)
+
+
+class CachedConfig(NamedTuple):
+    """The options and message state resolved from a configuration file."""
+
+    options: dict[str, Any]
+    msgs_state: dict[str, bool]
+    stashed_messages: list[tuple[str, list[tuple[Optional[str], str]]]]  # symbol and arguments, as `pylint` stashes
+    unrecognized_options: list[str]
+
+
+def _iter_options(arguments: Sequence[str]) -> Iterator[tuple[str, str]]:
+    """Iterate over the options of a configuration file, which `pylint` gives as `--<option>` and value pairs."""
+    return zip(arguments[::2], arguments[1::2])
+
+
+@functools.lru_cache(maxsize=None)
+def get_robolint_source_hash() -> str:
+    """Return a hash of the source of `robolint`, which changes with every upgrade even though its version doesn't."""
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    source_hash = hashlib.sha256()
+    for dirpath, dirnames, filenames in os.walk(package_dir):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            if filename.endswith(".py"):
+                filepath = os.path.join(dirpath, filename)
+                source_hash.update(os.path.relpath(filepath, package_dir).encode("utf-8"))
+                with open(filepath, "rb") as source_file:
+                    source_hash.update(source_file.read())
+    return source_hash.hexdigest()
+
+
+def get_config_cache_key(
+    arguments: Sequence[str],
+    arg_parser: argparse.ArgumentParser,
+    msgs_store: MessageDefinitionStore,
+    msgs_state: dict[str, bool],
+    engine_name: str,
+    plugin_modnames: Sequence[str],
+) -> Optional[str]:
+    """Return the key of the options of a configuration file, or `None` if they can't be cached.
+
+    They can't be when an option runs a command, such as `--list-msgs`, or a plugin without a version is loaded.  The
+    key covers the messages and option defaults registered so far and the state of the messages before the file is
+    parsed, since the cached message state replaces the whole state when it is loaded.
+    """
+    for option_string, _ in _iter_options(arguments):
+        action = arg_parser._option_string_actions.get(option_string)  # pylint: disable=protected-access
+        if isinstance(action, _CallbackAction) and not isinstance(action, CACHEABLE_CALLBACK_ACTIONS):
+            return None
+    plugin_versions = get_plugin_versions()
+    versions: dict[str, str] = {}
+    for modname in sorted(plugin_modnames):
+        if modname.startswith("pylint."):
+            versions[modname] = pylint.__version__
+        elif modname.startswith("robolint."):
+            versions[modname] = "source"  # covered by the hash of the source of `robolint`
+        elif modname in plugin_versions:
+            versions[modname] = plugin_versions[modname]
+        else:
+            return None
+    messages = sorted((message.msgid, message.symbol) for message in msgs_store.messages)
+    actions = arg_parser._actions  # pylint: disable=protected-access
+    option_defaults = sorted((action.dest, repr(action.default)) for action in actions)
+    key_data = [
+        list(arguments),
+        engine_name,
+        versions,
+        messages,
+        option_defaults,
+        sorted(msgs_state.items()),
+        get_robolint_source_hash(),
+        pylint.__version__,
+        sys.version,
+    ]
+    return hashlib.sha256(json.dumps(key_data).encode("utf-8")).hexdigest()
+
+
+def _load_cached_configs() -> dict[str, CachedConfig]:
+    try:
+        with open(CONFIG_CACHE_PATH, "rb") as cache_file:
+            cached_configs = pickle.load(cache_file)
+    except Exception:  # pylint: disable=broad-except # a missing, corrupt or outdated cache is just not used
+        return {}
+    return cached_configs if isinstance(cached_configs, dict) else {}
+
+
+def load_cached_config(key: str) -> Optional[CachedConfig]:
+    """Return the cached options and message state of a configuration file, if any."""
+    return _load_cached_configs().get(key)
+
+
+def save_cached_config(key: str, cached_config: CachedConfig) -> None:
+    """Cache the options and message state of a configuration file, keeping the most recently saved ones."""
+    cached_configs = _load_cached_configs()
+    cached_configs.pop(key, None)
+    cached_configs[key] = cached_config
+    cached_configs = dict(list(cached_configs.items())[-MAX_CACHED_CONFIGS:])
+    try:
+        data = pickle.dumps(cached_configs)
+        os.makedirs(os.path.dirname(CONFIG_CACHE_PATH), exist_ok=True)
+        with open(CONFIG_CACHE_PATH, "wb") as cache_file:
+            cache_file.write(data)
+    except (OSError, pickle.PicklingError, TypeError, AttributeError) as e:
+        print(f"Unable to cache the configuration in {CONFIG_CACHE_PATH}: {e}", file=sys.stderr)  # allow-print
+
+
+def replay_callback_options(
+    arguments: Sequence[str], arg_parser: argparse.ArgumentParser, namespace: argparse.Namespace
+) -> None:
+    """Run the callbacks of the options whose effect isn't cached, such as `output-format` loading the reporters."""
+    for option_string, value in _iter_options(arguments):
+        action = arg_parser._option_string_actions.get(option_string)  # pylint: disable=protected-access
+        if isinstance(action, _OutputFormatAction):
+            action(arg_parser, namespace, [value], option_string)
@@ -10,6 +10,9 @@ MOVE_TO_PLATE_STEP_ID = "4e41a614-7111-d08c-2f7e-6ba429023c36"
 MULTI_DISPENSE_STEP = "979b25d3-8b26-8739-ce3a-f58aa12bb7ad"
 COMMENT_STEPS_ID = "b373a8f8-2f99-4c10-aece-1b9a9273f5f1"
 BEGIN_LOOP_STEP_ID = "565c02ef-0d8e-40bd-8906-4cc50e02fcb7"
+END_LOOP_STEP_ID = "a56d7718-7464-4af5-b9f7-3b50cbcefee0"  # "Loop Until"
+IF_STEP_ID = "e4119c3d-b767-4700-b7a3-968fa667c2fd"
+END_IF_STEP_ID = "b5c4e057-0ae6-4466-a5cf-a770d7ca736d"
 TIP_EJECT_STEP_ID = "6ba4bf72-4115-3e40-0495-ad84983cf2e8"
 TIP_LOAD_STEP_ID = "1d04aba5-dc42-e044-e57e-311ff530b30f"
 
@@ -20,3 +23,11 @@ DIRECTIVE_REGEX = re.compile(
     """,
     re.VERBOSE,
 )
+BLOCK_DIRECTIVE_REGEX = re.compile(
+    r"""    \#[ ]*robolint[ ]*\:                  # initial pragma
+            [ ]*(disable-block|enable-block)    # block directive
+            [ ]*=[ ]*                           #
+            ([a-z\-]+([ ]*\,[ ]*[a-z\-]+)*)     # names of rules to disable or enable
+    """,
+    re.VERBOSE,
+)
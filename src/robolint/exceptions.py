@@ -4,3 +4,23 @@
 class NoStepTypeIdError(AttributeError):
     def __init__(self, class_name: str) -> None:
         super().__init__(f"The step type ID has not been defined as a class attribute for {class_name}")
+
+
+class InvalidRuleProfileError(ValueError):
+    def __init__(self, profile: str, reason: str) -> None:
+        super().__init__(f"Invalid rule profile '{profile}': {reason}")
+
+
+class InvalidParameterRuleError(ValueError):
+    def __init__(self, rule: str, reason: str) -> None:
+        super().__init__(f"Invalid parameter rule '{rule}': {reason}")
+
+
+class RegexTimeoutError(TimeoutError):
+    def __init__(self, pattern: str, seconds: float) -> None:
+        super().__init__(f"Matching '{pattern}' took longer than {seconds:g} seconds")
+
+
+class WorkerCrashedError(RuntimeError):
+    def __init__(self, reason: str) -> None:
+        super().__init__(f"Linting in a worker process crashed: {reason}")
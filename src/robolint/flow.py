@@ -0,0 +1,155 @@
+"""Flow analyses: state carried forward along the steps of a Method, for rules that depend on the order of steps.
+
+Each analysis folds the steps of the types it is interested in into a state, such as whether tips are loaded.  A
+`FlowWalker` advances the states of every analysis the checkers need during the same single walk over the steps that
+dispatches them to the checkers, so no rule rescans the Method to find out what happened before the current step.
+"""
+import abc
+from typing import Any
+from typing import Generic
+from typing import Iterable
+from typing import NamedTuple
+from typing import Optional
+from typing import TypeVar
+
+from .constants import BEGIN_LOOP_STEP_ID
+from .constants import END_IF_STEP_ID
+from .constants import END_LOOP_STEP_ID
+from .constants import IF_STEP_ID
+from .constants import TIP_EJECT_STEP_ID
+from .constants import TIP_LOAD_STEP_ID
+from .utils import MM4Step
+
+S = TypeVar("S")
+
+
+class FlowAnalysis(abc.ABC, Generic[S]):
+    """A forward analysis over the steps of a Method, in Method order."""
+
+    step_type_ids: frozenset[str] = frozenset()  # the step types that change the state, empty for every step
+
+    @abc.abstractmethod
+    def initial_state(self) -> S:
+        """Return the state before the first step of a Method."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def transfer(self, state: S, step: MM4Step) -> S:
+        """Return the state after the step.  The state may be updated in place, it only ever moves forward."""
+        raise NotImplementedError()
+
+
+class FlowWalker:
+    """Carry the states of several flow analyses along a single walk over the steps of a Method.
+
+    Each analysis class is run once, however many checkers need it.
+    """
+
+    def __init__(self, analysis_classes: Iterable[type[FlowAnalysis[Any]]]) -> None:
+        self.analyses: dict[type[FlowAnalysis[Any]], FlowAnalysis[Any]] = {
+            analysis_class: analysis_class() for analysis_class in analysis_classes
+        }
+        self._every_step_analyses = [analysis for analysis in self.analyses.values() if not analysis.step_type_ids]
+        self._analyses_by_step_type = {
+            step_type_id: [
+                analysis
+                for analysis in self.analyses.values()
+                if not analysis.step_type_ids or step_type_id in analysis.step_type_ids
+            ]
+            for analysis in self.analyses.values()
+            for step_type_id in analysis.step_type_ids
+        }
+        self._states: dict[type[FlowAnalysis[Any]], Any] = {}
+
+    @property
+    def step_type_ids(self) -> Optional[set[str]]:
+        """The step types that change any of the states, or `None` if every step can."""
+        if self._every_step_analyses:
+            return None
+        return set(self._analyses_by_step_type)
+
+    def open_module(self) -> None:
+        self._states = {analysis_class: analysis.initial_state() for analysis_class, analysis in self.analyses.items()}
+
+    def advance(self, step: MM4Step) -> None:
+        """Move the states past the step."""
+        for analysis in self._analyses_by_step_type.get(step.step_type_id, self._every_step_analyses):
+            analysis_class = type(analysis)
+            self._states[analysis_class] = analysis.transfer(self._states[analysis_class], step)
+
+    def state(self, analysis_class: type[FlowAnalysis[S]]) -> S:
+        """The state of an analysis before the current step."""
+        return self._states[analysis_class]  # type: ignore[no-any-return]
+
+
+class TipState(NamedTuple):
+    """Whether tips are loaded: `None` when unknown, as at the start of a Method that may be called with tips loaded."""
+
+    loaded: Optional[bool]
+    eject_step_index: Optional[int]  # the step that last ejected the tips, if they are known to be ejected
+    loaded_at_if: tuple[Optional[bool], ...]  # whether tips were loaded at each enclosing If step
+
+
+class TipAnalysis(FlowAnalysis[TipState]):
+    """Track whether tips are loaded, from the Load Tips and Eject Tips steps.
+
+    Steps are followed in order, so a branch only changes the state when the tips are loaded (or not) the same way
+    whether or not it is taken: at the End If step, a state different from the one at the If step becomes unknown.
+    """
+
+    step_type_ids = frozenset({TIP_LOAD_STEP_ID, TIP_EJECT_STEP_ID, IF_STEP_ID, END_IF_STEP_ID})
+
+    def initial_state(self) -> TipState:
+        return TipState(None, None, ())
+
+    def transfer(self, state: TipState, step: MM4Step) -> TipState:
+        if step.step_type_id == TIP_LOAD_STEP_ID:
+            return state._replace(loaded=True, eject_step_index=None)
+        if step.step_type_id == TIP_EJECT_STEP_ID:
+            return state._replace(loaded=False, eject_step_index=step.step_index)
+        if step.step_type_id == IF_STEP_ID:
+            return state._replace(loaded_at_if=(*state.loaded_at_if, state.loaded))
+        if not state.loaded_at_if:
+            return state  # an unbalanced End If
+        *loaded_at_if, loaded_at_start = state.loaded_at_if
+        if state.loaded != loaded_at_start:
+            return TipState(None, None, tuple(loaded_at_if))
+        return state._replace(loaded_at_if=tuple(loaded_at_if))
+
+
+class LoopAnalysis(FlowAnalysis[tuple[int, ...]]):
+    """Track the loops enclosing each step, as the step indices of their Begin Loop steps, outermost first."""
+
+    step_type_ids = frozenset({BEGIN_LOOP_STEP_ID, END_LOOP_STEP_ID})
+
+    def initial_state(self) -> tuple[int, ...]:
+        return ()
+
+    def transfer(self, state: tuple[int, ...], step: MM4Step) -> tuple[int, ...]:
+        if step.step_type_id == BEGIN_LOOP_STEP_ID:
+            return (*state, step.step_index)
+        return state[:-1]
+
+
+ASSIGNING_PARAMETER_NAMES = ("AssignToVariable",)  # If and Loop Until steps only read their `VariableName`
+
+
+class AssignedVariablesAnalysis(FlowAnalysis[set[str]]):
+    """Track the names of the variables assigned by the steps so far, such as loop counters and Expression results.
+
+    The set is updated in place, so checkers that need it at a given step copy it.
+    """
+
+    def initial_state(self) -> set[str]:
+        return set()
+
+    def transfer(self, state: set[str], step: MM4Step) -> set[str]:
+        parameters = step.parameters
+        parameter_names: tuple[str, ...] = ASSIGNING_PARAMETER_NAMES
+        if step.step_type_id == BEGIN_LOOP_STEP_ID:
+            parameter_names = (*parameter_names, "VariableName")  # the loop counter
+        for parameter_name in parameter_names:
+            variable_name = parameters.get(parameter_name)
+            if variable_name:
+                state.add(variable_name)
+        return state
@@ -0,0 +1,436 @@
+"""A lightweight engine for `robolint --engine=native`, which lints Methods without `PyLinter`.
+
+`PyLinter` sets up everything needed to lint Python on every run: the ~50 default checkers, module expansion, `astroid`
+and an AST walker.  Linting Methods needs none of it, so `NativeLinter` only registers the checkers loaded as plugins,
+keeps its own message state and reports through `pylint`'s reporters, so that its output is the same as `RoboLinter`'s.
+"""
+import collections
+import contextlib
+import os
+import sys
+from typing import Any
+from typing import cast
+from typing import Optional
+from typing import Sequence
+from xml.etree.ElementTree import ParseError
+
+import astroid
+from astroid import nodes
+from lxml.etree import XMLSyntaxError
+from pylint import checkers
+from pylint import config
+from pylint import exceptions
+from pylint import interfaces
+from pylint import reporters
+from pylint.config.arguments_manager import _ArgumentsManager
+from pylint.config.config_initialization import _config_initialization
+from pylint.config.exceptions import _UnrecognizedOptionError
+from pylint.config.exceptions import ArgumentPreprocessingError
+from pylint.config.utils import _preprocess_options
+from pylint.constants import MAIN_CHECKER_NAME
+from pylint.constants import MSG_TYPES
+from pylint.constants import MSG_TYPES_STATUS
+from pylint.interfaces import HIGH
+from pylint.lint.base_options import _make_linter_options
+from pylint.lint.base_options import _make_run_options
+import pylint.lint.pylinter
+from pylint.lint.pylinter import MSGS
+from pylint.lint.pylinter import PyLinter
+from pylint.lint.run import Run
+from pylint.lint.utils import get_fatal_error_message
+from pylint.message import Message
+from pylint.message import MessageDefinition
+from pylint.message import MessageDefinitionStore
+from pylint.reporters.text import TextReporter
+from pylint.typing import MessageLocationTuple
+from pylint.typing import Options
+from pylint.utils import FileState
+from pylint.utils import LinterStats
+
+from .base_options import make_robolint_options
+from .budgets import BudgetChecker
+from .profiles import ProfilesReporter
+from .robolinter import StepDispatcher
+from .robolinter import XmlModuleLinter
+
+
+class NativeLinter(  # pylint: disable=too-many-instance-attributes # the state `PyLinter` keeps too
+    _ArgumentsManager, XmlModuleLinter, checkers.BaseChecker
+):
+    """Lint Methods with the robolint checkers, without any of the Python linting machinery of `PyLinter`.
+
+    It accepts the same options as `RoboLinter`, except for those of `pylint`'s own Python checkers, which are never
+    loaded, and the run options that `NativeRun` doesn't support.
+    """
+
+    name = MAIN_CHECKER_NAME
+    msgs = MSGS
+    crash_file_path: str = "pylint-crash-%Y-%m-%d-%H-%M-%S.txt"
+
+    def __init__(
+        self,
+        reporter: Optional[reporters.BaseReporter] = None,
+        config_file: Optional[str] = None,
+        run_options: Options = (),
+    ) -> None:
+        linter = cast(PyLinter, self)  # checkers, reporters and options only need the part of `PyLinter` below
+        _ArgumentsManager.__init__(self, prog="robolint")
+        XmlModuleLinter.__init__(self, linter)  # type: ignore[call-arg] # mypy only sees `object` past untyped `pylint`
+        self._reporters: dict[str, type[reporters.BaseReporter]] = {}
+        self.set_reporter(reporter or TextReporter())
+        self._checkers: collections.defaultdict[str, list[checkers.BaseChecker]] = collections.defaultdict(list)
+        self._dynamic_plugins: dict[str, Any] = {}
+        self._deferred_plugins = {}
+        self._command_line_plugins: list[str] = []
+        self._command_line_option_arguments: list[str] = []
+        self.config_file = config_file
+        self.stats = LinterStats()
+        self._run_options = run_options
+        self._error_mode = False
+        self.options = run_options + _make_linter_options(linter) + make_robolint_options()
+        self.fail_on_symbols: list[str] = []
+        checkers.BaseChecker.__init__(self, linter)
+        self.msgs_store = MessageDefinitionStore(self.config.py_version)
+        self.msg_status = 0
+        self._by_id_managed_msgs: list[Any] = []
+        self.file_state = FileState("", self.msgs_store, is_base_filestate=True)
+        self.current_name: Optional[str] = None
+        self.current_file: Optional[str] = None
+        self._ignore_file = False
+        self._stream_steps = False
+        self._prefilter_step_type_ids: Optional[frozenset[str]] = None
+        self._step_dispatcher = StepDispatcher([])
+        self._disabled_intervals = {}
+        self.register_checker(self)
+        self.register_checker(BudgetChecker(linter))
+        reporters.initialize(linter)
+
+    # plugins, checkers and reporters
+
+    def import_plugin_modules(self, modnames: list[str]) -> None:
+        for modname in modnames:
+            if modname in self._dynamic_plugins:
+                continue
+            try:
+                module = astroid.modutils.load_module_from_name(modname)
+                module.register(self)
+                self._dynamic_plugins[modname] = module
+            except ModuleNotFoundError as e:
+                self._dynamic_plugins[modname] = e
+
+    def make_workspace_linter(self, config_file: str) -> "NativeLinter":
+        """Return a new `NativeLinter` set up the way `NativeRun` sets up the linter of the run."""
+        linter = NativeLinter(config_file=config_file, run_options=self._run_options)
+        linter.load_plugin_modules(self._command_line_plugins)
+        linter.disable("I")
+        linter._error_mode = self._error_mode  # pylint: disable=protected-access # `--errors-only` sets it on the run's
+        return linter
+
+    def load_plugin_configuration(self) -> None:
+        for modname, module_or_error in self._dynamic_plugins.items():
+            if isinstance(module_or_error, ModuleNotFoundError):
+                self.add_message("bad-plugin-value", args=(modname, module_or_error), line=0)
+            elif hasattr(module_or_error, "load_configuration"):
+                module_or_error.load_configuration(self)
+
+    def register_checker(self, checker: checkers.BaseChecker) -> None:
+        self._checkers[checker.name].append(checker)
+        self.msgs_store.register_messages_from_checker(checker)
+        for message in checker.messages:
+            if not message.default_enabled:
+                self.disable(message.msgid)
+        if not getattr(checker, "enabled", True):
+            self.disable(checker.name)
+
+    def get_checkers(self) -> list[checkers.BaseChecker]:
+        """Return all registered checkers, in the same order as `PyLinter` so messages are emitted in the same order."""
+        return sorted(checker for name_checkers in self._checkers.values() for checker in name_checkers)
+
+    def prepare_checkers(self) -> list[checkers.BaseChecker]:
+        """Return the checkers with any enabled message, and decide how Methods need to be read."""
+        needed_checkers: list[checkers.BaseChecker] = [self]
+        for checker in self.get_checkers()[1:]:
+            if any(self.is_message_enabled(msgid) for msgid in checker.msgs):
+                needed_checkers.append(checker)
+        self.set_needed_checkers(needed_checkers)
+        return needed_checkers
+
+    def register_reporter(self, reporter_class: type[reporters.BaseReporter]) -> None:
+        self._reporters[reporter_class.name] = reporter_class
+
+    def set_reporter(self, reporter: reporters.BaseReporter) -> None:
+        self.reporter = reporter
+        reporter.linter = cast(PyLinter, self)
+
+    def _load_reporters(self, reporter_names: str) -> None:
+        """Load the reporters of `--output-format`, each optionally followed by `:<output file>`."""
+        sub_reporters = []
+        output_files = []
+        with contextlib.ExitStack() as stack:
+            for reporter_name in reporter_names.split(","):
+                reporter_name, *reporter_output = reporter_name.split(":", 1)
+                reporter = self._load_reporter_by_name(reporter_name)
+                sub_reporters.append(reporter)
+                if reporter_output:
+                    output_file = stack.enter_context(open(reporter_output[0], "w", encoding="utf-8"))
+                    reporter.out = output_file
+                    output_files.append(output_file)
+            close_output_files = stack.pop_all().close  # keep the output files open until the reporter is closed
+        if len(sub_reporters) > 1 or output_files:
+            self.set_reporter(reporters.MultiReporter(sub_reporters, close_output_files))
+        else:
+            self.set_reporter(sub_reporters[0])
+
+    def _load_reporter_by_name(self, reporter_name: str) -> reporters.BaseReporter:
+        name = reporter_name.lower()
+        if name in self._reporters:
+            return self._reporters[name]()
+        try:
+            return pylint.lint.pylinter._load_reporter_by_class(reporter_name)()  # pylint: disable=protected-access
+        except (ImportError, AttributeError, AssertionError) as e:
+            raise exceptions.InvalidReporterError(name) from e
+
+    # configuration
+
+    def _parse_configuration_file(self, arguments: list[str]) -> None:
+        """Parse the options from a configuration file, ignoring the ones of `pylint`'s own Python checkers.
+
+        A robolintrc shared with `RoboLinter` may well configure those checkers, and they are never loaded here.
+        """
+        with contextlib.suppress(_UnrecognizedOptionError):
+            self.parse_configuration_file_cached(arguments, super()._parse_configuration_file)
+
+    def _parse_command_line_configuration(self, arguments: Optional[Sequence[str]] = None) -> list[str]:
+        return self.record_command_line_options(arguments or [], super()._parse_command_line_configuration(arguments))
+
+    def enable_fail_on_messages(self) -> None:
+        """Enable the messages of `--fail-on`, and remember them (and its categories) to set the exit code."""
+        fail_on_categories = {value for value in self.config.fail_on if value in MSG_TYPES}
+        for checker in self.get_checkers():
+            for message in checker.messages:
+                if message.msgid in self.config.fail_on or message.symbol in self.config.fail_on:
+                    self.enable(message.msgid)
+                    self.fail_on_symbols.append(message.symbol)
+                elif message.msgid[0] in fail_on_categories:
+                    self.fail_on_symbols.append(message.symbol)
+
+    def any_fail_on_issues(self) -> bool:
+        return any(symbol in self.fail_on_symbols for symbol in self.stats.by_msg)
+
+    def _parse_error_mode(self) -> None:
+        """Only report errors with `--errors-only`, like `PyLinter` (which also disables its Python-only checkers)."""
+        if not self._error_mode:
+            return
+        self.disable_noerror_messages()
+        self.set_option("reports", False)
+        self.set_option("persistent", False)
+        self.set_option("score", False)
+
+    # checking
+
+    def set_current_module(self, modname: str, filepath: Optional[str] = None) -> None:
+        self.reporter.on_set_current_module(modname, filepath)
+        self.current_name = modname
+        self.current_file = filepath or modname
+        self.stats.init_single_module(modname)
+
+    def check(self, filepaths: Sequence[str]) -> None:
+        """Check each Method with the checkers that have an enabled message."""
+        self.apply_rule_profiles()
+        self.import_enabled_plugins()
+        self.check_workspaces(filepaths, self._check_files)
+
+    def _check_files(self, filepaths: Sequence[str]) -> None:
+        needed_checkers = self.prepare_checkers()
+        for checker in needed_checkers:
+            checker.open()
+        self.lint_files_in_order(filepaths, lambda filepath: filepath, self._check_file_reporting_crashes)
+        for checker in reversed(needed_checkers):
+            checker.close()
+
+    def _check_file_reporting_crashes(self, filepath: str) -> None:
+        try:
+            self.check_file(filepath)
+        except Exception as e:  # pylint: disable=broad-except # reported like `PyLinter` does
+            template_path = pylint.lint.pylinter.prepare_crash_report(e, filepath, self.crash_file_path)
+            message = get_fatal_error_message(filepath, template_path)
+            self.add_message("astroid-error", args=(filepath, message), confidence=HIGH)
+
+    def check_file(self, filepath: str) -> None:
+        """Check a Method, reporting a missing file like `pylint` reports a module that can't be found."""
+        if not os.path.isfile(filepath):
+            self.set_current_module(filepath)
+            self.add_message("fatal", args=f"No module named {filepath}")
+            return
+        modname = os.path.splitext(os.path.basename(filepath))[0]
+        self.set_current_module(modname, filepath)
+        try:
+            node = self.read_xml_module(filepath)
+        except (ParseError, XMLSyntaxError) as e:
+            self.add_syntax_error_message(e)
+            return
+        self._ignore_file = False
+        self.file_state = FileState(modname, self.msgs_store, node)
+        self.check_xml_module(node)
+        for msgid, line, args in self.file_state.iter_spurious_suppression_messages(self.msgs_store):
+            self.add_message(msgid, line, None, args)
+
+    def generate_reports(self) -> None:
+        """Display the messages; the native engine has no reports nor score, there are no Python statements."""
+        self.reporter.display_messages(reporters.ureports.nodes.Section())
+        self.reporter.on_close(self.stats, LinterStats())
+        if isinstance(self.reporter, ProfilesReporter):
+            self.msg_status = self.reporter.msg_status | self._workspace_msg_status
+
+    # messages
+
+    def add_message(
+        self,
+        msgid: str,
+        line: Optional[int] = None,
+        node: Optional[nodes.NodeNG] = None,
+        args: Any = None,
+        confidence: Optional[interfaces.Confidence] = None,
+        col_offset: Optional[int] = None,
+        end_lineno: Optional[int] = None,
+        end_col_offset: Optional[int] = None,
+    ) -> None:
+        """Report a message, unless it is disabled, in the same way as `PyLinter`."""
+        if confidence is None:
+            confidence = interfaces.UNDEFINED
+        for message_definition in self.msgs_store.get_message_definitions(msgid):
+            self._add_one_message(message_definition, line, args, confidence, col_offset, end_lineno, end_col_offset)
+
+    def _add_one_message(
+        self,
+        message_definition: MessageDefinition,
+        line: Optional[int],
+        args: Any,
+        confidence: interfaces.Confidence,
+        col_offset: Optional[int],
+        end_lineno: Optional[int],
+        end_col_offset: Optional[int],
+    ) -> None:
+        message_definition.check_message_definition(line, None)
+        if not self.is_message_enabled(message_definition.msgid, line, confidence):
+            self.file_state.handle_ignored_message(
+                self._get_message_state_scope(message_definition.msgid, line, confidence),
+                message_definition.msgid,
+                line,
+            )
+            return
+        msg_category = MSG_TYPES[message_definition.msgid[0]]
+        self.msg_status |= MSG_TYPES_STATUS[message_definition.msgid[0]]
+        self.stats.increase_single_message_count(msg_category, 1)
+        self.stats.increase_single_module_message_count(self.current_name or "", msg_category, 1)
+        self.stats.by_msg[message_definition.symbol] = self.stats.by_msg.get(message_definition.symbol, 0) + 1
+        msg = message_definition.msg
+        if args is not None:
+            msg %= args
+        abspath = self.current_file
+        path = "configuration" if abspath is None else abspath.replace(self.reporter.path_strip_prefix, "", 1)
+        self.reporter.handle_message(
+            Message(
+                message_definition.msgid,
+                message_definition.symbol,
+                MessageLocationTuple(
+                    abspath or "",
+                    path,
+                    self.current_name or "",
+                    "",
+                    line or 1,
+                    col_offset or 0,
+                    end_lineno,
+                    end_col_offset,
+                ),
+                msg,
+                confidence,
+            )
+        )
+
+    def _emit_stashed_messages(self) -> None:
+        for (modname, symbol), values in self._stashed_messages.items():
+            self.set_current_module(modname or "")
+            for args in values:
+                self.add_message(symbol, args=args, line=0, confidence=HIGH)
+        self._stashed_messages.clear()
+
+
+# `pylint`'s run options for linting; the others, such as listing or documenting messages, only make sense with `PyLinter`
+SUPPORTED_RUN_OPTIONS = frozenset({"rcfile", "output", "init-hook", "errors-only", "verbose"})
+
+
+def find_unsupported_run_option(args: Sequence[str]) -> Optional[str]:
+    """Return the first of `pylint`'s run options in `args` that the native engine doesn't support, if any."""
+    unsupported_options = {
+        f"--{name}" for name, _ in _make_run_options(cast(Run, None)) if name not in SUPPORTED_RUN_OPTIONS
+    }
+    for arg in args:
+        option = arg.split("=", 1)[0]
+        if option in unsupported_options:
+            return option
+    return None
+
+
+class NativeRun:  # pylint: disable=too-few-public-methods # like `pylint`'s `Run`, it does all its work on creation
+    """Lint the Methods given on the command line with a `NativeLinter`, and exit with `pylint`'s exit codes.
+
+    It accepts `pylint`'s run options for linting, such as `--errors-only`, and rejects the others, such as
+    `--list-msgs`, which need `PyLinter`.
+    """
+
+    # set by `pylint`'s pre-processing of the command line
+    _rcfile: Optional[str] = None
+    _output: Optional[str] = None
+    verbose = False
+
+    def __init__(self, args: Sequence[str], reporter: Optional[reporters.BaseReporter] = None) -> None:
+        self._plugins: list[str] = []
+        unsupported_option = find_unsupported_run_option(args)
+        if unsupported_option:
+            print(  # allow-print
+                f"{unsupported_option} is not supported by the native engine, run robolint without --engine=native",
+                file=sys.stderr,
+            )
+            sys.exit(32)
+        try:
+            args = _preprocess_options(self, args)
+        except ArgumentPreprocessingError as e:
+            print(e, file=sys.stderr)  # allow-print
+            sys.exit(32)
+        if self._rcfile is None:
+            default_file = next(config.find_default_config_files(), None)
+            if default_file:
+                self._rcfile = str(default_file)
+
+        run_options = tuple(
+            option for option in _make_run_options(cast(Run, self)) if option[0] in SUPPORTED_RUN_OPTIONS
+        )
+        self.linter = linter = NativeLinter(config_file=self._rcfile, run_options=run_options)
+        linter.load_plugin_modules(self._plugins)
+        linter.disable("I")
+        args = _config_initialization(
+            cast(PyLinter, linter), list(args), reporter, config_file=self._rcfile, verbose_mode=self.verbose
+        )
+        if not args:
+            print(linter.help())  # allow-print
+            sys.exit(32)
+
+        if self._output:
+            try:
+                with open(self._output, "w", encoding="utf-8") as output:
+                    linter.reporter.out = output
+                    linter.check(args)
+                    linter.generate_reports()
+            except OSError as e:
+                print(e, file=sys.stderr)  # allow-print
+                sys.exit(32)
+        else:
+            linter.check(args)
+            linter.generate_reports()
+
+        if linter.config.exit_zero:
+            sys.exit(0)
+        if linter.any_fail_on_issues():
+            sys.exit(linter.msg_status or 1)
+        sys.exit(linter.msg_status)
@@ -0,0 +1,119 @@
+"""Checker plugins declared through the `robolint.checkers` entry points, imported only once one of their messages is on.
+
+Each entry point is named after a plugin module, as given to `load-plugins`, and refers to the checkers the module
+registers: their names, message IDs and symbols, and option names.  Until one of those messages is enabled, the linters
+register a `PlaceholderChecker` for each declared checker instead of importing the module, so the messages can be
+enabled and disabled, and the options set, as if it were loaded.  A plugin module without an entry point is imported as
+soon as it is loaded, as by `pylint`.  The checker modules of `robolint` itself are declared here too, for when it runs
+from source without being installed and so has no entry points.
+"""
+import functools
+from importlib.metadata import distributions
+from importlib.metadata import EntryPoint
+from typing import NamedTuple
+
+from pylint.checkers import BaseChecker
+from pylint.lint.pylinter import PyLinter
+
+PLUGIN_ENTRY_POINT_GROUP = "robolint.checkers"
+
+
+class CheckerDeclaration(NamedTuple):
+    """What a checker of a plugin module registers, known without importing the module."""
+
+    name: str
+    msgs: dict[str, str]  # the symbol of each message ID
+    option_names: tuple[str, ...] = ()
+
+
+class PlaceholderChecker(BaseChecker):
+    """Stands in for a declared checker of a plugin module that isn't imported yet."""
+
+    def __init__(self, linter: PyLinter, modname: str, declaration: CheckerDeclaration) -> None:
+        description = f"Defined by the plugin '{modname}', which is imported once the message is enabled."
+        self.name = declaration.name
+        self.msgs = {msgid: (description, symbol, description) for msgid, symbol in declaration.msgs.items()}
+        super().__init__(linter)
+        self.modname = modname
+        self.option_names = declaration.option_names
+
+
+@functools.lru_cache(maxsize=None)
+def _get_plugin_entry_points() -> dict[str, tuple[EntryPoint, str]]:
+    """Return the `robolint.checkers` entry point of each plugin module, with the version of its distribution."""
+    plugin_entry_points: dict[str, tuple[EntryPoint, str]] = {}
+    for distribution in distributions():
+        for entry_point in distribution.entry_points:
+            if entry_point.group == PLUGIN_ENTRY_POINT_GROUP and entry_point.name not in plugin_entry_points:
+                plugin_entry_points[entry_point.name] = (entry_point, distribution.version)
+    return plugin_entry_points
+
+
+@functools.lru_cache(maxsize=None)
+def get_plugin_declarations() -> dict[str, tuple[CheckerDeclaration, ...]]:
+    """Return the checkers declared by each plugin module with a `robolint.checkers` entry point, or of `robolint`."""
+    declarations: dict[str, tuple[CheckerDeclaration, ...]] = {}
+    for modname, (entry_point, _) in _get_plugin_entry_points().items():
+        try:
+            declarations[modname] = tuple(entry_point.load())
+        except (ImportError, AttributeError):
+            continue  # the plugin module is then imported as soon as it is loaded
+    for modname, robolint_declarations in ROBOLINT_PLUGIN_DECLARATIONS.items():
+        declarations.setdefault(modname, robolint_declarations)
+    return declarations
+
+
+def get_plugin_versions() -> dict[str, str]:
+    """Return the version of the distribution of each plugin module with a `robolint.checkers` entry point."""
+    return {modname: plugin_version for modname, (_, plugin_version) in _get_plugin_entry_points().items()}
+
+
+# the checkers of `robolint.checkers`, which `tests/unit/robolint/test_plugins.py` compares with those the modules register
+HARDCODED_VALUES = (
+    CheckerDeclaration(
+        "hardcoded_aspirate_volume",
+        {"C9000": "hardcoded-aspirate-volume", "C9003": "hardcoded-dispense-volume", "C9005": "hardcoded-mix-volume"},
+    ),
+)
+LABWARE = (
+    CheckerDeclaration(
+        "invalid-labware-name",
+        {"C9006": "invalid-labware-name", "W9013": "unsafe-labware-rgx"},
+        ("labware-rgx", "labware-rgx-timeout"),
+    ),
+)
+LOOPING = (
+    CheckerDeclaration("invalid_loop_start_index", {"C9001": "invalid-loop-start-index"}, ("loop-start-index",)),
+)
+PARAMETER_RULES = (
+    CheckerDeclaration("invalid-parameter-value", {"C9010": "invalid-parameter-value"}, ("parameter-rules",)),
+)
+VARIABLES = (
+    CheckerDeclaration(
+        "variable-name-checker",
+        {"C9007": "invalid-variable-case", "C9008": "non-abbreviated-variable"},
+        ("variable-name-abbreviations", "variable-name-case"),
+    ),
+)
+ROBOCASE = VARIABLES
+TIP_CHECKERS = (
+    CheckerDeclaration("invalid-tip-load-profile", {"C9002": "invalid-tip-load-profile"}, ("tip-load-profile",)),
+    CheckerDeclaration("invalid-tip-eject-profile", {"C9004": "invalid-tip-eject-profile"}, ("tip-eject-profile",)),
+    CheckerDeclaration(
+        "invalid-tip-waste-eject-height",
+        {"C9009": "invalid-tip-waste-eject-height"},
+        ("tip-waste-eject-height", "tip-waste-chute-name"),
+    ),
+    CheckerDeclaration("no-tips-loaded", {"C9011": "no-tips-loaded"}),
+)
+
+# the same as the entry points of `robolint` in `pyproject.toml`
+ROBOLINT_PLUGIN_DECLARATIONS = {
+    "robolint.checkers.hardcoded_values": HARDCODED_VALUES,
+    "robolint.checkers.labware": LABWARE,
+    "robolint.checkers.looping": LOOPING,
+    "robolint.checkers.parameter_rules": PARAMETER_RULES,
+    "robolint.checkers.robocase": ROBOCASE,
+    "robolint.checkers.tip_checkers": TIP_CHECKERS,
+    "robolint.checkers.variables": VARIABLES,
+}
@@ -0,0 +1,137 @@
+"""Rule profiles: named sets of enabled messages, each with its own report and exit code, all checked in a single run."""
+import argparse
+import shlex
+from typing import NamedTuple
+from typing import Optional
+from typing import Union
+
+from pylint.constants import MSG_TYPES_STATUS
+from pylint.message import Message
+from pylint.reporters import BaseReporter
+from pylint.reporters import MultiReporter
+from pylint.reporters.text import TextReporter
+from pylint.reporters.ureports.nodes import Section
+from pylint.utils import LinterStats
+
+from .exceptions import InvalidRuleProfileError
+
+
+class RuleProfile(NamedTuple):
+    """A profile of the `rule-profiles` option."""
+
+    name: str
+    enable: list[str]
+    disable: list[str]
+    exit_zero: bool
+
+
+_PROFILE_ARG_PARSER = argparse.ArgumentParser(prog="rule-profiles", add_help=False, exit_on_error=False)
+_PROFILE_ARG_PARSER.add_argument("--enable", "-e", action="append", default=[])
+_PROFILE_ARG_PARSER.add_argument("--disable", "-d", action="append", default=[])
+_PROFILE_ARG_PARSER.add_argument("--exit-zero", action="store_true")
+
+
+def _split_message_names(values: list[str]) -> list[str]:
+    return [name.strip() for value in values for name in value.split(",") if name.strip()]
+
+
+def parse_rule_profiles(value: str) -> list[RuleProfile]:
+    """Parse the `rule-profiles` option: one `<name>: [--enable=<msgs>] [--disable=<msgs>] [--exit-zero]` per line."""
+    profiles: list[RuleProfile] = []
+    for line in value.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        name, separator, args = line.partition(":")
+        name = name.strip()
+        if not separator or not name:
+            raise InvalidRuleProfileError(line, "expected '<name>: <options>'")
+        if any(profile.name == name for profile in profiles):
+            raise InvalidRuleProfileError(line, f"the profile '{name}' is defined more than once")
+        try:
+            parsed_args, unknown_args = _PROFILE_ARG_PARSER.parse_known_args(shlex.split(args))
+        except (argparse.ArgumentError, ValueError) as e:
+            raise InvalidRuleProfileError(line, str(e)) from e
+        if unknown_args:
+            raise InvalidRuleProfileError(line, f"unrecognized options {' '.join(unknown_args)}")
+        profiles.append(
+            RuleProfile(
+                name,
+                _split_message_names(parsed_args.enable),
+                _split_message_names(parsed_args.disable),
+                parsed_args.exit_zero,
+            )
+        )
+    return profiles
+
+
+def make_reporter_like(reporter: Union[BaseReporter, MultiReporter]) -> Union[BaseReporter, MultiReporter]:
+    """Return a new reporter of the same kind as `reporter`, writing to the same output."""
+    if isinstance(reporter, MultiReporter):
+        sub_reporters = [
+            make_reporter_like(sub_reporter)
+            for sub_reporter in reporter._sub_reporters  # pylint: disable=protected-access
+        ]
+        return MultiReporter(sub_reporters, lambda: None)  # the output files are closed by `reporter`
+    new_reporter = type(reporter)()
+    new_reporter.out = reporter.out
+    new_reporter.linter = reporter.linter
+    return new_reporter
+
+
+class ProfilesReporter(BaseReporter):
+    """Collect the messages of a run, then display them once for each rule profile that enables them."""
+
+    name = "profiles"
+
+    def __init__(
+        self,
+        reporter: Union[BaseReporter, MultiReporter],
+        profile_msgids: list[tuple[RuleProfile, set[str]]],
+    ) -> None:
+        super().__init__(reporter.out)
+        self.reporter = reporter  # kept, so output files it opened stay open until the end of the run
+        self.profile_msgids = profile_msgids
+        self.profile_reporters = {profile.name: make_reporter_like(reporter) for profile, _ in profile_msgids}
+        self.failing_message_count = 0
+
+    def handle_message(self, msg: Message) -> None:
+        super().handle_message(msg)
+        if MSG_TYPES_STATUS[msg.msg_id[0]] and any(
+            not profile.exit_zero and msg.msg_id in msgids for profile, msgids in self.profile_msgids
+        ):
+            self.failing_message_count += 1
+
+    def _display(self, layout: Section) -> None:
+        """Reports are not split by profile."""
+
+    def messages_of(self, msgids: set[str]) -> list[Message]:
+        return [message for message in self.messages if message.msg_id in msgids]
+
+    def display_messages(self, layout: Optional[Section]) -> None:
+        for profile, msgids in self.profile_msgids:
+            profile_reporter = self.profile_reporters[profile.name]
+            profile_messages = self.messages_of(msgids)
+            if profile_messages and isinstance(profile_reporter, TextReporter):
+                profile_reporter.writeln(f"************* Profile {profile.name}")
+            current_module: Optional[str] = None
+            for message in profile_messages:
+                if message.module != current_module:
+                    current_module = message.module
+                    profile_reporter.on_set_current_module(message.module, message.abspath)
+                profile_reporter.handle_message(message)
+            profile_reporter.display_messages(layout)
+
+    def on_close(self, stats: LinterStats, previous_stats: Optional[LinterStats]) -> None:
+        for profile_reporter in self.profile_reporters.values():
+            profile_reporter.on_close(stats, previous_stats)
+
+    @property
+    def msg_status(self) -> int:
+        """The exit code of the run: the message categories reported by every profile without `--exit-zero`."""
+        status = 0
+        for profile, msgids in self.profile_msgids:
+            if not profile.exit_zero:
+                for message in self.messages_of(msgids):
+                    status |= MSG_TYPES_STATUS[message.msg_id[0]]
+        return status
@@ -0,0 +1,243 @@
+"""Guard against regular expressions that backtrack catastrophically, such as a user-supplied `labware-rgx`.
+
+`find_risky_constructs` analyses a pattern once, when the configuration loads.  It flags the classic cause of
+exponential backtracking: a quantifier in a repeated group that can also match what follows it, within the group or at
+the start of its next repetition, such as `(a+)+`, `(\\w+\\s?)+` or `(.*,)+`, so a near-miss can be split between the
+repetitions in exponentially many ways.  The character sets are only computed exactly for ASCII, anything beyond is
+assumed to overlap.
+
+`match_within_budget` bounds the time a single match may take, for the risky constructs the analysis doesn't know of.
+`re` checks for signals while matching, so an interval timer interrupts it.  Where there are no interval timers
+(Windows), or outside the main thread, the budget is not enforced.
+"""
+import functools
+import importlib
+import re
+import signal
+import sys
+import threading
+from types import ModuleType
+from typing import Any
+from typing import Optional
+
+from .exceptions import RegexTimeoutError
+
+CAN_BOUND_MATCHES = hasattr(signal, "setitimer")
+
+_OTHER = -1  # stands for every character beyond ASCII
+_ANY_CHARACTER = frozenset([*range(128), _OTHER])
+_CATEGORY_PATTERNS = {
+    "CATEGORY_DIGIT": re.compile(r"\d"),
+    "CATEGORY_NOT_DIGIT": re.compile(r"\D"),
+    "CATEGORY_SPACE": re.compile(r"\s"),
+    "CATEGORY_NOT_SPACE": re.compile(r"\S"),
+    "CATEGORY_WORD": re.compile(r"\w"),
+    "CATEGORY_NOT_WORD": re.compile(r"\W"),
+}
+_REPEATS = ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT")
+_ZERO_WIDTH = ("AT", "ASSERT", "ASSERT_NOT")
+
+Item = tuple[str, Any]  # an opcode name and its argument, as returned by `parse_pattern`
+
+
+def _get_parser() -> ModuleType:
+    # `re`'s parser is private, `sre_parse` became a deprecated alias of `re._parser` in Python 3.11
+    return importlib.import_module("re._parser" if sys.version_info >= (3, 11) else "sre_parse")
+
+
+def _name_codes(value: Any, parser: ModuleType) -> Any:
+    if isinstance(value, parser.SubPattern):
+        return [_name_codes(item, parser) for item in value.data]
+    if isinstance(value, (list, tuple)):
+        return type(value)(_name_codes(item, parser) for item in value)
+    if isinstance(value, int) and hasattr(value, "name"):  # a named code, e.g. an opcode or a category
+        return int(value) if value == parser.MAXREPEAT else str(value.name)
+    return value
+
+
+def parse_pattern(pattern: re.Pattern[str]) -> list[Item]:
+    """Parse a pattern into `(opcode name, argument)` items, such as `("MAX_REPEAT", (1, MAXREPEAT, [...]))`.
+
+    This is the only use of `re`'s private parser.  The codes are replaced by their names (`"LITERAL"`,
+    `"CATEGORY_DIGIT"`...), and nested sequences of items by lists, so nothing else depends on the parser's types.
+    """
+    parser = _get_parser()
+    items: list[Item] = _name_codes(parser.parse(pattern.pattern, pattern.flags), parser)
+    return items
+
+
+def _characters(code: int, ignore_case: bool) -> frozenset[int]:
+    characters = {code if code < 128 else _OTHER}
+    if ignore_case and code < 128:
+        characters.add(ord(chr(code).swapcase()))
+    return frozenset(characters)
+
+
+def _category_characters(category: str) -> frozenset[int]:
+    pattern = _CATEGORY_PATTERNS.get(category)
+    if pattern is None:
+        return _ANY_CHARACTER
+    return frozenset([*(code for code in range(128) if pattern.match(chr(code))), _OTHER])
+
+
+def _set_characters(members: list[Item], ignore_case: bool) -> frozenset[int]:
+    characters: set[int] = set()
+    negate = False
+    for opcode, argument in members:
+        if opcode == "NEGATE":
+            negate = True
+        elif opcode == "LITERAL":
+            characters |= _characters(argument, ignore_case)
+        elif opcode == "RANGE":
+            low, high = argument
+            for code in range(low, min(high, 127) + 1):
+                characters |= _characters(code, ignore_case)
+            if high > 127:
+                characters.add(_OTHER)
+        elif opcode == "CATEGORY":
+            characters |= _category_characters(argument)
+        else:
+            return _ANY_CHARACTER
+    if negate:
+        return (_ANY_CHARACTER - characters) | {_OTHER}
+    return frozenset(characters)
+
+
+def _item_characters(opcode: str, argument: Any, ignore_case: bool) -> Optional[frozenset[int]]:
+    """The characters a single-character item matches, or `None` if it isn't one."""
+    if opcode == "LITERAL":
+        return _characters(argument, ignore_case)
+    if opcode in ("NOT_LITERAL", "ANY"):
+        return _ANY_CHARACTER
+    if opcode == "IN":
+        return _set_characters(argument, ignore_case)
+    return None
+
+
+def _subpattern_ignore_case(argument: Any, ignore_case: bool) -> bool:
+    _, add_flags, del_flags, _ = argument
+    return bool((ignore_case or add_flags & re.IGNORECASE) and not del_flags & re.IGNORECASE)
+
+
+def _first(items: list[Item], ignore_case: bool) -> tuple[frozenset[int], bool]:
+    """Return the characters a sequence can start with, and whether it can match the empty string."""
+    first: set[int] = set()
+    for opcode, argument in items:
+        item_first, nullable = _item_first(opcode, argument, ignore_case)
+        first |= item_first
+        if not nullable:
+            return frozenset(first), False
+    return frozenset(first), True
+
+
+def _item_first(opcode: str, argument: Any, ignore_case: bool) -> tuple[frozenset[int], bool]:
+    characters = _item_characters(opcode, argument, ignore_case)
+    if characters is not None:
+        return characters, False
+    if opcode in _ZERO_WIDTH:
+        return frozenset(), True
+    if opcode == "SUBPATTERN":
+        return _first(argument[-1], _subpattern_ignore_case(argument, ignore_case))
+    if opcode == "BRANCH":
+        branches = [_first(branch, ignore_case) for branch in argument[1]]
+        return frozenset().union(*(first for first, _ in branches)), any(nullable for _, nullable in branches)
+    if opcode in _REPEATS:
+        minimum, _, body = argument
+        first, nullable = _first(body, ignore_case)
+        return first, nullable or minimum == 0
+    return _ANY_CHARACTER, True  # e.g. a backreference, which can be anything
+
+
+def _all_characters(items: list[Item], ignore_case: bool) -> frozenset[int]:
+    """Return every character a sequence can match, anywhere."""
+    characters: set[int] = set()
+    for opcode, argument in items:
+        item_characters = _item_characters(opcode, argument, ignore_case)
+        if item_characters is not None:
+            characters |= item_characters
+        elif opcode == "SUBPATTERN":
+            characters |= _all_characters(argument[-1], _subpattern_ignore_case(argument, ignore_case))
+        elif opcode == "BRANCH":
+            for branch in argument[1]:
+                characters |= _all_characters(branch, ignore_case)
+        elif opcode in _REPEATS:
+            characters |= _all_characters(argument[2], ignore_case)
+        elif opcode not in _ZERO_WIDTH:
+            return _ANY_CHARACTER
+    return frozenset(characters)
+
+
+def _telling(code: int) -> tuple[int, int]:
+    if code == _OTHER:
+        return 2, code
+    return (0 if chr(code).isalnum() else 1), code
+
+
+def _describe(characters: frozenset[int]) -> str:
+    """Describe one of the characters, preferring letters and digits as the most telling."""
+    character = min(characters, key=_telling)
+    return "a non-ASCII character" if character == _OTHER else repr(chr(character))
+
+
+def _find_risky_repeats(
+    items: list[Item], follow: frozenset[int], ignore_case: bool, in_repeat: bool, risks: list[str]
+) -> None:
+    """Walk a sequence backwards, knowing the characters that can `follow` it and whether it is in a repeated group."""
+    for opcode, argument in reversed(items):
+        if opcode == "SUBPATTERN":
+            _find_risky_repeats(argument[-1], follow, _subpattern_ignore_case(argument, ignore_case), in_repeat, risks)
+        elif opcode == "BRANCH":
+            for branch in argument[1]:
+                _find_risky_repeats(branch, follow, ignore_case, in_repeat, risks)
+        elif opcode in _REPEATS and argument[1] > 1:
+            body = argument[2]
+            first, nullable = _first(body, ignore_case)
+            if nullable:
+                risks.append("a repeated group can match the empty string")
+            elif in_repeat:
+                overlap = _all_characters(body, ignore_case) & follow
+                if overlap:
+                    risks.append(
+                        f"a quantifier in a repeated group can also match {_describe(overlap)}, which can follow it"
+                    )
+            _find_risky_repeats(body, follow | first, ignore_case, True, risks)
+        elif opcode in _REPEATS:
+            _find_risky_repeats(argument[2], follow, ignore_case, in_repeat, risks)
+        item_first, item_nullable = _item_first(opcode, argument, ignore_case)
+        follow = item_first | follow if item_nullable else item_first
+
+
+@functools.lru_cache(maxsize=None)
+def find_risky_constructs(pattern: re.Pattern[str]) -> list[str]:
+    """Return why the pattern may backtrack catastrophically on a near-miss, if it may."""
+    risks: list[str] = []
+    _find_risky_repeats(
+        parse_pattern(pattern),
+        frozenset(),
+        bool(pattern.flags & re.IGNORECASE),
+        False,
+        risks,
+    )
+    return list(dict.fromkeys(risks))
+
+
+def match_within_budget(pattern: re.Pattern[str], string: str, seconds: float) -> Optional[re.Match[str]]:
+    """Match `string` like `pattern.match`, raising `RegexTimeoutError` if it takes longer than `seconds` (0 for ever)."""
+    if (
+        not seconds
+        or not CAN_BOUND_MATCHES
+        or threading.current_thread() is not threading.main_thread()
+        or signal.getitimer(signal.ITIMER_REAL)[0]  # someone else's timer is running
+    ):
+        return pattern.match(string)
+
+    def interrupt(*_: Any) -> None:
+        raise RegexTimeoutError(pattern.pattern, seconds)
+
+    previous_handler = signal.signal(signal.SIGALRM, interrupt)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        return pattern.match(string)
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
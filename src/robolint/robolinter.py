@@ -1,44 +1,201 @@
 """Overriding the builtin Pylint linter to be able to process XML files."""
-import re
+from argparse import SUPPRESS
+import bisect
+import collections
+import functools
+import os
+import sys
 import traceback
+from typing import Any
+from typing import Callable
+from typing import cast
+from typing import Iterator
+from typing import Literal
 from typing import Optional
+from typing import Protocol
+from typing import Sequence
+from typing import TypeVar
 from xml.etree.ElementTree import ParseError
 
 import astroid
+from lxml.etree import XMLSyntaxError
 from pylint import checkers
+from pylint import interfaces
+from pylint import reporters
+from pylint.config.config_initialization import _config_initialization
+from pylint.config.exceptions import _UnrecognizedOptionError
+from pylint.constants import MSG_STATE_SCOPE_MODULE
+from pylint.constants import MSG_TYPES_STATUS
 from pylint.exceptions import NoLineSuppliedError
 from pylint.exceptions import UnknownMessageError
 from pylint.interfaces import HIGH
 from pylint.lint.message_state_handler import _MessageStateHandler
+import pylint.lint.pylinter
 from pylint.lint.pylinter import PyLinter
+from pylint.lint.utils import get_fatal_error_message
+from pylint.message import Message
+from pylint.typing import FileItem
+from pylint.typing import Options
 from pylint.utils import ASTWalker
+from pylint.utils import FileState
+from pylint.utils import LinterStats
+from pylint.utils import merge_stats
 
+from .analysis import Directive
+from .analysis import directives
+from .analysis import get_step_directives
+from .base_options import make_robolint_options
+from .budgets import BudgetChecker
+from .budgets import CAN_FORK
+from .budgets import run_within_budget
+from .config_cache import CachedConfig
+from .config_cache import get_config_cache_key
+from .config_cache import load_cached_config
+from .config_cache import replay_callback_options
+from .config_cache import save_cached_config
 from .constants import COMMENT_STEPS_ID
-from .constants import DIRECTIVE_REGEX
-from .utils import parse_steps_from_etree
+from .exceptions import InvalidRuleProfileError
+from .exceptions import WorkerCrashedError
+from .flow import FlowAnalysis
+from .flow import FlowWalker
+from .plugins import get_plugin_declarations
+from .plugins import PlaceholderChecker
+from .profiles import parse_rule_profiles
+from .profiles import ProfilesReporter
+from .profiles import RuleProfile
+from .scheduling import load_failed_filepaths
+from .scheduling import prioritize
+from .scheduling import save_failed_filepaths
+from .utils import MM4Step
 from .utils import parse_xml_module_from_file
+from .utils import SkippedXmlModule
+from .utils import stream_xml_module_from_file
+from .utils import StreamedXmlModule
 from .utils import XmlModule
+from .workspaces import get_option_arguments
+from .workspaces import group_by_workspace_config
+from .workspaces import WorkspaceConfigFinder
+
+
+T = TypeVar("T")
+
+
+class DisabledIntervals:
+    """The lines on which a message is disabled by block directives, as sorted, non-overlapping `[start, end)` ranges.
+
+    Directives are processed in step order, so ranges are only ever appended or closed at the end.
+    """
+
+    def __init__(self) -> None:
+        self._starts: list[int] = []
+        self._ends: list[int] = []
+
+    def disable_from(self, line: int) -> None:
+        if self._ends and self._ends[-1] == sys.maxsize:
+            return  # already disabled
+        self._starts.append(line)
+        self._ends.append(sys.maxsize)
+
+    def enable_from(self, line: int) -> None:
+        if self._ends and self._ends[-1] == sys.maxsize:
+            self._ends[-1] = line
+
+    def find_start(self, line: int) -> Optional[int]:
+        """Return the line of the directive disabling the message on this line, if any."""
+        range_index = bisect.bisect_right(self._starts, line) - 1
+        if range_index >= 0 and line < self._ends[range_index]:
+            return self._starts[range_index]
+        return None
 
 
 class RoboLintMessageStateHandler(_MessageStateHandler):
     """Overridden handler to allow parsing directives from MM4 Comment steps."""
 
+    _disabled_intervals: dict[str, DisabledIntervals]
+
     def process_tokens(self, tokens: XmlModule) -> None:
         """Process tokens from the current module to search for module/block level options.
 
         See func_block_disable_msg.py test case for expected behavior.
         """
-        steps = parse_steps_from_etree(tokens.tree.getroot())
-        for step_idx, step in enumerate(steps):
-            if step.step_type_id != COMMENT_STEPS_ID:
-                continue
-            comment = step.get_parameter("Comment")
-            match = re.search(DIRECTIVE_REGEX, comment)
-            if match is None:
-                continue
-            rule_names = match.group(1).split(",")
-            for rule_name in rule_names:
-                self.disable_next(rule_name.strip(), line=step_idx)
+        self._disabled_intervals = {}
+        if not tokens.mentions_robolint:
+            return
+        for directive in directives(tokens):
+            self.process_directive(directive)
+
+    def process_step_directives(self, step: MM4Step) -> None:
+        """Process any directives in a Comment step."""
+        for directive in get_step_directives(step):
+            self.process_directive(directive)
+
+    def process_directive(self, directive: Directive) -> None:
+        for rule_name in directive.rule_names:
+            if directive.action == "disable":
+                self.disable_next(rule_name, line=directive.step_index)
+            elif directive.action == "disable-block":
+                self.disable_block(rule_name, line=directive.step_index)
+            else:
+                self.enable_block(rule_name, line=directive.step_index)
+
+    def disable_block(self, msgid: str, line: int) -> None:
+        """Disable a message from the next line until it is enabled by `enable_block`.
+
+        Unlike `pylint`'s block scope, this doesn't store the state of every line in the block.
+        """
+        try:
+            message_definitions = self._get_messages_to_set(msgid, enable=False)
+        except UnknownMessageError:
+            self.linter.add_message(
+                "unknown-option-value", args=("robolint: disable-block", msgid), line=line + 1, confidence=HIGH
+            )
+            return
+        for message_definition in message_definitions:
+            self._disabled_intervals.setdefault(message_definition.msgid, DisabledIntervals()).disable_from(line + 1)
+            # stored like `pylint`'s own directives, so `useless-suppression` and `suppressed-message` are reported
+            raw_msgs_state = self.linter.file_state._raw_module_msgs_state  # pylint: disable=protected-access
+            raw_msgs_state.setdefault(message_definition.msgid, {})[line + 1] = False
+            self.linter.add_message(
+                "locally-disabled", line=line + 1, args=(message_definition.symbol, message_definition.msgid)
+            )
+        self._register_by_id_managed_msg(msgid, line + 1)
+
+    def enable_block(self, msgid: str, line: int) -> None:
+        """Enable a message disabled by `disable_block` again from the next line."""
+        try:
+            message_definitions = self._get_messages_to_set(msgid, enable=True)
+        except UnknownMessageError:
+            self.linter.add_message(
+                "unknown-option-value", args=("robolint: enable-block", msgid), line=line + 1, confidence=HIGH
+            )
+            return
+        for message_definition in message_definitions:
+            if message_definition.msgid in self._disabled_intervals:
+                self._disabled_intervals[message_definition.msgid].enable_from(line + 1)
+        self._register_by_id_managed_msg(msgid, line + 1, is_disabled=False)
+
+    def _get_block_disable_line(self, msgid: str, line: Optional[int]) -> Optional[int]:
+        if line is None or msgid not in self._disabled_intervals:
+            return None
+        return self._disabled_intervals[msgid].find_start(line)
+
+    def _is_one_message_enabled(self, msgid: str, line: Optional[int]) -> bool:
+        if self._get_block_disable_line(msgid, line) is not None:
+            return False
+        enabled: bool = super()._is_one_message_enabled(msgid, line)
+        return enabled
+
+    def _get_message_state_scope(
+        self, msgid: str, line: Optional[int] = None, confidence: Optional[interfaces.Confidence] = None
+    ) -> Optional[Literal[0, 1, 2]]:
+        block_disable_line = self._get_block_disable_line(msgid, line)
+        if block_disable_line is None:
+            scope: Optional[Literal[0, 1, 2]] = super()._get_message_state_scope(msgid, line, confidence)
+            return scope
+        # let `FileState.handle_ignored_message` attribute the suppressed message to the directive
+        suppression_mapping = self.linter.file_state._suppression_mapping  # pylint: disable=protected-access
+        suppression_mapping[(msgid, line)] = block_disable_line
+        return MSG_STATE_SCOPE_MODULE  # type: ignore[no-any-return]
 
     def disable_next(
         self,
@@ -70,21 +227,542 @@ class RoboLintMessageStateHandler(_MessageStateHandler):
         self._register_by_id_managed_msg(msgid, line + 1)
 
 
-class RoboLinter(RoboLintMessageStateHandler, PyLinter):
+class StepVisitor(Protocol):
+    """The part of a `StepChecker` used to dispatch steps to it."""
+
+    step_type_id: set[str]
+    flow_analyses: tuple[type[FlowAnalysis[Any]], ...]
+    flow_walker: FlowWalker
+
+    def has_steps_to_check(self) -> bool:
+        ...
+
+    def get_checked_step_type_ids(self) -> set[str]:
+        ...
+
+    def open_module(self, node: XmlModule) -> None:
+        ...
+
+    def visit_step(self, step: MM4Step) -> None:
+        ...
+
+
+def get_prefilter_step_type_ids(raw_checkers: list[checkers.BaseRawFileChecker]) -> Optional[frozenset[str]]:
+    """Return the step type IDs a Method must contain for any of the checkers to have something to check.
+
+    `None` means every Method needs checking, because a checker is interested in every type of step (or isn't a
+    `StepChecker`).  Comment steps are always included, since their directives can emit messages of their own.
+    """
+    step_type_ids = {COMMENT_STEPS_ID}
+    for checker in raw_checkers:
+        if not getattr(checker, "step_type_id", None):
+            return None
+        step_type_ids.update(cast(StepVisitor, checker).get_checked_step_type_ids())
+    return frozenset(step_type_ids)
+
+
+class StepDispatcher:
+    """Route each step to the checkers interested in its type, so that the steps of a module are walked only once.
+
+    Checkers with an empty `step_type_id` are interested in every step, the others only in the step types that can
+    produce one of their enabled messages.  Raw checkers without a `step_type_id` are not `StepChecker`s and are left
+    to process the whole module themselves.  The flow analyses the checkers need are advanced along the same walk,
+    after the checkers have visited each step.
+    """
+
+    def __init__(self, raw_checkers: list[checkers.BaseRawFileChecker]) -> None:
+        self.module_checkers = [checker for checker in raw_checkers if getattr(checker, "step_type_id", None) is None]
+        self.step_checkers = [
+            cast(StepVisitor, checker) for checker in raw_checkers if getattr(checker, "step_type_id", None) is not None
+        ]
+        self._every_step_checkers = [checker for checker in self.step_checkers if not checker.step_type_id]
+        checked_step_type_ids = [checker.get_checked_step_type_ids() for checker in self.step_checkers]
+        self._checkers_by_step_type = {
+            step_type_id: [
+                checker
+                for checker, checker_step_type_ids in zip(self.step_checkers, checked_step_type_ids)
+                if not checker.step_type_id or step_type_id in checker_step_type_ids
+            ]
+            for step_type_id in set().union(*checked_step_type_ids)
+        }
+        self.flow_walker = FlowWalker(
+            analysis_class for checker in self.step_checkers for analysis_class in checker.flow_analyses
+        )
+        for checker in self.step_checkers:
+            checker.flow_walker = self.flow_walker
+
+    def checkers_for(self, step: MM4Step) -> list[StepVisitor]:
+        """Return the checkers to visit the step with, in the order they were registered."""
+        return self._checkers_by_step_type.get(step.step_type_id, self._every_step_checkers)
+
+    def open_module(self, node: XmlModule) -> None:
+        self.flow_walker.open_module()
+        for checker in self.step_checkers:
+            checker.open_module(node)
+
+    def dispatch(self, step: MM4Step) -> None:
+        for checker in self.checkers_for(step):
+            checker.visit_step(step)
+        self.flow_walker.advance(step)
+
+
+class XmlModuleLinter(RoboLintMessageStateHandler):
+    """Read Methods and walk their steps through the checkers, for `RoboLinter` and the native engine alike."""
+
+    _stream_steps: bool
+    _prefilter_step_type_ids: Optional[frozenset[str]]
+    _step_dispatcher: StepDispatcher
+    _ignore_file: bool
+    _checkers: collections.defaultdict[str, list[checkers.BaseChecker]]
+    _dynamic_plugins: dict[str, Any]
+    _deferred_plugins: dict[str, list[PlaceholderChecker]]
+    _msgs_state: dict[str, bool]
+    _stashed_messages: collections.defaultdict[tuple[str, str], list[tuple[Optional[str], str]]]
+    config_file: Optional[str]
+    _command_line_plugins: list[str]
+    _command_line_option_arguments: list[str]
+    _workspace_msg_status = 0  # the exit code of the Workspaces' linters
+
+    def load_plugin_modules(self, modnames: list[str]) -> None:
+        """Load plugin modules, deferring the import of those declared by a `robolint.checkers` entry point."""
+        if self.linter.current_name is None:  # before the configuration is read, the plugins are `--load-plugins`'
+            self._command_line_plugins.extend(modnames)
+        self.import_plugin_modules(self.defer_plugin_modules(modnames))
+
+    def import_plugin_modules(self, modnames: list[str]) -> None:
+        """Import plugin modules and register their checkers."""
+        raise NotImplementedError()
+
+    def defer_plugin_modules(self, modnames: list[str]) -> list[str]:
+        """Register placeholders for the checkers of the declared plugin modules, and return the others."""
+        declarations = get_plugin_declarations()
+        modnames_to_import: list[str] = []
+        for modname in modnames:
+            if modname in self._deferred_plugins:
+                continue
+            if modname not in declarations or modname in self._dynamic_plugins:
+                modnames_to_import.append(modname)
+                continue
+            placeholders = [
+                PlaceholderChecker(self.linter, modname, declaration) for declaration in declarations[modname]
+            ]
+            for placeholder in placeholders:
+                self.linter.register_checker(placeholder)
+                for option_name in placeholder.option_names:
+                    if option_name in self.linter._option_dicts:  # pylint: disable=protected-access
+                        continue  # already registered by an imported module
+                    # the raw value is kept until the module is imported, a real option then replaces this one
+                    self.linter._arg_parser.add_argument(  # pylint: disable=protected-access
+                        f"--{option_name}", dest=option_name.replace("-", "_"), default=SUPPRESS, help=SUPPRESS
+                    )
+            self._deferred_plugins[modname] = placeholders
+        return modnames_to_import
+
+    def import_enabled_plugins(self) -> None:
+        """Import the deferred plugin modules with an enabled message, and parse the options of their checkers."""
+        modnames = [
+            modname
+            for modname, placeholders in self._deferred_plugins.items()
+            if any(self.is_message_enabled(msgid) for placeholder in placeholders for msgid in placeholder.msgs)
+        ]
+        if not modnames:
+            return
+        config = self.linter.config
+        enabled_msgids: list[str] = []
+        option_arguments: list[str] = []
+        for modname in modnames:
+            placeholders = self._deferred_plugins[modname]
+            self._deferred_plugins[modname] = []
+            for placeholder in placeholders:
+                self._checkers[placeholder.name] = [
+                    checker for checker in self._checkers[placeholder.name] if checker is not placeholder
+                ]
+                enabled_msgids.extend(msgid for msgid in placeholder.msgs if self.is_message_enabled(msgid))
+                for option_name in placeholder.option_names:
+                    dest = option_name.replace("-", "_")
+                    if dest in vars(config):
+                        option_arguments.append(f"--{option_name}={vars(config).pop(dest)}")
+        self.import_plugin_modules(modnames)
+        self.linter.msgs_store.get_message_definitions.cache_clear()  # it returned the placeholders' definitions
+        for msgid in enabled_msgids:
+            self.linter.enable(msgid)  # in case the checker disables it by default
+        try:
+            self.linter.config, _ = self.linter._arg_parser.parse_known_args(  # pylint: disable=protected-access
+                option_arguments, self.linter.config
+            )
+        except SystemExit:
+            sys.exit(32)  # like `pylint` for an invalid option value in a configuration file
+        for modname in modnames:
+            module_or_error = self._dynamic_plugins[modname]
+            if isinstance(module_or_error, ModuleNotFoundError):
+                self.linter.add_message("bad-plugin-value", args=(modname, module_or_error), line=0)
+            elif hasattr(module_or_error, "load_configuration"):
+                module_or_error.load_configuration(self.linter)
+
+    def parse_configuration_file_cached(self, arguments: list[str], parse: Callable[[list[str]], None]) -> None:
+        """Parse the options of a configuration file with `parse`, or restore them as a previous run resolved them."""
+        linter = self.linter
+        key = get_config_cache_key(
+            arguments,
+            linter._arg_parser,  # pylint: disable=protected-access
+            linter.msgs_store,
+            self._msgs_state,
+            type(self).__name__,
+            [*self._dynamic_plugins, *self._deferred_plugins],
+        )
+        cached_config = load_cached_config(key) if key else None
+        if cached_config is None:
+            stashed_before = {key: len(values) for key, values in self._stashed_messages.items()}
+            unrecognized_options: list[str] = []
+            try:
+                parse(arguments)
+            except _UnrecognizedOptionError as e:
+                unrecognized_options = e.options
+            if key and linter.config.persistent:
+                stashed_messages = [
+                    (symbol, values[stashed_before.get((modname, symbol), 0) :])
+                    for (modname, symbol), values in self._stashed_messages.items()
+                    if modname == linter.current_name
+                ]
+                cached_config = CachedConfig(
+                    dict(vars(linter.config)), dict(self._msgs_state), stashed_messages, unrecognized_options
+                )
+                save_cached_config(key, cached_config)
+        else:
+            vars(linter.config).update(cached_config.options)
+            self._msgs_state = dict(cached_config.msgs_state)
+            for symbol, values in cached_config.stashed_messages:
+                self._stashed_messages[(linter.current_name, symbol)].extend(values)
+            replay_callback_options(arguments, linter._arg_parser, linter.config)  # pylint: disable=protected-access
+            unrecognized_options = cached_config.unrecognized_options
+        if unrecognized_options:
+            raise _UnrecognizedOptionError(options=unrecognized_options)
+
+    def record_command_line_options(self, arguments: Sequence[str], positional_arguments: list[str]) -> list[str]:
+        """Remember the options of the command line, for the linters of the Workspaces, and return the rest."""
+        self._command_line_option_arguments = get_option_arguments(arguments, positional_arguments)
+        return positional_arguments
+
+    def make_workspace_linter(self, config_file: str) -> "XmlModuleLinter":
+        """Return a new linter of the same engine for a Workspace's robolintrc, with the plugins of the command line."""
+        raise NotImplementedError()
+
+    def check_workspaces(self, files_or_modules: Sequence[str], check: Callable[[Sequence[str]], None]) -> None:
+        """Lint the Methods configured by the run's configuration with `check`, and each Workspace with its own linter.
+
+        With `workspace-config`, the Methods with a robolintrc of their own are linted after the others, by a linter
+        configured by that robolintrc and the command line.  Their messages are reported here and their stats kept.
+        """
+        config = self.linter.config
+        if not config.workspace_config:
+            check(files_or_modules)
+            return
+        run_files_or_modules, filepaths_by_config_file = group_by_workspace_config(
+            files_or_modules, WorkspaceConfigFinder(self.config_file)
+        )
+        check(run_files_or_modules)
+        for config_file, filepaths in filepaths_by_config_file.items():
+            if config.fail_fast and not config.exit_zero and self._count_failing_messages():
+                break
+            self.check_workspace(config_file, filepaths)
+
+    def check_workspace(self, config_file: str, filepaths: list[str]) -> None:
+        """Lint the Methods of a Workspace with a linter configured by its robolintrc and the command line."""
+        workspace_linter = self.make_workspace_linter(config_file)
+        linter = cast(PyLinter, workspace_linter)
+        args = _config_initialization(
+            linter, [*self._command_line_option_arguments, *filepaths], config_file=config_file
+        )
+        linter.set_reporter(reporters.CollectingReporter())  # in case the options loaded other reporters
+        linter.check(args)
+        linter.generate_reports()
+        self.report_messages(linter.reporter.messages)
+        self.linter.stats = merge_stats([self.linter.stats, linter.stats])
+        self._workspace_msg_status |= linter.msg_status
+        self.linter.msg_status |= linter.msg_status
+
+    def report_messages(self, messages: list[Message]) -> None:
+        """Report messages emitted by another linter (or a worker process) as if they were emitted here."""
+        current_module: Optional[str] = None
+        for message in messages:
+            if message.module != current_module:
+                current_module = message.module
+                self.linter.reporter.on_set_current_module(message.module, message.abspath)
+            self.linter.reporter.handle_message(message)
+
+    def set_needed_checkers(self, needed_checkers: list[checkers.BaseChecker]) -> None:
+        """Decide how Methods need to be read and which checkers visit which steps."""
+        raw_checkers = [
+            checker
+            for checker in needed_checkers
+            if isinstance(checker, checkers.BaseRawFileChecker)
+            and (getattr(checker, "step_type_id", None) is None or cast(StepVisitor, checker).has_steps_to_check())
+        ]
+        self._stream_steps = self.linter.config.stream_steps and all(
+            getattr(checker, "streamable", False) for checker in raw_checkers
+        )
+        self._prefilter_step_type_ids = get_prefilter_step_type_ids(raw_checkers)
+        self._step_dispatcher = StepDispatcher(raw_checkers)
+
+    def apply_rule_profiles(self) -> None:
+        """Enable the messages of every rule profile, and report the messages of each profile separately.
+
+        Each profile starts from the messages enabled by the rest of the configuration, so a Method is checked once
+        for all of them.
+        """
+        if isinstance(self.linter.reporter, ProfilesReporter):
+            return  # already applied by a previous check
+        try:
+            profiles = parse_rule_profiles(self.linter.config.rule_profiles)
+        except InvalidRuleProfileError as e:
+            self.linter._arg_parser.error(str(e))  # pylint: disable=protected-access
+        if not profiles:
+            return
+        message_definitions = list(self.linter.msgs_store.messages)
+        base_msgids = {
+            definition.msgid for definition in message_definitions if self.is_message_enabled(definition.msgid)
+        }
+        unknown_messages: list[tuple[str, str]] = []
+        profile_msgids: list[tuple[RuleProfile, set[str]]] = []
+        for profile in profiles:
+            msgids = set(base_msgids)
+            for enable, msg_names in ((False, profile.disable), (True, profile.enable)):
+                for msg_name in msg_names:
+                    try:
+                        definitions = self._get_messages_to_set(msg_name, enable=enable)
+                    except UnknownMessageError:
+                        unknown_messages.append((profile.name, msg_name))
+                        continue
+                    if enable:
+                        msgids.update(definition.msgid for definition in definitions)
+                    else:
+                        msgids.difference_update(definition.msgid for definition in definitions)
+            profile_msgids.append((profile, msgids))
+        enabled_msgids = set().union(*(msgids for _, msgids in profile_msgids))
+        for definition in message_definitions:
+            if definition.msgid in enabled_msgids:
+                self.enable(definition.msgid)
+            else:
+                self.disable(definition.msgid)
+        self.linter.set_reporter(ProfilesReporter(self.linter.reporter, profile_msgids))
+        for profile_name, msg_name in unknown_messages:
+            self.linter.add_message(
+                "unknown-option-value", args=(f"rule-profiles: {profile_name}", msg_name), line=0, confidence=HIGH
+            )
+
+    def _count_failing_messages(self) -> int:
+        """Return how many of the messages reported so far make the run fail."""
+        if isinstance(self.linter.reporter, ProfilesReporter):
+            return self.linter.reporter.failing_message_count
+        failing_message_count = 0
+        for symbol, message_count in self.linter.stats.by_msg.items():
+            msgid = self.linter.msgs_store.get_message_definitions(symbol)[0].msgid
+            if MSG_TYPES_STATUS[msgid[0]]:
+                failing_message_count += message_count
+        return failing_message_count
+
+    def lint_files_in_order(
+        self, items: Sequence[T], filepath_of: Callable[[T], str], lint_file: Callable[[T], None]
+    ) -> None:
+        """Lint files one at a time, recording which ones fail.
+
+        With `--fail-fast`, the files most likely to fail are linted first and linting stops at the first that fails.
+        """
+        config = self.linter.config
+        records_failures = config.persistent and not config.exit_zero
+        if config.fail_fast:
+            items = prioritize(items, filepath_of, load_failed_filepaths() if records_failures else set())
+        linted_filepaths: list[str] = []
+        failed_filepaths: list[str] = []
+        for item in items:
+            failing_message_count = self._count_failing_messages()
+            self.lint_file_within_budget(filepath_of(item), functools.partial(lint_file, item))
+            filepath = os.path.abspath(filepath_of(item))
+            linted_filepaths.append(filepath)
+            if self._count_failing_messages() > failing_message_count:
+                failed_filepaths.append(filepath)
+                if config.fail_fast and not config.exit_zero:
+                    break
+        if records_failures:
+            save_failed_filepaths(linted_filepaths, failed_filepaths)
+
+    def lint_file_within_budget(self, filepath: str, lint_file: Callable[[], None]) -> None:
+        """Lint a file, in a worker process that is stopped when it exceeds `file-time-budget` or `file-memory-budget`.
+
+        The messages of the worker are reported here, and its stats (which started as a copy of the ones here) kept.  A
+        worker that crashed for any other reason than its budgets is reported like `pylint` reports a crash.
+        """
+        config = self.linter.config
+        if not CAN_FORK or not (config.file_time_budget or config.file_memory_budget):
+            lint_file()
+            return
+        try:
+            result, exceeded_budget = run_within_budget(
+                functools.partial(self._lint_file_in_worker, lint_file),
+                config.file_time_budget,
+                config.file_memory_budget,
+            )
+        except WorkerCrashedError as e:
+            self._set_current_module_of_file(filepath)
+            template_path = pylint.lint.pylinter.prepare_crash_report(e, filepath, self.linter.crash_file_path)
+            message = get_fatal_error_message(filepath, template_path)
+            self.linter.add_message("astroid-error", args=(filepath, message), confidence=HIGH)
+            return
+        if result is None:
+            self._set_current_module_of_file(filepath)
+            self.linter.add_message("file-budget-exceeded", line=0, args=(exceeded_budget,), confidence=HIGH)
+            return
+        messages, self.linter.stats, msg_status = result
+        self.linter.msg_status |= msg_status
+        self.report_messages(messages)
+
+    def _set_current_module_of_file(self, filepath: str) -> None:
+        modname = os.path.splitext(os.path.basename(filepath))[0]
+        self.linter.set_current_module(modname, filepath)
+        self.linter.file_state = FileState(modname, self.linter.msgs_store, is_base_filestate=True)
+
+    def _lint_file_in_worker(self, lint_file: Callable[[], None]) -> tuple[list[Message], LinterStats, int]:
+        reporter = reporters.CollectingReporter()
+        self.linter.set_reporter(reporter)
+        lint_file()
+        return reporter.messages, self.linter.stats, self.linter.msg_status
+
+    def read_xml_module(self, filepath: str) -> XmlModule:
+        """Read a Method the way the needed checkers require."""
+        if self._stream_steps:
+            return stream_xml_module_from_file(filepath, self._prefilter_step_type_ids)
+        xml_module = parse_xml_module_from_file(filepath, self._prefilter_step_type_ids)
+        xml_module.parse()  # build the steps once so that all checkers share them (and their parameter caches)
+        return xml_module
+
+    def add_syntax_error_message(self, error: Exception) -> None:
+        self.linter.add_message(
+            "syntax-error",
+            line=0,
+            col_offset=None,
+            args=f"Parsing failed: '{error}'",
+            confidence=HIGH,
+        )
+
+    def check_xml_module(self, node: XmlModule) -> bool:
+        """Check a Method with the needed checkers, returning `False` if it is ignored."""
+        if isinstance(node, SkippedXmlModule):
+            return True  # none of the checked step types (nor any directives) are in the Method
+        if isinstance(node, StreamedXmlModule):
+            self._disabled_intervals = {}
+            self._step_dispatcher.open_module(node)
+            try:
+                for step in node.iter_steps():
+                    if node.mentions_robolint:
+                        self.process_step_directives(step)
+                    self._step_dispatcher.dispatch(step)  # only `StepChecker`s are streamable
+            except XMLSyntaxError as e:  # only found once the streaming reaches it, the steps before are checked
+                self.add_syntax_error_message(e)
+            return True
+        self.process_tokens(node)
+        if self._ignore_file:
+            return False
+        # run raw and tokens checkers
+        for raw_checker in self._step_dispatcher.module_checkers:
+            raw_checker.process_module(node)
+        self._step_dispatcher.open_module(node)
+        for step in node.steps:
+            self._step_dispatcher.dispatch(step)
+        return True
+
+
+class RoboLinter(XmlModuleLinter, PyLinter):  # pylint: disable=too-many-ancestors # XML handling is shared
     """Override `PyLinter` to be able to parse XML files."""
 
+    def __init__(
+        self,
+        options: Options = (),
+        reporter: Optional[reporters.BaseReporter] = None,
+        option_groups: tuple[tuple[str, str], ...] = (),
+        pylintrc: Optional[str] = None,
+    ) -> None:
+        super().__init__(
+            options=options + make_robolint_options(),
+            reporter=reporter,
+            option_groups=option_groups,
+            pylintrc=pylintrc,
+        )
+        self._stream_steps = False
+        self._prefilter_step_type_ids: Optional[frozenset[str]] = None
+        self._step_dispatcher = StepDispatcher([])
+        self._disabled_intervals = {}
+        self._deferred_plugins = {}
+        self.register_checker(BudgetChecker(self))
+        self.config_file = pylintrc
+        self._run_options = options
+        self._command_line_plugins: list[str] = []
+        self._command_line_option_arguments: list[str] = []
+
+    def import_plugin_modules(self, modnames: list[str]) -> None:
+        PyLinter.load_plugin_modules(self, modnames)
+
+    def make_workspace_linter(self, config_file: str) -> "RoboLinter":
+        """Return a new `RoboLinter` set up the way `pylint`'s `Run` sets up the linter of the run."""
+        linter = RoboLinter(self._run_options, pylintrc=config_file)
+        linter.load_default_plugins()
+        linter.load_plugin_modules(self._command_line_plugins)
+        linter.disable("I")
+        linter.enable("c-extension-no-member")
+        linter._error_mode = self._error_mode  # pylint: disable=protected-access # `--errors-only` sets it on the run's
+        return linter
+
+    def _parse_configuration_file(self, arguments: list[str]) -> None:
+        self.parse_configuration_file_cached(arguments, super()._parse_configuration_file)
+
+    def _parse_command_line_configuration(self, arguments: Optional[Sequence[str]] = None) -> list[str]:
+        return self.record_command_line_options(arguments or [], super()._parse_command_line_configuration(arguments))
+
+    def check(self, files_or_modules: Sequence[str]) -> None:
+        self.apply_rule_profiles()
+        self.import_enabled_plugins()
+        self.check_workspaces(files_or_modules, super().check)
+
+    def generate_reports(self) -> Optional[int]:
+        score: Optional[int] = super().generate_reports()
+        if isinstance(self.reporter, ProfilesReporter):
+            self.msg_status = self.reporter.msg_status | self._workspace_msg_status
+        return score
+
+    def _get_asts(self, fileitems: Iterator[FileItem], data: Optional[str]) -> dict[FileItem, Optional[XmlModule]]:
+        """Only collect the Methods to lint, `_lint_files` reads each one just before linting it.
+
+        So only one document tree is in memory at a time, and `--fail-fast` doesn't read the Methods it won't lint.
+        """
+        return dict.fromkeys(fileitems)
+
+    def _lint_files(
+        self,
+        ast_mapping: dict[FileItem, Optional[XmlModule]],
+        check_astroid_module: Callable[[XmlModule], Optional[bool]],
+    ) -> None:
+        self.lint_files_in_order(
+            list(ast_mapping),
+            lambda fileitem: fileitem.filepath,
+            functools.partial(self._read_and_lint_file, check_astroid_module=check_astroid_module),
+        )
+
+    def _read_and_lint_file(
+        self, fileitem: FileItem, check_astroid_module: Callable[[XmlModule], Optional[bool]]
+    ) -> None:
+        super()._lint_files(super()._get_asts(iter([fileitem]), None), check_astroid_module)
+
+    def prepare_checkers(self) -> list[checkers.BaseChecker]:
+        """Return checkers needed for activated messages and reports, and decide how Methods need to be read."""
+        needed_checkers: list[checkers.BaseChecker] = super().prepare_checkers()
+        self.set_needed_checkers(needed_checkers)
+        return needed_checkers
+
     def get_ast(self, filepath: str, modname: str, data: Optional[str] = None) -> Optional[XmlModule]:
         """Return an `ElementTree` representation of a module or a string."""
         try:
-            return parse_xml_module_from_file(filepath)
-        except ParseError as e:
-            self.add_message(
-                "syntax-error",
-                line=0,
-                col_offset=None,
-                args=f"Parsing failed: '{e}'",
-                confidence=HIGH,
-            )
+            return self.read_xml_module(filepath)
+        except (ParseError, XMLSyntaxError) as e:
+            self.add_syntax_error_message(e)
         except Exception as e:
             traceback.print_exc()
             # We raise BuildingError here as this is essentially an `astroid` issue
@@ -104,10 +782,4 @@ class RoboLinter(RoboLintMessageStateHandler, PyLinter):
         tokencheckers: list[checkers.BaseTokenChecker],
     ) -> Optional[bool]:
         """Check given element tree with given walker and checkers."""
-        self.process_tokens(node)
-        if self._ignore_file:
-            return False
-        # run raw and tokens checkers
-        for raw_checker in rawcheckers:
-            raw_checker.process_module(node)
-        return True
+        return self.check_xml_module(node)
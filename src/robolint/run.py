@@ -8,6 +8,7 @@ from typing import Sequence
 
 import pylint.lint.pylinter
 from pylint.lint.run import Run
+from robolint.native import NativeRun
 from robolint.robolinter import RoboLinter
 from robolint.utils import robolint_overrides
 
@@ -34,14 +35,40 @@ class RobolintRun(Run):
     LinterClass = RoboLinter
 
 
+ENGINES = ("pylint", "native")
+
+
+def pop_engine_option(argv: Sequence[str]) -> tuple[str, list[str]]:
+    """Return the engine chosen with `--engine=<engine>` (`pylint` by default) and the remaining arguments."""
+    engine = "pylint"
+    remaining_args: list[str] = []
+    args = iter(argv)
+    for arg in args:
+        if arg == "--engine":
+            engine = next(args, "")
+        elif arg.startswith("--engine="):
+            engine = arg.split("=", 1)[1]
+        else:
+            remaining_args.append(arg)
+    if engine not in ENGINES:
+        print(f"--engine must be one of {', '.join(ENGINES)}, not '{engine}'", file=sys.stderr)  # allow-print
+        sys.exit(32)
+    return engine, remaining_args
+
+
 # copied from `pylint's` `__init__.py`
 def run_pylint(argv: Optional[Sequence[str]] = None) -> int:
     """Run pylint.
 
-    `argv` can be a sequence of strings normally supplied as arguments on the command line
+    `argv` can be a sequence of strings normally supplied as arguments on the command line.  `--engine=native` lints
+    with the `NativeLinter` instead of `pylint`'s full machinery.
     """
     try:
-        RobolintRun(argv or sys.argv[1:])
+        engine, args = pop_engine_option(argv or sys.argv[1:])
+        if engine == "native":
+            NativeRun(args)
+        else:
+            RobolintRun(args)
     except KeyboardInterrupt:
         sys.exit(2)
     return 0
@@ -0,0 +1,51 @@
+"""Decide in which order to lint Methods, so that `--fail-fast` finds a failing one as early as possible."""
+import json
+import os
+import sys
+from typing import Callable
+from typing import Iterable
+from typing import TypeVar
+
+from pylint.constants import PYLINT_HOME
+
+FAILED_FILEPATHS_PATH = os.path.join(PYLINT_HOME, "robolint-failed-files.json")
+
+T = TypeVar("T")
+
+
+def load_failed_filepaths() -> set[str]:
+    """Return the absolute paths of the Methods that failed when they were last linted."""
+    try:
+        with open(FAILED_FILEPATHS_PATH, encoding="utf-8") as failed_file:
+            return set(json.load(failed_file))
+    except (OSError, ValueError):
+        return set()
+
+
+def save_failed_filepaths(linted_filepaths: Iterable[str], failed_filepaths: Iterable[str]) -> None:
+    """Record which of the Methods just linted failed; the others keep what was recorded when they were last linted."""
+    recorded_filepaths = (load_failed_filepaths() - set(linted_filepaths)) | set(failed_filepaths)
+    try:
+        os.makedirs(os.path.dirname(FAILED_FILEPATHS_PATH), exist_ok=True)
+        with open(FAILED_FILEPATHS_PATH, "w", encoding="utf-8") as failed_file:
+            json.dump(sorted(recorded_filepaths), failed_file)
+    except OSError as e:
+        print(f"Unable to create file {FAILED_FILEPATHS_PATH}: {e}", file=sys.stderr)  # allow-print
+
+
+def _get_mtime(filepath: str) -> float:
+    try:
+        return os.path.getmtime(filepath)
+    except OSError:
+        return 0.0
+
+
+def prioritize(items: Iterable[T], filepath_of: Callable[[T], str], failed_filepaths: set[str]) -> list[T]:
+    """Order the files most likely to fail first: those that failed last time, then the most recently modified."""
+    return sorted(
+        items,
+        key=lambda item: (
+            os.path.abspath(filepath_of(item)) not in failed_filepaths,
+            -_get_mtime(filepath_of(item)),
+        ),
+    )
@@ -6,6 +6,7 @@ from typing import NoReturn
 import pylint
 from pylint.testutils import CheckerTestCase
 from robolint.run import robolint_prepare_crash_report
+from robolint.utils import robolint_overrides
 
 
 # arbitrary exit code that's not 1 (that's reserved in `pre-commit` for modifying files)
@@ -20,4 +21,5 @@ def prepare_crash_report_and_exit(exception: Exception, filepath: str, crash_fil
 
 class RobolintCheckerTestCase(CheckerTestCase):
     def setup_class(self) -> None:
+        robolint_overrides()
         pylint.lint.pylinter.prepare_crash_report = prepare_crash_report_and_exit
@@ -1,24 +1,196 @@
 """General utilities."""
 
 import argparse
+from contextlib import contextmanager
+import heapq
+import mmap
+from operator import attrgetter
+import os
 import re
+import sys
+import warnings
 from typing import Any
+from typing import Callable
+from typing import Collection
+from typing import Iterator
+from typing import Optional
+from typing import Sequence
 from typing import Union
+from uuid import UUID
 
 from lxml.etree import _Element
 from lxml.etree import _ElementTree
+from lxml.etree import fromstring
+from lxml.etree import iterparse
 from lxml.etree import parse
+from lxml.etree import XMLParser
 import pylint
-from pylint.testutils import CheckerTestCase
 from stdlib_utils import find_exactly_one_xml_element
+from stdlib_utils import NoMatchingXmlElementError
 
 
-class XmlModule:  # pylint: disable=too-few-public-methods
+ParameterValue = Union[str, bool, int, float, UUID]
+
+METHOD_XML_PARSER_OPTIONS = {
+    "resolve_entities": False,  # entities are never expanded, so entity-expansion bombs and external entities are inert
+    "no_network": True,
+    "load_dtd": False,
+    "huge_tree": False,  # keep `libxml2`'s limits on tree depth and text size
+    "remove_blank_text": True,  # the indentation whitespace isn't needed, and is a sizeable share of the nodes
+    "collect_ids": False,  # MM4 doesn't use `xml:id`, so there's no need for a hash table of them
+}
+METHOD_XML_PARSER = XMLParser(**METHOD_XML_PARSER_OPTIONS)  # type: ignore[arg-type] # shared wherever Methods are parsed
+
+MMAP_THRESHOLD_BYTES = 1024 * 1024  # files at least this large are memory-mapped instead of read into memory
+_LINE_COUNT_CHUNK_BYTES = 1024 * 1024
+UTF16_BOMS = (b"\xff\xfe", b"\xfe\xff")  # step type IDs and directives aren't ASCII bytes in these files
+
+# a step's own properties, not those of the steps within it (e.g. in a nested `Steps` collection)
+STEP_COMMAND_ID_PATH = 'Properties/Simple[@name="CommandId"]'
+STEP_PARAMETERS_PATH = 'Properties/Dictionary[@name="Parameters"]'
+
+
+def decode_boolean(value: str) -> bool:
+    lowered = value.lower()  # .NET writes `True` and `False`, but parses them case-insensitively
+    if lowered == "true":
+        return True
+    if lowered == "false":
+        return False
+    raise ValueError(f"'{value}' is not a valid System.Boolean")
+
+
+def decode_number(value: str) -> Union[int, float]:
+    """Decode a number, keeping integral values as `int` so they display the same way they do in MM4."""
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+DOTNET_TYPE_DECODERS: dict[str, Callable[[str], ParameterValue]] = {
+    "System.String": str,
+    "System.Boolean": decode_boolean,
+    "System.Byte": int,
+    "System.SByte": int,
+    "System.Int16": int,
+    "System.UInt16": int,
+    "System.Int32": int,
+    "System.UInt32": int,
+    "System.Int64": int,
+    "System.UInt64": int,
+    "System.Single": decode_number,
+    "System.Double": decode_number,
+    "System.Decimal": decode_number,
+    "System.Guid": UUID,
+}
+
+
+def decode_parameter_value(value: str, dotnet_type: str) -> ParameterValue:
+    """Convert a raw parameter value to a native value based on its .NET type, e.g. `System.Double, mscorlib`.
+
+    Types without a decoder (such as enumerations) are left as strings.
+    """
+    type_name = dotnet_type.split(",", 1)[0].strip()
+    decoder = DOTNET_TYPE_DECODERS.get(type_name)
+    if decoder is None:
+        return value
+    return decoder(value)
+
+
+class XmlModule:
     """Mimic an `astroid` module but for XML."""
 
     file: str  # needed for `self.current_file`
     tolineno: int  # needed for `pylint.utils.file_state.FileState`
     tree: _ElementTree
+    mentions_robolint: bool = True  # whether `robolint` appears anywhere in the raw file, so it may have directives
+    _steps: list["MM4Step"]
+    _steps_by_type: dict[str, list["MM4Step"]]
+    _analyses: dict[Callable[["XmlModule"], Any], Any]
+
+    def parse(self) -> None:
+        self._steps = parse_steps_from_etree(self.tree.getroot())
+
+    @property
+    def steps(self) -> list["MM4Step"]:
+        """The steps of the Method, parsed once and shared by every checker."""
+        try:
+            return self._steps
+        except AttributeError:
+            pass
+        self.parse()
+        return self._steps
+
+    def iter_steps(self) -> Iterator["MM4Step"]:
+        return iter(self.steps)
+
+    @property
+    def steps_by_type(self) -> dict[str, list["MM4Step"]]:
+        """The steps grouped by step type ID, each group in Method order, built once and shared by every checker."""
+        try:
+            return self._steps_by_type
+        except AttributeError:
+            pass
+        steps_by_type: dict[str, list[MM4Step]] = {}
+        for step in self.steps:
+            steps_by_type.setdefault(step.step_type_id, []).append(step)
+        self._steps_by_type = steps_by_type
+        return steps_by_type
+
+    @property
+    def analyses(self) -> dict[Callable[["XmlModule"], Any], Any]:
+        """The results of the analysis passes run on this module so far, see `robolint.analysis`."""
+        try:
+            return self._analyses
+        except AttributeError:
+            pass
+        self._analyses = {}
+        return self._analyses
+
+    def steps_of_types(self, step_type_ids: Collection[str]) -> list["MM4Step"]:
+        """The steps of the given types in Method order, or all of the steps if no types are given."""
+        if not step_type_ids:
+            return self.steps
+        groups = [
+            self.steps_by_type[step_type_id] for step_type_id in step_type_ids if step_type_id in self.steps_by_type
+        ]
+        if len(groups) == 1:
+            return groups[0]
+        return list(heapq.merge(*groups, key=attrgetter("step_index")))
+
+
+class StreamedXmlModule(XmlModule):
+    """An `XmlModule` whose steps are read from the file one at a time while they are being checked.
+
+    The document tree is only built if something needs more than the current step, such as `steps` or `tree`, and then
+    the whole file is parsed as for an `XmlModule`.
+    """
+
+    _tree: _ElementTree
+
+    @property
+    def tree(self) -> _ElementTree:
+        try:
+            return self._tree
+        except AttributeError:
+            pass
+        with open_file_buffer(self.file) as buffer:
+            self._tree = parse_xml_buffer(buffer, self.file)
+        return self._tree
+
+    @tree.setter
+    def tree(self, tree: _ElementTree) -> None:
+        self._tree = tree
+
+    def iter_steps(self) -> Iterator["MM4Step"]:
+        return iterparse_steps(self.file)
+
+
+class SkippedXmlModule(XmlModule):
+    """An `XmlModule` whose raw bytes contain none of the step types being checked, so its tree was never built."""
+
+    def parse(self) -> None:
+        self._steps = []
 
 
 class MM4Step:
@@ -30,10 +202,12 @@ class MM4Step:
         self.xml_node = xml_node
         self.step_index = step_index
         self.step_type_id = step_type_id
-        self._parameters: dict[str, str] = {}
+        self._parameters: Optional[dict[str, str]] = None
+        self._parameter_types: dict[str, str] = {}
+        self._typed_parameters: dict[str, ParameterValue] = {}
 
     def parse(self) -> None:
-        self._parameters_node = find_exactly_one_xml_element(self.xml_node, './/Dictionary[@name="Parameters"]')
+        self._parameters_node = find_exactly_one_xml_element(self.xml_node, STEP_PARAMETERS_PATH)
 
     @property
     def parameters_node(self) -> _Element:
@@ -44,18 +218,113 @@ class MM4Step:
         self.parse()
         return self._parameters_node
 
-    def get_parameter(self, parameter_name: str) -> str:
-        """Get a parameter value from Method Manager XML."""
+    def _decode_parameters(self) -> dict[str, str]:
+        """Decode every `Item` of the `Parameters` dictionary, including those nested in a `Complex` or `Collection`.
+
+        The value of an item is its only typed `Simple`, at any depth, so an item holding several values has none.
+        """
+        parameters: dict[str, str] = {}
+        for item_node in self.parameters_node.iter("Item"):
+            name = item_node[0].get("value") if len(item_node) else None
+            value_nodes = item_node.findall(".//Simple[@type]")
+            if name is None or len(value_nodes) != 1 or name in parameters:
+                continue
+            value_node = value_nodes[0]
+            name = sys.intern(name)  # the same names repeat in every step of the Method
+            parameters[name] = value_node.get("value", "")
+            self._parameter_types[name] = sys.intern(value_node.get("type", ""))
+        return parameters
+
+    @property
+    def parameters(self) -> dict[str, str]:
+        """All the parameters of the step, decoded in a single pass over the `Parameters` dictionary."""
+        if self._parameters is None:
+            self._parameters = self._decode_parameters()
+        return self._parameters
+
+    @property
+    def parameter_types(self) -> dict[str, str]:
+        """The .NET type of each parameter, e.g. `System.Double, mscorlib`."""
+        self.parameters  # pylint: disable=pointless-statement # types are decoded along with the values
+        return self._parameter_types
+
+    def get_typed_parameter(self, parameter_name: str) -> ParameterValue:
+        """Get a parameter value converted to its native type, decoding it only the first time."""
         try:
-            return self._parameters[parameter_name]
+            return self._typed_parameters[parameter_name]
         except KeyError:
             pass
-        parent_node = find_exactly_one_xml_element(self.parameters_node, f'.//Simple[@value="{parameter_name}"]...')
-        value_node = find_exactly_one_xml_element(parent_node, ".//Simple[@type]")
-        value = value_node.attrib["value"]
-        if not isinstance(value, str):
-            raise NotImplementedError(f"The value should always be str, but {value} was type {type(value)}")
-        self._parameters[parameter_name] = value
+        value = decode_parameter_value(self.get_parameter(parameter_name), self.parameter_types[parameter_name])
+        self._typed_parameters[parameter_name] = value
+        return value
+
+    def get_number_parameter(self, parameter_name: str) -> Union[int, float]:
+        """Get a numeric parameter, including numbers that MM4 stores as a `System.String` (e.g. a loop's start)."""
+        value = self.get_typed_parameter(parameter_name)
+        if isinstance(value, str):
+            value = decode_number(value)
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise TypeError(f"The parameter '{parameter_name}' should be a number, but was {value!r}")
+        return value
+
+    def to_record(self) -> "MM4StepRecord":
+        """Copy what is decoded from the step into a compact record that doesn't keep the XML of the step alive."""
+        return MM4StepRecord(
+            step_index=self.step_index,
+            step_type_id=sys.intern(self.step_type_id),
+            line=self.xml_node.sourceline,  # type: ignore[attr-defined] # the step node is an element, not a tree
+            parameters=self.parameters,
+            parameter_types=self.parameter_types,
+        )
+
+    def has_parameter(self, parameter_name: str) -> bool:
+        return parameter_name in self.parameters
+
+    def get_parameter(self, parameter_name: str, default: Optional[str] = None) -> str:
+        """Get a parameter value from Method Manager XML.
+
+        Raises `NoMatchingXmlElementError` if the parameter is absent and no default is given.
+        """
+        try:
+            return self.parameters[parameter_name]
+        except KeyError:
+            pass
+        if default is not None:
+            return default
+        raise NoMatchingXmlElementError(self.parameters_node, f'.//Simple[@value="{parameter_name}"]...')
+
+
+class MM4StepRecord:
+    """Compact record of an MM4 Step, for holding every step of a large Method in memory at once.
+
+    It holds no reference to the XML of the step, so once the steps are decoded the document tree can be freed.
+    """
+
+    __slots__ = ("step_index", "step_type_id", "line", "parameters", "parameter_types")
+
+    def __init__(
+        self,
+        *,
+        step_index: int,
+        step_type_id: str,
+        line: Optional[int],
+        parameters: dict[str, str],
+        parameter_types: dict[str, str],
+    ) -> None:
+        self.step_index = step_index
+        self.step_type_id = step_type_id
+        self.line = line
+        self.parameters = parameters
+        self.parameter_types = parameter_types
+
+    def has_parameter(self, parameter_name: str) -> bool:
+        return parameter_name in self.parameters
+
+    def get_parameter(self, parameter_name: str, default: Optional[str] = None) -> str:
+        """Get a parameter value, raising `KeyError` if it is absent and no default is given."""
+        value = self.parameters.get(parameter_name, default)
+        if value is None:
+            raise KeyError(parameter_name)
         return value
 
 
@@ -73,8 +342,8 @@ def parse_steps_from_etree(root: _Element) -> list[MM4Step]:
         if collection_type != "Steps":
             continue
         steps_node = find_exactly_one_xml_element(collection, "Items")
-        for step_idx, step_node in enumerate(steps_node.iter("Complex")):
-            step_id_node = find_exactly_one_xml_element(step_node, './/Simple[@name="CommandId"]')
+        for step_idx, step_node in enumerate(steps_node.findall("Complex")):  # a `Complex` within a step isn't one
+            step_id_node = find_exactly_one_xml_element(step_node, STEP_COMMAND_ID_PATH)
             step_type_id = step_id_node.attrib["value"]
             parsed_steps.append(MM4Step(xml_node=step_node, step_index=step_idx, step_type_id=step_type_id))
         break
@@ -82,22 +351,145 @@ def parse_steps_from_etree(root: _Element) -> list[MM4Step]:
     return parsed_steps
 
 
+def _is_steps_collection(element: Optional[_Element]) -> bool:
+    return element is not None and element.tag == "Collection" and element.get("name") == "Steps"
+
+
+def _is_within_steps_collection(element: _Element) -> bool:
+    return any(_is_steps_collection(ancestor) for ancestor in element.iterancestors("Collection"))
+
+
+def _is_method_step(element: _Element) -> bool:
+    """Whether an element is a step of the Method, rather than a part of one (such as a step of a nested collection)."""
+    items_node = element.getparent()
+    if element.tag != "Complex" or items_node is None or items_node.tag != "Items":
+        return False
+    steps_collection = items_node.getparent()
+    return (
+        steps_collection is not None
+        and _is_steps_collection(steps_collection)
+        and not _is_within_steps_collection(steps_collection)
+    )
+
+
+def _remove_previous_siblings(element: _Element) -> None:
+    parent = element.getparent()
+    while parent is not None and element.getprevious() is not None:
+        del parent[0]
+
+
+def iterparse_steps(filename: str) -> Iterator[MM4Step]:
+    """Parse the steps from an XML file one at a time, with memory use bounded by the size of a single step.
+
+    Each step's XML is cleared as soon as iteration moves on to the next step, so a step must not be used after that.
+    The rest of the Method, such as its worktable, is cleared as it is read.  A `Steps` collection within a step is
+    part of that step, as in `parse_steps_from_etree`.
+    """
+    step_idx = 0
+    for _, element in iterparse(filename, events=("end",), tag=("Collection", "Complex"), **METHOD_XML_PARSER_OPTIONS):
+        if not _is_within_steps_collection(element):
+            if _is_steps_collection(element):
+                return  # only the first `Steps` collection is parsed, the same as `parse_steps_from_etree`
+            element.clear()
+            _remove_previous_siblings(element)
+            continue
+        if not _is_method_step(element):
+            continue  # within a step
+        step_id_node = find_exactly_one_xml_element(element, STEP_COMMAND_ID_PATH)
+        yield MM4Step(xml_node=element, step_index=step_idx, step_type_id=step_id_node.attrib["value"])
+        step_idx += 1
+        element.clear()
+        _remove_previous_siblings(element)
+
+
+def parse_step_records(filename: str) -> list[MM4StepRecord]:
+    """Parse compact records of all the steps from an XML file, without ever holding the whole document tree."""
+    return [step.to_record() for step in iterparse_steps(filename)]
+
+
 def parse_steps(filename: str) -> list[MM4Step]:
     """Parse the steps from an XML file."""
-    element_tree = parse(filename)
+    element_tree = parse(filename, METHOD_XML_PARSER)
     root = element_tree.getroot()
     return parse_steps_from_etree(root)
 
 
-def parse_xml_module_from_file(filepath: str) -> XmlModule:
+@contextmanager
+def open_file_buffer(filepath: str) -> Iterator[Union[bytes, mmap.mmap]]:
+    """Read the raw bytes of a file exactly once.
+
+    Large files are memory-mapped so that the OS page cache backs the buffer rather than a copy in Python memory.
+    """
+    with open(filepath, "rb") as file:
+        if os.fstat(file.fileno()).st_size < MMAP_THRESHOLD_BYTES:
+            yield file.read()
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+            yield mapped_file
+
+
+def count_lines(buffer: Union[bytes, mmap.mmap]) -> int:
+    """Count lines the same way iterating over the file in text mode would."""
     line_count = 0
-    with open(filepath, encoding="utf-8") as xml_file:
-        for _, _ in enumerate(xml_file):
-            line_count += 1
-    xml = XmlModule()
-    xml.tolineno = line_count + 1  # needed for `pylint.utils.file_state.FileState`
-    xml.file = filepath  # needed for `self.current_file`
-    xml.tree = parse(filepath)
+    for start in range(0, len(buffer), _LINE_COUNT_CHUNK_BYTES):
+        line_count += buffer[start : start + _LINE_COUNT_CHUNK_BYTES].count(b"\n")
+    if len(buffer) > 0 and buffer[-1:] != b"\n":
+        line_count += 1  # the final line has no trailing newline
+    return line_count
+
+
+def mentions_any_step_type(buffer: Union[bytes, mmap.mmap], step_type_ids: Collection[str]) -> bool:
+    """Return whether any of the step type IDs appear anywhere in the raw bytes of a Method.
+
+    This can give false positives (e.g. an ID inside a comment) but never false negatives for UTF-8 Methods, so it is
+    only used to rule files out. Files starting with a UTF-16 byte order mark are always considered to match.
+    """
+    if buffer[:2] in UTF16_BOMS:
+        return True
+    return any(buffer.find(step_type_id.encode("ascii")) != -1 for step_type_id in step_type_ids)
+
+
+def mentions_robolint(buffer: Union[bytes, mmap.mmap]) -> bool:
+    """Return whether `robolint` appears anywhere in the raw bytes of a Method, so that it may have directives.
+
+    As in `mentions_any_step_type`, files starting with a UTF-16 byte order mark are always considered to mention it.
+    """
+    if buffer[:2] in UTF16_BOMS:
+        return True
+    return buffer.find(b"robolint") != -1
+
+
+def parse_xml_buffer(buffer: Union[bytes, mmap.mmap], filepath: str) -> _ElementTree:
+    """Parse an in-memory buffer of XML, without going back to the disk."""
+    if isinstance(buffer, bytes):
+        return fromstring(buffer, METHOD_XML_PARSER, base_url=filepath).getroottree()
+    return parse(buffer, METHOD_XML_PARSER, base_url=filepath)  # type: ignore[arg-type] # `lxml` reads memory-mapped files through their file-like interface
+
+
+def parse_xml_module_from_file(filepath: str, step_type_ids: Optional[Collection[str]] = None) -> XmlModule:
+    """Parse a Method, unless `step_type_ids` are given and none of them appear in it."""
+    with open_file_buffer(filepath) as buffer:
+        if step_type_ids is not None and not mentions_any_step_type(buffer, step_type_ids):
+            xml: XmlModule = SkippedXmlModule()
+        else:
+            xml = XmlModule()
+            xml.tree = parse_xml_buffer(buffer, filepath)
+            xml.mentions_robolint = mentions_robolint(buffer)
+        xml.file = filepath  # needed for `self.current_file`
+        xml.tolineno = count_lines(buffer) + 1  # needed for `pylint.utils.file_state.FileState`
+    return xml
+
+
+def stream_xml_module_from_file(filepath: str, step_type_ids: Optional[Collection[str]] = None) -> XmlModule:
+    """Prepare a Method for streaming its steps, unless `step_type_ids` are given and none of them appear in it."""
+    with open_file_buffer(filepath) as buffer:
+        if step_type_ids is not None and not mentions_any_step_type(buffer, step_type_ids):
+            xml: XmlModule = SkippedXmlModule()
+        else:
+            xml = StreamedXmlModule()
+            xml.mentions_robolint = mentions_robolint(buffer)
+        xml.file = filepath  # needed for `self.current_file`
+        xml.tolineno = count_lines(buffer) + 1  # needed for `pylint.utils.file_state.FileState`
     return xml
 
 
@@ -112,6 +504,61 @@ def robolint_regex_transformer(value: str) -> re.Pattern[str]:
         raise argparse.ArgumentTypeError(msg) from err
 
 
+_SCOPED_FLAGS = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"), (re.VERBOSE, "x"))
+_GROUP_REFERENCE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")  # `\1`, `(?P=name)` and `(?(1)yes|no)`
+
+
+def compile_alternation(patterns: Sequence[re.Pattern[str]]) -> Optional[re.Pattern[str]]:
+    """Return one pattern matching where any of `patterns` matches, or `None` if they can't be combined.
+
+    They can't be when one refers to its own groups by number or name, which the other patterns would renumber or
+    could clash with, or sets flags inline that only apply to a whole pattern.
+    """
+    alternatives = []
+    for pattern in patterns:
+        if _GROUP_REFERENCE.search(pattern.pattern):
+            return None
+        scoped_flags = "".join(letter for flag, letter in _SCOPED_FLAGS if pattern.flags & flag)
+        end = "\n)" if pattern.flags & re.VERBOSE else ")"  # a verbose pattern can end with a comment
+        alternatives.append(f"(?{scoped_flags}:{pattern.pattern}{end}")
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", DeprecationWarning)  # inline global flags, an error from Python 3.11
+            return re.compile("|".join(alternatives))
+    except (re.error, DeprecationWarning):
+        return None
+
+
+class RegexpCsvMatcher:
+    """Match values at their start against the patterns of a `regexp_csv` option, compiled into one alternation.
+
+    The verdict for each distinct value is remembered: a Method names only a handful of motion profiles and plates,
+    across thousands of steps.
+    """
+
+    def __init__(self, patterns: Sequence[re.Pattern[str]]) -> None:
+        self.patterns = patterns
+        self.patterns_str = ",".join(pattern.pattern for pattern in patterns)  # as given, for messages
+        self._alternation = compile_alternation(patterns) if patterns else None
+        self._verdicts: dict[str, bool] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self.patterns)
+
+    def matches(self, value: str) -> bool:
+        """Return whether any of the patterns matches the start of `value`."""
+        try:
+            return self._verdicts[value]
+        except KeyError:
+            pass
+        if self._alternation is None:
+            verdict = any(pattern.match(value) for pattern in self.patterns)
+        else:
+            verdict = self._alternation.match(value) is not None
+        self._verdicts[value] = verdict
+        return verdict
+
+
 def robolint_regexp_validator(
     _: Any, name: str, value: Union[str, re.Pattern[str]]  # pylint: disable=unused-argument
 ) -> re.Pattern[str]:
@@ -127,8 +574,3 @@ def robolint_overrides() -> None:
     pylint.config.argument._TYPE_TRANSFORMERS["regexp"] = robolint_regex_transformer  # pylint: disable=protected-access
     pylint.config.option._regexp_validator = robolint_regexp_validator  # pylint: disable=protected-access
     pylint.config.option.VALIDATORS["regexp"] = robolint_regex_transformer
-
-
-class RobolintCheckerTestCase(CheckerTestCase):
-    def setup_class(self) -> None:
-        robolint_overrides()
@@ -0,0 +1,72 @@
+"""Per-workspace configuration: lint each Method with the robolintrc of its MM4 Workspace, all in a single run.
+
+With `workspace-config`, the robolintrc closest to a Method, in its directory or the ones above it, configures it
+instead of the robolintrc of the run.  The search stops at the directory of the run's configuration file, which is also
+used for the Methods without a closer robolintrc.  Which robolintrc a directory resolves to is only looked up once.
+"""
+import collections
+import os
+from typing import Iterable
+from typing import Optional
+from typing import Sequence
+
+WORKSPACE_CONFIG_FILENAMES = ("robolintrc", ".robolintrc")
+
+
+class WorkspaceConfigFinder:  # pylint: disable=too-few-public-methods # it only keeps the lookups of `find`
+    """Find the robolintrc of the Workspace of each Method, remembering what each directory resolves to."""
+
+    def __init__(self, config_file: Optional[str]) -> None:
+        self.config_file = os.path.abspath(config_file) if config_file else None
+        self._root_directory = os.path.dirname(self.config_file) if self.config_file else None
+        self._config_file_by_directory: dict[str, Optional[str]] = {}
+
+    def find(self, filepath: str) -> Optional[str]:
+        """Return the robolintrc of a Method's Workspace, or `None` if the configuration of the run applies to it."""
+        config_file = self._find_in_directory(os.path.dirname(os.path.abspath(filepath)))
+        return None if config_file == self.config_file else config_file
+
+    def _find_in_directory(self, directory: str) -> Optional[str]:
+        if directory in self._config_file_by_directory:
+            return self._config_file_by_directory[directory]
+        config_file: Optional[str] = None
+        for filename in WORKSPACE_CONFIG_FILENAMES:
+            if os.path.isfile(os.path.join(directory, filename)):
+                config_file = os.path.join(directory, filename)
+                break
+        else:
+            parent_directory = os.path.dirname(directory)
+            if directory not in (self._root_directory, parent_directory):
+                config_file = self._find_in_directory(parent_directory)
+        self._config_file_by_directory[directory] = config_file
+        return config_file
+
+
+def group_by_workspace_config(
+    files_or_modules: Sequence[str], finder: WorkspaceConfigFinder
+) -> tuple[list[str], dict[str, list[str]]]:
+    """Split the Methods to lint into those configured by the run's robolintrc, and those of each other robolintrc.
+
+    Directories are left to the run's configuration, the groups are in the order their first Method was given.
+    """
+    run_files_or_modules: list[str] = []
+    filepaths_by_config_file: dict[str, list[str]] = {}
+    for file_or_module in files_or_modules:
+        config_file = finder.find(file_or_module) if os.path.isfile(file_or_module) else None
+        if config_file is None:
+            run_files_or_modules.append(file_or_module)
+        else:
+            filepaths_by_config_file.setdefault(config_file, []).append(file_or_module)
+    return run_files_or_modules, filepaths_by_config_file
+
+
+def get_option_arguments(arguments: Iterable[str], positional_arguments: Iterable[str]) -> list[str]:
+    """Return the command line arguments without the Methods (and directories) to lint, to configure other linters."""
+    positional_argument_counts = collections.Counter(positional_arguments)
+    option_arguments: list[str] = []
+    for argument in reversed(list(arguments)):  # the Methods to lint usually come last
+        if positional_argument_counts[argument]:
+            positional_argument_counts[argument] -= 1
+        else:
+            option_arguments.append(argument)
+    return option_arguments[::-1]
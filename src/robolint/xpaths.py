@@ -0,0 +1,41 @@
+"""Registry of precompiled XPath expressions.
+
+Calling `.xpath()` with a string makes `lxml` compile the expression on every call, so expressions evaluated for every
+step or every labware are compiled once here, with their namespaces bound, and shared.
+"""
+from lxml.etree import XPath
+
+XPATH_NAMESPACES = {"re": "http://exslt.org/regular-expressions"}
+
+_REGISTRY: dict[str, XPath] = {}
+
+
+def get_xpath(expression: str) -> XPath:
+    """Return the compiled `XPath` for an expression, compiling it the first time it is requested."""
+    try:
+        return _REGISTRY[expression]
+    except KeyError:
+        pass
+    compiled_xpath = XPath(expression, namespaces=XPATH_NAMESPACES)
+    _REGISTRY[expression] = compiled_xpath
+    return compiled_xpath
+
+
+LABWARE_STACK_ELEMENT_PROPERTIES = get_xpath(
+    "/Complex/Properties/Collection[@name='WorktableResourceMaps']/Items"
+    "/Complex/Properties/Collection[@name='ResourceStacks']/Items"
+    "/Complex/Properties/Collection[@name='LabwareStackElems']/Items"
+    "/Complex/Properties"
+)
+LABWARE_NAME = get_xpath("./Simple[@name='LabwareName']")
+LABWARE_STACK_ELEMENT_NAME = get_xpath("./Simple[@name='Name']")
+
+_UPPERCASE_AND_DIGITS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+_CHARACTER_CLASSES = "AAAAAAAAAAAAAAAAAAAAAAAAAA0000000000"
+_WELL_NAME_SHAPE = f"translate(substring-before(@value, '.volumeVariable'), '{_UPPERCASE_AND_DIGITS}', '{_CHARACTER_CLASSES}')"
+# Equivalent to `re:match(@value, '^[A-Z]{1,2}\d{2}\.volumeVariable$')`, but evaluated natively by `libxml2` rather than
+# calling back into Python for every parameter, which made it the most expensive XPath in the `VariableNameChecker`
+WELL_VOLUME_VARIABLE_XPATH = (
+    "Items/Item/Simple[contains(@value, '.volumeVariable') and substring-after(@value, '.volumeVariable') = ''"
+    f" and ({_WELL_NAME_SHAPE} = 'A00' or {_WELL_NAME_SHAPE} = 'AA00')]/../Simple[2]"
+)
@@ -1,11 +1,14 @@
 # -*- coding: utf-8 -*-
 """`Pytest` configuration."""
 import os
+from pathlib import Path
 import sys
 from unittest.mock import MagicMock
 
 import pytest
 from pytest_mock import MockerFixture
+from robolint import config_cache
+from robolint import scheduling
 
 sys.dont_write_bytecode = True
 sys.stdout = (
@@ -26,3 +29,19 @@ def fixture_aws_credentials() -> None:
     os.environ["AWS_SECURITY_TOKEN"] = "testing"
     os.environ["AWS_SESSION_TOKEN"] = "testing"
     os.environ["AWS_DEFAULT_REGION"] = "us-east-1"
+
+
+@pytest.fixture(scope="function", name="failed_filepaths_path", autouse=True)
+def fixture_failed_filepaths_path(mocker: MockerFixture, tmp_path: Path) -> str:
+    """Keep each test's record of failed Methods to itself."""
+    failed_filepaths_path = str(tmp_path / "robolint-failed-files.json")
+    mocker.patch.object(scheduling, "FAILED_FILEPATHS_PATH", failed_filepaths_path)
+    return failed_filepaths_path
+
+
+@pytest.fixture(scope="function", name="config_cache_path", autouse=True)
+def fixture_config_cache_path(mocker: MockerFixture, tmp_path: Path) -> str:
+    """Keep each test's cached configurations to itself."""
+    config_cache_path = str(tmp_path / "robolint-config-cache.pickle")
+    mocker.patch.object(config_cache, "CONFIG_CACHE_PATH", config_cache_path)
+    return config_cache_path
@@ -4,8 +4,8 @@ from unittest.mock import ANY
 from pylint.testutils import MessageTest
 from pylint.testutils import set_config
 from robolint.checkers.labware import LabwareNameChecker
+from robolint.test_utils import RobolintCheckerTestCase
 from robolint.utils import parse_xml_module_from_file
-from robolint.utils import RobolintCheckerTestCase
 from stdlib_utils import get_current_file_abs_directory
 
 
@@ -124,3 +124,46 @@ class TestLabwareNameCheckerCheckerSingleSteps(RobolintCheckerTestCase):
         tree = parse_xml_module_from_file(filepath)
         with self.assertNoMessages():
             self.checker.process_module(tree)
+
+    @set_config(labware_rgx="(a+)+$")  # type:ignore[misc]  # `untyped decorator`
+    def test_Given_pattern_with_nested_quantifiers__When_opened__Then_unsafe_pattern_reported(self) -> None:
+        filepath = os.path.join(PATH_TO_XMLS, "labware-names", "single-aspirate-step-with-invalid-labware-name.xml")
+        tree = parse_xml_module_from_file(filepath)
+        with self.assertAddsMessages(
+            MessageTest(
+                "unsafe-labware-rgx",
+                args=("a quantifier in a repeated group can also match 'a', which can follow it",),
+                line=0,
+            ),
+            MessageTest(
+                LabwareNameChecker.name,
+                args=("384 PCR BioRad"),
+                line=0,
+            ),
+        ):
+            self.checker.process_module(tree)
+
+    @set_config(labware_rgx="(.*.*)*!", labware_rgx_timeout=0.1)  # type:ignore[misc]  # `untyped decorator`
+    def test_When_matching_labware_name_takes_too_long__Then_unsafe_pattern_reported_instead_of_invalid_name(
+        self,
+    ) -> None:
+        filepath = os.path.join(PATH_TO_XMLS, "labware-names", "single-aspirate-step-with-invalid-labware-name.xml")
+        tree = parse_xml_module_from_file(filepath)
+        with self.assertAddsMessages(
+            MessageTest(
+                "unsafe-labware-rgx",
+                args=("a repeated group can match the empty string",),
+                line=0,
+            ),
+            MessageTest(
+                "unsafe-labware-rgx",
+                args=("a quantifier in a repeated group can also match '0', which can follow it",),
+                line=0,
+            ),
+            MessageTest(
+                "unsafe-labware-rgx",
+                args=("matching the labware name '384 PCR BioRad' took longer than 0.1 seconds",),
+                line=0,
+            ),
+        ):
+            self.checker.process_module(tree)
@@ -0,0 +1,21 @@
+import os
+
+from pylint.testutils import MessageTest
+from robolint import NoTipsLoadedChecker
+from robolint.test_utils import RobolintCheckerTestCase
+
+from ..fixtures import get_parsed_xml_module
+
+
+class TestNoTipsLoadedWholeModule(RobolintCheckerTestCase):
+
+    CHECKER_CLASS = NoTipsLoadedChecker
+    XML_SUBPATH = "tip_state"
+
+    def test_When_liquid_handled_after_tips_ejected__Then_error_unless_tips_may_have_been_loaded_since(self) -> None:
+        xml_module = get_parsed_xml_module(os.path.join(self.XML_SUBPATH, "liquid-handling-after-tips-ejected.xml"))
+        with self.assertAddsMessages(
+            MessageTest("no-tips-loaded", args=(2,), line=3),
+            MessageTest("no-tips-loaded", args=(10,), line=11),
+        ):
+            self.checker.process_module(xml_module)
@@ -0,0 +1,114 @@
+import os
+
+from pylint.testutils import MessageTest
+from pylint.testutils import set_config
+import pytest
+from robolint import ParameterRulesChecker
+from robolint.checkers.parameter_rules import parse_parameter_rules
+from robolint.constants import BEGIN_LOOP_STEP_ID
+from robolint.constants import TIP_EJECT_STEP_ID
+from robolint.exceptions import InvalidParameterRuleError
+from robolint.test_utils import RobolintCheckerTestCase
+
+from ..fixtures import get_parsed_steps
+from ..fixtures import get_parsed_xml_module
+
+WASTE_HEIGHT_RULE = f"waste-height: {TIP_EJECT_STEP_ID} height == 50 if plate =~ .*Waste.*"
+LOOP_FROM_ONE_RULE = f"loop-from-one: {BEGIN_LOOP_STEP_ID} VariableValue == 1 if VariableValueVariable !~ ."
+
+
+def test_When_parameter_rules_parsed__Then_rules_compiled_with_their_step_types() -> None:
+    rules = parse_parameter_rules(
+        f"\n{WASTE_HEIGHT_RULE}\nfast: {TIP_EJECT_STEP_ID.upper()} motionProfileName !~ 'Fast .*'\n"
+    )
+
+    assert [(rule.name, rule.step_type_id, rule.parameter_name, rule.requirement) for rule in rules] == [
+        ("waste-height", TIP_EJECT_STEP_ID, "height", "== '50'"),
+        ("fast", TIP_EJECT_STEP_ID, "motionProfileName", "!~ 'Fast .*'"),
+    ]
+
+
+def test_When_rule_with_regular_expression_escapes_parsed__Then_backslashes_kept() -> None:
+    rules = parse_parameter_rules(
+        f"waste: {TIP_EJECT_STEP_ID} plate =~ ^\\d+Waste\n"
+        f'waste-hole: {TIP_EJECT_STEP_ID} plate =~ "Waste Hole_\\d+" if liquidClass !~ \\.'
+    )
+
+    assert [rule.requirement for rule in rules] == ["=~ '^\\d+Waste'", "=~ 'Waste Hole_\\d+'"]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        f"{TIP_EJECT_STEP_ID} height == 50",
+        "a: not-a-guid height == 50",
+        f"a: {TIP_EJECT_STEP_ID} height = 50",
+        f"a: {TIP_EJECT_STEP_ID} height == 50 if plate",
+        f"a: {TIP_EJECT_STEP_ID} plate =~ (",
+        f"a: {TIP_EJECT_STEP_ID} plate == 'unclosed",
+        f"a: {TIP_EJECT_STEP_ID} height == 50\na: {TIP_EJECT_STEP_ID} height == 40",
+    ],
+)
+def test_Given_invalid_parameter_rule__When_parsed__Then_error_raised(value: str) -> None:
+    with pytest.raises(InvalidParameterRuleError):
+        parse_parameter_rules(value)
+
+
+class TestParameterRulesChecker(RobolintCheckerTestCase):
+    CHECKER_CLASS = ParameterRulesChecker
+
+    @set_config(parameter_rules=WASTE_HEIGHT_RULE)  # type:ignore[misc] # `untyped decorator`
+    def test_Given_numeric_rule_with_matching_condition__When_height_differs__Then_error(self) -> None:
+        steps = get_parsed_steps(os.path.join("tip_height", "tip-height-of-15.xml"))
+        with self.assertAddsMessages(
+            MessageTest("invalid-parameter-value", args=("height", "15", "waste-height", "== '50'"), line=0)
+        ):
+            self.checker.visit_step(steps[0])
+
+    @set_config(  # type:ignore[misc] # `untyped decorator`
+        parameter_rules=f"waste-height: {TIP_EJECT_STEP_ID} height == 50 if plate =~ Other.*"
+    )
+    def test_Given_rule_whose_condition_does_not_match__Then_no_error(self) -> None:
+        steps = get_parsed_steps(os.path.join("tip_height", "tip-height-of-15.xml"))
+        with self.assertNoMessages():
+            self.checker.visit_step(steps[0])
+
+    @set_config(parameter_rules=f"fast: {TIP_EJECT_STEP_ID} missingParameter == 50")  # type:ignore[misc]
+    def test_Given_rule_on_absent_parameter__Then_no_error(self) -> None:
+        steps = get_parsed_steps(os.path.join("tip_height", "tip-height-of-15.xml"))
+        with self.assertNoMessages():
+            self.checker.visit_step(steps[0])
+
+    @set_config(parameter_rules=LOOP_FROM_ONE_RULE)  # type:ignore[misc] # `untyped decorator`
+    def test_Given_rule_expressing_loop_start_index__When_whole_module_checked__Then_same_steps_reported(
+        self,
+    ) -> None:
+        xml_module = get_parsed_xml_module(os.path.join("invalid_loop_start_index", "loop-starting-at-zero.xml"))
+        with self.assertAddsMessages(
+            MessageTest("invalid-parameter-value", args=("VariableValue", "0", "loop-from-one", "== '1'"), line=0)
+        ):
+            self.checker.process_module(xml_module)
+
+    @set_config(  # type:ignore[misc] # `untyped decorator`
+        parameter_rules=f"waste: {TIP_EJECT_STEP_ID} plate =~ \\w+\\sHole_\\d+"
+    )
+    def test_Given_regular_expression_with_escapes__When_plate_matches__Then_no_error(self) -> None:
+        steps = get_parsed_steps(os.path.join("tip_height", "tip-height-of-15.xml"))
+        with self.assertNoMessages():
+            self.checker.visit_step(steps[0])
+
+    @set_config(parameter_rules=f"numeric-plate: {TIP_EJECT_STEP_ID} plate == 5")  # type:ignore[misc]
+    def test_Given_numeric_rule__When_parameter_is_not_a_number__Then_error_instead_of_crash(self) -> None:
+        steps = get_parsed_steps(os.path.join("tip_height", "tip-height-of-15.xml"))
+        with self.assertAddsMessages(
+            MessageTest("invalid-parameter-value", args=("plate", "Waste Hole_01", "numeric-plate", "== '5'"), line=0)
+        ):
+            self.checker.visit_step(steps[0])
+
+    def test_Given_no_rules__Then_checker_has_no_steps_to_check(self) -> None:
+        assert not self.checker.has_steps_to_check()
+
+    @set_config(parameter_rules=WASTE_HEIGHT_RULE)  # type:ignore[misc] # `untyped decorator`
+    def test_Given_rules__Then_checker_visits_only_their_step_types(self) -> None:
+        assert self.checker.has_steps_to_check()
+        assert self.checker.get_checked_step_type_ids() == {TIP_EJECT_STEP_ID}
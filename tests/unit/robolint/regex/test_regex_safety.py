@@ -0,0 +1,92 @@
+import re
+import sys
+import time
+from unittest.mock import ANY
+
+import pytest
+from pytest import param
+from robolint.checkers.labware import LABWARE_REGEX
+from robolint.exceptions import RegexTimeoutError
+from robolint.regex_safety import CAN_BOUND_MATCHES
+from robolint.regex_safety import find_risky_constructs
+from robolint.regex_safety import match_within_budget
+from robolint.regex_safety import parse_pattern
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        param(re.compile(LABWARE_REGEX, re.VERBOSE), id="default labware pattern"),
+        param(re.compile("Plate.*"), id="trailing wildcard"),
+        param(re.compile(r"([A-Z][a-z]*-)+\d"), id="repeated word ending in a separator"),
+        param(re.compile(r"\d+[ ]*uL"), id="consecutive quantifiers outside of a repeated group"),
+    ],
+)
+def test_Given_pattern_without_ambiguous_repetitions__When_analysed__Then_no_risk(pattern: re.Pattern[str]) -> None:
+    assert not find_risky_constructs(pattern)
+
+
+@pytest.mark.parametrize(
+    "pattern,expected_risks",
+    [
+        param(r"(a+)+$", ["a quantifier in a repeated group can also match 'a', which can follow it"], id="(a+)+"),
+        param(
+            r"(\w+\s?)+$",
+            ["a quantifier in a repeated group can also match '0', which can follow it"],
+            id="optional separator",
+        ),
+        param(
+            r"(.*,)+x",
+            ["a quantifier in a repeated group can also match ',', which can follow it"],
+            id="wildcard then separator",
+        ),
+        param(
+            r"(?i)(A+a)+",
+            ["a quantifier in a repeated group can also match 'A', which can follow it"],
+            id="ignore case",
+        ),
+        param(r"(a?)*b", ["a repeated group can match the empty string"], id="nullable repeated group"),
+    ],
+)
+def test_Given_pattern_with_ambiguous_repetitions__When_analysed__Then_risk_found(
+    pattern: str, expected_risks: list[str]
+) -> None:
+    assert find_risky_constructs(re.compile(pattern)) == expected_risks
+
+
+def test_When_pattern_parsed__Then_codes_named_as_on_every_verified_python_version() -> None:
+    # `parse_pattern` is the only use of `re`'s private parser, whose output was checked on these versions; check it
+    # again before extending them
+    assert (3, 9) <= sys.version_info[:2] <= (3, 13)
+
+    assert parse_pattern(re.compile(r"(?i:a+)|[^\d]b{0,2}?$")) == [
+        (
+            "BRANCH",
+            (
+                None,
+                [
+                    [("SUBPATTERN", (None, re.IGNORECASE, 0, [("MAX_REPEAT", (1, ANY, [("LITERAL", ord("a"))]))]))],
+                    [
+                        ("IN", [("NEGATE", None), ("CATEGORY", "CATEGORY_DIGIT")]),
+                        ("MIN_REPEAT", (0, 2, [("LITERAL", ord("b"))])),
+                        ("AT", "AT_END"),
+                    ],
+                ],
+            ),
+        )
+    ]
+
+
+@pytest.mark.skipif(not CAN_BOUND_MATCHES, reason="no interval timers on this platform")
+def test_When_match_takes_longer_than_budget__Then_timeout_error_and_previous_handler_restored() -> None:
+    start = time.perf_counter()
+    with pytest.raises(RegexTimeoutError, match=r"took longer than 0.1 seconds"):
+        match_within_budget(re.compile(r"(a+)+$"), "a" * 40 + "b", 0.1)
+
+    assert time.perf_counter() - start < 5
+    assert match_within_budget(re.compile(r"(a+)+$"), "aaa", 0.1) is not None
+
+
+def test_Given_no_budget__When_matched__Then_same_as_match() -> None:
+    assert match_within_budget(re.compile("Plate.*"), "Plate 1", 0) is not None
+    assert match_within_budget(re.compile("Plate.*"), "Tube 1", 0) is None
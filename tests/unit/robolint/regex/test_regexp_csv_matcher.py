@@ -0,0 +1,50 @@
+import re
+
+import pytest
+from pytest import param
+from pytest_mock import MockerFixture
+from robolint.utils import compile_alternation
+from robolint.utils import RegexpCsvMatcher
+
+VALUES = ["Tip Load", "tip load fast", "Mid Speed", "Tip Eject", "Waste\nChute", "aa", "ab", ""]
+
+
+@pytest.mark.parametrize(
+    "patterns",
+    [
+        param([re.compile("Tip Load.*"), re.compile("Tip Eject$")], id="plain"),
+        param([re.compile("tip load", re.IGNORECASE), re.compile("Mid")], id="ignore case on one pattern only"),
+        param([re.compile("Waste.Chute", re.DOTALL), re.compile("Waste.Chute")], id="dot all"),
+        param([re.compile("Tip  # a comment\n[ ]Load  # ends with a comment", re.VERBOSE)], id="verbose"),
+        param([re.compile(r"(a)\1"), re.compile("Mid")], id="backreference, not combined"),
+        param([re.compile("(?i)mid"), re.compile("Tip")], id="inline global flag, not combined"),
+        param([], id="no patterns"),
+    ],
+)
+def test_When_values_matched__Then_same_verdicts_as_each_pattern_in_turn(patterns: list[re.Pattern[str]]) -> None:
+    matcher = RegexpCsvMatcher(patterns)
+
+    assert [matcher.matches(value) for value in VALUES] == [
+        any(pattern.match(value) for pattern in patterns) for value in VALUES
+    ]
+
+
+def test_Given_backreference_or_inline_global_flag__When_alternation_compiled__Then_none() -> None:
+    assert compile_alternation([re.compile(r"(a)\1")]) is None
+    assert compile_alternation([re.compile("Tip"), re.compile("(?i)mid")]) is None
+    assert compile_alternation([re.compile("Tip"), re.compile("Mid", re.IGNORECASE)]) is not None
+
+
+def test_When_value_matched_again__Then_verdict_remembered(mocker: MockerFixture) -> None:
+    matcher = RegexpCsvMatcher([re.compile("Tip Load.*"), re.compile("Fast.*")])
+    alternation = mocker.patch.object(
+        matcher, "_alternation", mocker.Mock(wraps=matcher._alternation)  # pylint: disable=protected-access
+    )
+
+    assert [matcher.matches(value) for value in ["Tip Load", "Mid Speed", "Tip Load", "Mid Speed"]] == [
+        True,
+        False,
+        True,
+        False,
+    ]
+    assert alternation.match.call_count == 2
@@ -0,0 +1,43 @@
+import os
+
+from robolint import parse_xml_module_from_file
+from robolint.analysis import analysis_pass
+from robolint.analysis import Directive
+from robolint.analysis import directives
+from robolint.analysis import labware_stack_elements
+from robolint.utils import XmlModule
+
+from .fixtures import PATH_TO_XMLS
+
+LABWARE_FILE = os.path.join(PATH_TO_XMLS, "labware-names", "single-aspirate-step-with-invalid-labware-name.xml")
+
+
+def test_Given_pass_already_run_on_module__When_requested_again__Then_not_recomputed() -> None:
+    modules_analyzed: list[XmlModule] = []
+
+    @analysis_pass
+    def count_steps(node: XmlModule) -> int:
+        modules_analyzed.append(node)
+        return len(node.steps)
+
+    xml_module = parse_xml_module_from_file(LABWARE_FILE)
+    other_xml_module = parse_xml_module_from_file(LABWARE_FILE)
+
+    assert count_steps(xml_module) == count_steps(xml_module) == 1
+    assert count_steps(other_xml_module) == 1
+    assert modules_analyzed == [xml_module, other_xml_module]
+
+
+def test_When_labware_stack_elements_analyzed__Then_names_and_labware_names_returned() -> None:
+    xml_module = parse_xml_module_from_file(LABWARE_FILE)
+
+    assert labware_stack_elements(xml_module) == [("384 PCR BioRad_01", "384 PCR BioRad")]
+    assert labware_stack_elements(xml_module) is labware_stack_elements(xml_module)
+
+
+def test_When_directives_analyzed__Then_action_and_rule_names_returned_with_step_index() -> None:
+    xml_module = parse_xml_module_from_file(
+        os.path.join(PATH_TO_XMLS, "hardcoded-aspiration-volume", "rule-disabled-single-active-channel-hardcoded.xml")
+    )
+
+    assert directives(xml_module) == [Directive(0, "disable", ["hardcoded-aspirate-volume"])]
@@ -0,0 +1,152 @@
+import os
+from pathlib import Path
+import shutil
+import signal
+import time
+from typing import NoReturn
+from typing import Union
+
+from pylint.reporters import CollectingReporter
+import pytest
+from pytest_mock import MockerFixture
+from robolint.budgets import CAN_FORK
+from robolint.budgets import get_address_space_bytes
+from robolint.budgets import run_within_budget
+from robolint.exceptions import WorkerCrashedError
+from robolint.native import NativeRun
+from robolint.robolinter import XmlModuleLinter
+from robolint.run import RobolintRun
+from robolint.utils import XmlModule
+
+from .fixtures import PATH_TO_XMLS
+
+pytestmark = pytest.mark.skipif(not CAN_FORK, reason="budgets are enforced in forked worker processes")
+
+HARDCODED_FILEPATH = os.path.join(PATH_TO_XMLS, "hardcoded-aspiration-volume", "single-active-channel-hardcoded.xml")
+CLEAN_FILEPATH = os.path.join(PATH_TO_XMLS, "hardcoded-aspiration-volume", "single-active-channel-with-variable.xml")
+
+
+def _run(run_class: Union[type[RobolintRun], type[NativeRun]], args: list[str]) -> list[tuple[str, str]]:
+    reporter = CollectingReporter()
+    with pytest.raises(SystemExit):
+        run_class(
+            [
+                "--disable=all",
+                "--enable=hardcoded-aspirate-volume,file-budget-exceeded,astroid-error",
+                "--load-plugins=robolint.checkers.hardcoded_values",
+                *args,
+            ],
+            reporter=reporter,
+        )
+    return [(os.path.basename(message.path), message.symbol) for message in reporter.messages]
+
+
+def test_When_function_run_within_budget__Then_its_result_returned() -> None:
+    assert run_within_budget(lambda: [1, 2], 10, 0) == ([1, 2], None)
+
+
+def test_Given_function_too_slow__When_run_within_budget__Then_stopped_at_time_budget() -> None:
+    start = time.monotonic()
+
+    result, exceeded_budget = run_within_budget(lambda: time.sleep(10), 0.2, 0)
+
+    assert time.monotonic() - start < 5
+    assert result is None
+    assert exceeded_budget == "it took longer than its time budget of 0.2 seconds"
+
+
+@pytest.mark.skipif(get_address_space_bytes() is None, reason="the memory budget is only enforced on Linux")
+def test_Given_function_using_too_much_memory__When_run_within_budget__Then_stopped_at_memory_budget() -> None:
+    result, exceeded_budget = run_within_budget(lambda: len(bytearray(512 * 1024 * 1024)), 0, 64)
+
+    assert result is None
+    assert exceeded_budget is not None and "memory budget" in exceeded_budget
+
+
+def _exit_without_cleanup() -> NoReturn:
+    os._exit(3)  # pylint: disable=protected-access # exits the worker like a crash in an extension module would
+
+
+def _raise_error() -> None:
+    raise ValueError("checker bug")
+
+
+def test_Given_function_raising__When_run_within_budget__Then_crash_raised_with_worker_traceback() -> None:
+    with pytest.raises(WorkerCrashedError, match="it raised an exception") as exc_info:
+        run_within_budget(_raise_error, 10, 0)
+
+    assert "ValueError: checker bug" in str(exc_info.value.__cause__)
+
+
+def test_Given_result_that_cannot_be_pickled__When_run_within_budget__Then_crash_raised() -> None:
+    with pytest.raises(WorkerCrashedError, match="it raised an exception") as exc_info:
+        run_within_budget(lambda: lambda: None, 10, 0)
+
+    assert "pickle" in str(exc_info.value.__cause__).lower()
+
+
+def test_Given_worker_exiting__When_run_within_budget__Then_crash_raised_with_exit_code() -> None:
+    with pytest.raises(WorkerCrashedError, match="it exited with code 3 without a result"):
+        run_within_budget(_exit_without_cleanup, 10, 0)
+
+
+def test_Given_worker_killed_by_signal__When_run_within_budget__Then_crash_raised_with_signal_not_exit_code() -> None:
+    with pytest.raises(WorkerCrashedError, match=r"it was killed by signal 15 \(SIGTERM\)$"):
+        run_within_budget(lambda: os.kill(os.getpid(), signal.SIGTERM), 10, 0)
+
+
+@pytest.mark.parametrize("run_class", [RobolintRun, NativeRun])
+def test_Given_budgets__When_run__Then_same_messages_as_without_budgets(
+    run_class: Union[type[RobolintRun], type[NativeRun]]
+) -> None:
+    filepaths = [HARDCODED_FILEPATH, CLEAN_FILEPATH, HARDCODED_FILEPATH]
+
+    assert _run(run_class, ["--file-time-budget=30", "--file-memory-budget=1024", *filepaths]) == _run(
+        run_class, filepaths
+    )
+
+
+@pytest.mark.parametrize("run_class", [RobolintRun, NativeRun])
+def test_Given_method_exceeding_time_budget__When_run__Then_budget_message_and_other_methods_linted(
+    run_class: Union[type[RobolintRun], type[NativeRun]], mocker: MockerFixture, tmp_path: Path
+) -> None:
+    other_hardcoded_filepath = str(tmp_path / "other-hardcoded.xml")
+    shutil.copyfile(HARDCODED_FILEPATH, other_hardcoded_filepath)
+    check_xml_module = XmlModuleLinter.check_xml_module
+
+    def check_clean_file_slowly(linter: XmlModuleLinter, node: XmlModule) -> bool:
+        if node.file == CLEAN_FILEPATH:
+            time.sleep(10)
+        return check_xml_module(linter, node)
+
+    mocker.patch.object(XmlModuleLinter, "check_xml_module", autospec=True, side_effect=check_clean_file_slowly)
+
+    messages = _run(run_class, ["--file-time-budget=0.5", HARDCODED_FILEPATH, CLEAN_FILEPATH, other_hardcoded_filepath])
+
+    assert messages == [
+        ("single-active-channel-hardcoded.xml", "hardcoded-aspirate-volume"),
+        ("single-active-channel-with-variable.xml", "file-budget-exceeded"),
+        ("other-hardcoded.xml", "hardcoded-aspirate-volume"),
+    ]
+
+
+@pytest.mark.parametrize("run_class", [RobolintRun, NativeRun])
+def test_Given_method_crashing_its_worker__When_run__Then_crash_reported_and_other_methods_linted(
+    run_class: Union[type[RobolintRun], type[NativeRun]], mocker: MockerFixture, tmp_path: Path
+) -> None:
+    mocker.patch("pylint.lint.pylinter.prepare_crash_report", return_value=tmp_path / "crash.txt")
+    check_xml_module = XmlModuleLinter.check_xml_module
+
+    def crash_on_clean_file(linter: XmlModuleLinter, node: XmlModule) -> bool:
+        if node.file == CLEAN_FILEPATH:
+            _exit_without_cleanup()
+        return check_xml_module(linter, node)
+
+    mocker.patch.object(XmlModuleLinter, "check_xml_module", autospec=True, side_effect=crash_on_clean_file)
+
+    messages = _run(run_class, ["--file-time-budget=30", HARDCODED_FILEPATH, CLEAN_FILEPATH])
+
+    assert messages == [
+        ("single-active-channel-hardcoded.xml", "hardcoded-aspirate-volume"),
+        ("single-active-channel-with-variable.xml", "astroid-error"),
+    ]
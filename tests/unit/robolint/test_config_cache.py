@@ -0,0 +1,143 @@
+import os
+from pathlib import Path
+from typing import Optional
+from typing import Union
+
+from pylint.config.arguments_manager import _ArgumentsManager
+from pylint.config.callback_actions import _ListMessagesAction
+from pylint.reporters import CollectingReporter
+import pytest
+from pytest_mock import MockerFixture
+from robolint import config_cache
+from robolint import plugins
+from robolint.config_cache import get_config_cache_key
+from robolint.native import NativeRun
+from robolint.robolinter import RoboLinter
+from robolint.run import RobolintRun
+
+from .fixtures import PATH_TO_XMLS
+
+HARDCODED_FILEPATH = os.path.join(PATH_TO_XMLS, "hardcoded-aspiration-volume", "single-active-channel-hardcoded.xml")
+
+
+def _write_rcfile(tmp_path: Path, persistent: str = "yes") -> str:
+    rcfile = str(tmp_path / "robolintrc")
+    with open(rcfile, "w", encoding="utf-8") as rc_file:
+        rc_file.write(
+            "[MAIN]\n"
+            "load-plugins=robolint.checkers.hardcoded_values,robolint.checkers.labware\n"
+            "disable=all\n"
+            "enable=hardcoded-aspirate-volume,unknown-option-value,not-a-real-message\n"
+            "labware-rgx=Plate.*\n"
+            f"persistent={persistent}\n"
+        )
+    return rcfile
+
+
+def _run(
+    run_class: Union[type[RobolintRun], type[NativeRun]], rcfile: str
+) -> tuple[list[tuple[str, str]], Union[str, int, None]]:
+    reporter = CollectingReporter()
+    with pytest.raises(SystemExit) as exc_info:
+        run_class([f"--rcfile={rcfile}", HARDCODED_FILEPATH], reporter=reporter)
+    return [(message.symbol, message.msg) for message in reporter.messages], exc_info.value.code
+
+
+@pytest.mark.parametrize("run_class", [RobolintRun, NativeRun])
+def test_Given_persistent__When_run_again__Then_configuration_loaded_from_cache_with_same_result(
+    run_class: Union[type[RobolintRun], type[NativeRun]], tmp_path: Path, mocker: MockerFixture, config_cache_path: str
+) -> None:
+    rcfile = _write_rcfile(tmp_path)
+    parse = mocker.spy(_ArgumentsManager, "_parse_configuration_file")
+
+    first_result = _run(run_class, rcfile)
+    assert parse.call_count == 1
+    assert os.path.exists(config_cache_path)
+
+    assert _run(run_class, rcfile) == first_result
+    assert parse.call_count == 1
+    assert first_result[0][0] == (
+        "unknown-option-value",
+        "Unknown option value for '--enable', expected a valid pylint message and got 'not-a-real-message'",
+    )
+
+
+@pytest.mark.parametrize("run_class", [RobolintRun, NativeRun])
+def test_Given_not_persistent__When_run__Then_configuration_not_cached(
+    run_class: Union[type[RobolintRun], type[NativeRun]], tmp_path: Path, config_cache_path: str
+) -> None:
+    _run(run_class, _write_rcfile(tmp_path, persistent="no"))
+
+    assert not os.path.exists(config_cache_path)
+
+
+def _get_key(linter: RoboLinter, arguments: list[str], engine_name: str = "RoboLinter") -> Optional[str]:
+    return get_config_cache_key(
+        arguments,
+        linter._arg_parser,  # pylint: disable=protected-access
+        linter.msgs_store,
+        linter._msgs_state,  # pylint: disable=protected-access
+        engine_name,
+        [*linter._dynamic_plugins, *linter._deferred_plugins],  # pylint: disable=protected-access
+    )
+
+
+def test_When_options_differ__Then_cache_keys_differ() -> None:
+    linter = RoboLinter()
+
+    key = _get_key(linter, ["--labware-rgx", "Plate.*"])
+
+    assert key == _get_key(RoboLinter(), ["--labware-rgx", "Plate.*"])
+    assert key != _get_key(linter, ["--labware-rgx", "Tube.*"])
+    assert key != _get_key(linter, ["--labware-rgx", "Plate.*"], engine_name="NativeLinter")
+
+
+def test_When_registered_messages_options_or_message_state_differ__Then_cache_keys_differ() -> None:
+    linter = RoboLinter()
+    key = _get_key(linter, [])
+
+    linter.load_plugin_modules(["robolint.checkers.labware"])
+    key_with_plugin = _get_key(linter, [])
+    linter.disable("invalid-labware-name")
+    key_with_message_disabled = _get_key(linter, [])
+    linter._arg_parser.set_defaults(labware_rgx="Tube.*")  # pylint: disable=protected-access
+
+    assert len({key, key_with_plugin, key_with_message_disabled, _get_key(linter, [])}) == 4
+
+
+def test_When_robolint_source_differs__Then_cache_keys_differ(mocker: MockerFixture) -> None:
+    linter = RoboLinter()
+    key = _get_key(linter, [])
+
+    mocker.patch.object(config_cache, "get_robolint_source_hash", autospec=True, return_value="upgraded")
+
+    assert _get_key(linter, []) != key
+
+
+def test_Given_no_entry_points__When_cache_key_computed_with_robolint_plugins__Then_cacheable(
+    mocker: MockerFixture,
+) -> None:
+    mocker.patch.object(plugins, "_get_plugin_entry_points", autospec=True, return_value={})
+    linter = RoboLinter()
+    linter.load_plugin_modules(["robolint.checkers.labware"])
+
+    assert _get_key(linter, []) is not None
+
+
+def test_Given_command_option_or_unversioned_plugin__When_cache_key_computed__Then_none() -> None:
+    linter = RoboLinter()
+    arg_parser = linter._arg_parser  # pylint: disable=protected-access
+    arg_parser.add_argument("--list-msgs", action=_ListMessagesAction, Run=None)  # as `Run` adds it
+
+    assert _get_key(linter, ["--list-msgs", ""]) is None
+    assert (
+        get_config_cache_key(
+            [],
+            arg_parser,
+            linter.msgs_store,
+            linter._msgs_state,  # pylint: disable=protected-access
+            "RoboLinter",
+            ["some_local_plugin"],
+        )
+        is None
+    )
@@ -0,0 +1,105 @@
+import os
+from typing import Any
+from unittest.mock import MagicMock
+
+from overrides import override
+import pytest
+from pytest_mock import MockerFixture
+from robolint import MM4Step
+from robolint import NoTipsLoadedChecker
+from robolint import parse_steps
+from robolint import RoboLinter
+from robolint import StepChecker
+from robolint.constants import MIX_VVP96_STEP_ID
+from robolint.flow import AssignedVariablesAnalysis
+from robolint.flow import FlowWalker
+from robolint.flow import LoopAnalysis
+from robolint.flow import TipAnalysis
+from robolint.flow import TipState
+
+from .fixtures import PATH_TO_XMLS
+
+TIP_STATE_FILEPATH = os.path.join(PATH_TO_XMLS, "tip_state", "liquid-handling-after-tips-ejected.xml")
+
+
+def _states_before_each_step(walker: FlowWalker, analysis_class: Any) -> list[Any]:
+    walker.open_module()
+    states = []
+    for step in parse_steps(TIP_STATE_FILEPATH):
+        state = walker.state(analysis_class)
+        states.append(set(state) if isinstance(state, set) else state)
+        walker.advance(step)
+    return states
+
+
+def test_When_tip_analysis_walked__Then_tips_ejected_until_loaded_and_unknown_after_conditional_load() -> None:
+    walker = FlowWalker([TipAnalysis])
+
+    assert [state.loaded for state in _states_before_each_step(walker, TipAnalysis)] == [
+        None,
+        True,
+        True,
+        False,
+        False,
+        False,
+        True,
+        None,
+        None,
+        None,
+        True,
+        False,
+        False,
+        False,
+    ]
+    assert walker.state(TipAnalysis) == TipState(False, 10, ())
+
+
+def test_When_loop_analysis_walked__Then_enclosing_begin_loop_steps_tracked() -> None:
+    walker = FlowWalker([LoopAnalysis])
+
+    assert _states_before_each_step(walker, LoopAnalysis) == [()] * 9 + [(8,)] * 5
+    assert walker.state(LoopAnalysis) == ()
+
+
+def test_When_assigned_variables_walked__Then_loop_counters_and_expression_results_collected() -> None:
+    walker = FlowWalker([AssignedVariablesAnalysis])
+
+    states = _states_before_each_step(walker, AssignedVariablesAnalysis)
+
+    assert states[5] == set()  # the If step only reads its variable
+    assert states[8] == set()
+    assert states[9] == {"LoopCounter"}
+    assert states[13] == {"LoopCounter", "NextIndex"}
+
+
+def test_Given_analyses_of_some_step_types__Then_walker_only_needs_those_step_types() -> None:
+    expected_step_type_ids = set(TipAnalysis.step_type_ids | LoopAnalysis.step_type_ids)
+
+    assert FlowWalker([TipAnalysis, LoopAnalysis]).step_type_ids == expected_step_type_ids
+    assert FlowWalker([TipAnalysis, AssignedVariablesAnalysis]).step_type_ids is None
+
+
+@pytest.mark.parametrize("stream_steps", [False, True])
+def test_Given_two_checkers_needing_the_same_analysis__When_run__Then_analysis_advanced_once_per_step(
+    mock_print: MagicMock, mocker: MockerFixture, stream_steps: bool
+) -> None:
+    class TipStateRecorder(StepChecker):
+        name = "tip-state-recorder"
+        msgs = {"C9099": ("Tips loaded: %s", "tip-state", "The tip state before each Mix step.")}
+        step_type_id = {MIX_VVP96_STEP_ID}
+        flow_analyses = (TipAnalysis,)
+
+        @override
+        def check_step(self, step: MM4Step) -> None:
+            self.add_message("tip-state", args=(self.flow_state(TipAnalysis).loaded,))
+
+    linter = RoboLinter()
+    linter.register_checker(NoTipsLoadedChecker(linter))
+    linter.register_checker(TipStateRecorder(linter))
+    linter.set_option("stream-steps", stream_steps)
+    spied_transfer = mocker.spy(TipAnalysis, "transfer")
+
+    linter.check([TIP_STATE_FILEPATH])
+
+    assert spied_transfer.call_count == 7  # the Load Tips, Eject Tips, If and End If steps
+    assert linter.stats.by_msg == {"no-tips-loaded": 2, "tip-state": 2}
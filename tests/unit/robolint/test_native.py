@@ -0,0 +1,159 @@
+import glob
+import os
+from pathlib import Path
+from typing import Any
+from typing import Union
+
+from pylint.reporters import CollectingReporter
+import pytest
+from pytest_mock import MockerFixture
+from robolint import run
+from robolint.native import NativeLinter
+from robolint.native import NativeRun
+from robolint.run import pop_engine_option
+from robolint.run import RobolintRun
+
+from .fixtures import PATH_TO_XMLS
+
+ALL_XML_FILEPATHS = sorted(glob.glob(os.path.join(PATH_TO_XMLS, "*", "*.xml")))
+EXAMPLE_ROBOLINTRC = Path(__file__).parents[3] / "example-robolintrc"
+
+# every robolint message, so the engines are compared on all the rules
+ROBOLINTRC = """[MAIN]
+load-plugins=robolint.checkers.looping,robolint.checkers.hardcoded_values,robolint.checkers.tip_checkers,
+    robolint.checkers.robocase,robolint.checkers.labware,robolint.checkers.parameter_rules
+disable=all
+enable=astroid-error,fatal,syntax-error,unknown-option-value,locally-disabled,suppressed-message,useless-suppression,
+    file-budget-exceeded,hardcoded-aspirate-volume,hardcoded-dispense-volume,hardcoded-mix-volume,
+    invalid-loop-start-index,invalid-tip-load-profile,invalid-tip-eject-profile,invalid-tip-waste-eject-height,
+    no-tips-loaded,variable-name-checker,invalid-labware-name,unsafe-labware-rgx,invalid-parameter-value
+[FORMAT]
+max-module-lines=300
+variable-name-case=robocase
+parameter-rules=
+    tip-load-speed: 1d04aba5-dc42-e044-e57e-311ff530b30f motionProfileName =~ "Tip Load Slow.*"
+    loop-from-one: 565c02ef-0d8e-40bd-8906-4cc50e02fcb7 VariableValue == 1 if VariableValueVariable !~ .
+"""
+
+
+def _run_collecting_messages(
+    run_class: Union[type[RobolintRun], type[NativeRun]], args: list[str]
+) -> tuple[list[tuple[Any, ...]], Union[str, int, None]]:
+    reporter = CollectingReporter()
+    with pytest.raises(SystemExit) as exit_info:
+        run_class(args, reporter=reporter)
+    messages: list[tuple[Any, ...]] = [
+        (message.msg_id, message.symbol, message.module, message.path, message.line, message.column, message.msg)
+        for message in reporter.messages
+    ]
+    return messages, exit_info.value.code
+
+
+@pytest.mark.parametrize("stream_steps", ["n", "y"])
+@pytest.mark.parametrize("filepath", ALL_XML_FILEPATHS, ids=os.path.basename)
+def test_When_method_linted_with_native_engine__Then_same_messages_and_exit_code_as_pylint_engine(
+    filepath: str, stream_steps: str, tmp_path: Path
+) -> None:
+    rcfile = tmp_path / "robolintrc"
+    rcfile.write_text(ROBOLINTRC, encoding="utf-8")
+    args = [f"--rcfile={rcfile}", f"--stream-steps={stream_steps}", "--disable=not-a-real-rule", filepath]
+
+    assert _run_collecting_messages(NativeRun, args) == _run_collecting_messages(RobolintRun, args)
+
+
+@pytest.mark.parametrize("filepath", ALL_XML_FILEPATHS, ids=os.path.basename)
+def test_Given_example_robolintrc__When_method_linted_with_native_engine__Then_same_output_as_pylint_engine(
+    filepath: str,
+) -> None:
+    args = [f"--rcfile={EXAMPLE_ROBOLINTRC}", "--persistent=no", filepath]
+
+    assert _run_collecting_messages(NativeRun, args) == _run_collecting_messages(RobolintRun, args)
+
+
+@pytest.mark.parametrize("run_option", ["-E", "--exit-zero", "--fail-under=11"])
+@pytest.mark.parametrize("filepath", ALL_XML_FILEPATHS, ids=os.path.basename)
+def test_Given_run_option__When_method_linted_with_native_engine__Then_same_output_as_pylint_engine(
+    filepath: str, run_option: str, tmp_path: Path
+) -> None:
+    rcfile = tmp_path / "robolintrc"
+    rcfile.write_text(ROBOLINTRC, encoding="utf-8")
+    args = [f"--rcfile={rcfile}", run_option, filepath]
+
+    assert _run_collecting_messages(NativeRun, args) == _run_collecting_messages(RobolintRun, args)
+
+
+def test_Given_errors_only__When_missing_file_linted_with_native_engine__Then_fatal_message_still_reported(
+    tmp_path: Path,
+) -> None:
+    rcfile = tmp_path / "robolintrc"
+    rcfile.write_text(ROBOLINTRC, encoding="utf-8")
+    args = [f"--rcfile={rcfile}", "-E", str(tmp_path / "missing.xml")]
+
+    native_messages, native_exit_code = _run_collecting_messages(NativeRun, args)
+
+    assert [message[1] for message in native_messages] == ["fatal"]
+    assert (native_messages, native_exit_code) == _run_collecting_messages(RobolintRun, args)
+
+
+@pytest.mark.parametrize(
+    "run_option", ["--list-msgs", "--help-msg=C9000", "--generate-rcfile", "--enable-all-extensions"]
+)
+def test_Given_run_option_needing_pylint__When_native_engine_run__Then_exits_saying_not_supported(
+    run_option: str, capsys: pytest.CaptureFixture[str]
+) -> None:
+    with pytest.raises(SystemExit) as exit_info:
+        NativeRun([run_option, "a.xml"])
+
+    assert exit_info.value.code == 32
+    assert f"{run_option.split('=')[0]} is not supported by the native engine" in capsys.readouterr().err
+
+
+def test_Given_native_engine__When_run__Then_pylint_engine_not_run(mocker: MockerFixture) -> None:
+    native_run = mocker.patch.object(run, "NativeRun")
+    robolint_run = mocker.patch.object(run, "RobolintRun")
+
+    run.run_pylint(["--engine=native", "a.xml"])
+
+    native_run.assert_called_once_with(["a.xml"])
+    robolint_run.assert_not_called()
+
+
+def test_When_missing_file_linted_with_native_engine__Then_same_fatal_message_as_pylint_engine(tmp_path: Path) -> None:
+    rcfile = tmp_path / "robolintrc"
+    rcfile.write_text(ROBOLINTRC, encoding="utf-8")
+    args = [f"--rcfile={rcfile}", str(tmp_path / "missing.xml")]
+
+    native_messages, native_exit_code = _run_collecting_messages(NativeRun, args)
+
+    assert native_exit_code == 1
+    assert [message[1] for message in native_messages] == ["fatal"]
+    assert (native_messages, native_exit_code) == _run_collecting_messages(RobolintRun, args)
+
+
+def test_When_native_linter_created__Then_pylint_default_checkers_not_loaded() -> None:
+    linter = NativeLinter()
+    linter.load_plugin_modules(["robolint.checkers.hardcoded_values"])
+
+    assert [checker.name for checker in linter.get_checkers()] == ["main", "file-budgets", "hardcoded_aspirate_volume"]
+
+
+@pytest.mark.parametrize(
+    "argv,expected_engine,expected_args",
+    [
+        (["a.xml"], "pylint", ["a.xml"]),
+        (["--engine=native", "a.xml"], "native", ["a.xml"]),
+        (["--rcfile=rc", "--engine", "native", "a.xml"], "native", ["--rcfile=rc", "a.xml"]),
+        (["--engine=pylint", "a.xml"], "pylint", ["a.xml"]),
+    ],
+)
+def test_When_engine_option_popped__Then_engine_and_remaining_args_returned(
+    argv: list[str], expected_engine: str, expected_args: list[str]
+) -> None:
+    assert pop_engine_option(argv) == (expected_engine, expected_args)
+
+
+def test_Given_unknown_engine__When_engine_option_popped__Then_exits() -> None:
+    with pytest.raises(SystemExit) as exit_info:
+        pop_engine_option(["--engine=fast", "a.xml"])
+
+    assert exit_info.value.code == 32
@@ -0,0 +1,80 @@
+import re
+import subprocess
+import sys
+from typing import Union
+
+import pytest
+from pytest_mock import MockerFixture
+from robolint import plugins
+from robolint.native import NativeLinter
+from robolint.plugins import get_plugin_declarations
+from robolint.plugins import PlaceholderChecker
+from robolint.plugins import ROBOLINT_PLUGIN_DECLARATIONS
+from robolint.robolinter import RoboLinter
+
+ALL_PLUGIN_MODNAMES = sorted(ROBOLINT_PLUGIN_DECLARATIONS)
+
+
+def test_When_plugin_declarations_loaded__Then_every_robolint_checker_module_declared() -> None:
+    assert sorted(get_plugin_declarations()) == [
+        "robolint.checkers.hardcoded_values",
+        "robolint.checkers.labware",
+        "robolint.checkers.looping",
+        "robolint.checkers.parameter_rules",
+        "robolint.checkers.robocase",
+        "robolint.checkers.tip_checkers",
+        "robolint.checkers.variables",
+    ]
+
+
+def test_Given_no_entry_points__When_plugin_declarations_loaded__Then_robolint_checker_modules_still_declared(
+    mocker: MockerFixture,
+) -> None:
+    mocker.patch.object(plugins, "_get_plugin_entry_points", autospec=True, return_value={})
+
+    assert get_plugin_declarations.__wrapped__() == ROBOLINT_PLUGIN_DECLARATIONS
+
+
+@pytest.mark.parametrize("modname", ALL_PLUGIN_MODNAMES)
+def test_When_plugin_module_imported__Then_it_registers_the_declared_checkers(modname: str) -> None:
+    linter = NativeLinter()
+    linter.import_plugin_modules([modname])
+
+    registered = [
+        (
+            checker.name,
+            {msgid: msg[1] for msgid, msg in checker.msgs.items()},
+            tuple(name for name, _ in checker.options),
+        )
+        for checker in linter.get_checkers()[2:]
+    ]
+    assert registered == sorted(tuple(declaration) for declaration in ROBOLINT_PLUGIN_DECLARATIONS[modname])
+
+
+@pytest.mark.parametrize("linter_class", [RoboLinter, NativeLinter])
+def test_Given_one_enabled_message__When_plugins_loaded__Then_only_its_module_imported_with_its_options_parsed(
+    linter_class: Union[type[RoboLinter], type[NativeLinter]]
+) -> None:
+    linter = linter_class()
+    linter.load_plugin_modules(ALL_PLUGIN_MODNAMES)
+    linter._parse_command_line_configuration(  # pylint: disable=protected-access
+        ["--disable=all", "--enable=invalid-labware-name", "--labware-rgx=Plate.*", "--tip-load-profile=Fast.*"]
+    )
+
+    assert isinstance(linter.get_checkers()[-1], PlaceholderChecker)
+    linter.import_enabled_plugins()
+
+    assert list(linter._dynamic_plugins) == ["robolint.checkers.labware"]  # pylint: disable=protected-access
+    assert linter.config.labware_rgx == re.compile("Plate.*")
+    assert linter.config.tip_load_profile == "Fast.*"  # kept as given until the module is imported
+    assert [checker.name for checker in linter.prepare_checkers()[1:]] == ["invalid-labware-name"]
+
+
+def test_When_console_script_module_imported__Then_neither_checkers_nor_pytest_imported() -> None:
+    code = (
+        "import sys, robolint.run; "
+        "print(sorted(name for name in sys.modules if name.startswith(('robolint.checkers.', 'pytest.', '_pytest')) "
+        "or name == 'pytest'))"
+    )
+
+    assert subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout == "[]\n"
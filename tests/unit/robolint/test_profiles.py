@@ -0,0 +1,78 @@
+import os
+from pathlib import Path
+from typing import Union
+
+from pylint.reporters import CollectingReporter
+import pytest
+from pytest_mock import MockerFixture
+from robolint import robolinter
+from robolint.exceptions import InvalidRuleProfileError
+from robolint.native import NativeRun
+from robolint.profiles import parse_rule_profiles
+from robolint.profiles import ProfilesReporter
+from robolint.profiles import RuleProfile
+from robolint.run import RobolintRun
+
+from .fixtures import PATH_TO_XMLS
+
+ROBOLINTRC = """[MAIN]
+load-plugins=robolint.checkers.looping,robolint.checkers.hardcoded_values
+disable=all
+enable=fatal
+rule-profiles=
+    errors: --enable=hardcoded-aspirate-volume
+    warnings: --enable=invalid-loop-start-index --exit-zero
+"""
+
+METHOD_FILEPATHS = [
+    os.path.join(PATH_TO_XMLS, "hardcoded-aspiration-volume", "single-active-channel-hardcoded.xml"),
+    os.path.join(PATH_TO_XMLS, "invalid_loop_start_index", "loop-starting-at-one.xml"),
+]
+
+
+@pytest.mark.parametrize(
+    "value,expected_profiles",
+    [
+        ("", []),
+        (
+            "\nerrors: --enable=a,b --disable=c\nwarnings: -e d -e e --exit-zero\n",
+            [
+                RuleProfile("errors", ["a", "b"], ["c"], False),
+                RuleProfile("warnings", ["d", "e"], [], True),
+            ],
+        ),
+    ],
+)
+def test_When_rule_profiles_parsed__Then_profiles_returned(value: str, expected_profiles: list[RuleProfile]) -> None:
+    assert parse_rule_profiles(value) == expected_profiles
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["errors --enable=a", ": --enable=a", "errors: --fail", "errors: --enable", "a: -e x\na: -e y"],
+)
+def test_Given_invalid_rule_profile__When_parsed__Then_error_raised(value: str) -> None:
+    with pytest.raises(InvalidRuleProfileError):
+        parse_rule_profiles(value)
+
+
+@pytest.mark.parametrize("run_class", [RobolintRun, NativeRun])
+def test_Given_two_rule_profiles__When_run__Then_each_profile_reports_its_messages_and_exit_code_combines_them(
+    run_class: Union[type[RobolintRun], type[NativeRun]], tmp_path: Path, mocker: MockerFixture
+) -> None:
+    rcfile = tmp_path / "robolintrc"
+    rcfile.write_text(ROBOLINTRC, encoding="utf-8")
+    reporter = CollectingReporter()
+    spied_parse = mocker.spy(robolinter, "parse_xml_module_from_file")
+    spied_init = mocker.spy(ProfilesReporter, "__init__")
+
+    with pytest.raises(SystemExit) as exit_info:
+        run_class([f"--rcfile={rcfile}", *METHOD_FILEPATHS], reporter=reporter)
+
+    profiles_reporter: ProfilesReporter = spied_init.call_args.args[0]
+    assert {
+        profile_name: [message.symbol for message in profile_reporter.messages]
+        for profile_name, profile_reporter in profiles_reporter.profile_reporters.items()
+    } == {"errors": ["hardcoded-aspirate-volume"], "warnings": ["invalid-loop-start-index"]}
+    assert exit_info.value.code == 16  # only the convention message of `errors`, `warnings` exits with zero
+    assert spied_parse.call_count == len(METHOD_FILEPATHS)  # each Method checked once for both profiles
@@ -1,12 +1,31 @@
 import os
+from pathlib import Path
+import time
+from typing import Optional
 from unittest.mock import MagicMock
 
 from defusedxml.ElementTree import parse
+from lxml.etree import tostring
+from pylint.reporters import CollectingReporter
 import pytest
 from pytest import CaptureFixture
 from pytest_mock import MockerFixture
 from robolint import HardcodedValuesChecker
+from robolint import LoopIndexChecker
 from robolint import RoboLinter
+from robolint import robolinter
+from robolint import TipLoadChecker
+from robolint import utils
+from robolint.checkers.labware import LabwareNameChecker
+from robolint.checkers.variables import VariableNameChecker
+from robolint.constants import ASPIRATE_VVP96_STEP_ID
+from robolint.constants import BEGIN_LOOP_STEP_ID
+from robolint.constants import COMMENT_STEPS_ID
+from robolint.robolinter import DisabledIntervals
+from robolint.robolinter import get_prefilter_step_type_ids
+from robolint.robolinter import StepDispatcher
+from robolint.utils import robolint_overrides
+from robolint.utils import StreamedXmlModule
 from robolint.utils import XmlModule
 
 from .fixtures import PATH_TO_XMLS
@@ -25,6 +44,55 @@ def test_When_run_on_file_with_error__Then_message_shows_up_in_stdout(capsys: Ca
     assert "hardcoded-aspirate-volume" in out
 
 
+def test_When_run_with_multiple_checkers__Then_steps_only_parsed_once(
+    mock_print: MagicMock, mocker: MockerFixture
+) -> None:
+    linter = RoboLinter()
+    linter.register_checker(HardcodedValuesChecker(linter))
+    linter.register_checker(LoopIndexChecker(linter))
+    spied_parse_steps = mocker.spy(utils, "parse_steps_from_etree")
+
+    linter.check(
+        [os.path.join(PATH_TO_XMLS, "hardcoded-aspiration-volume", "rule-disabled-single-active-channel-hardcoded.xml")]
+    )
+
+    assert spied_parse_steps.call_count == 1
+
+
+def test_When_run_with_multiple_checkers__Then_each_checker_only_visits_steps_of_its_types(
+    mock_print: MagicMock, mocker: MockerFixture
+) -> None:
+    linter = RoboLinter()
+    hardcoded_values_checker = HardcodedValuesChecker(linter)
+    loop_index_checker = LoopIndexChecker(linter)
+    linter.register_checker(hardcoded_values_checker)
+    linter.register_checker(loop_index_checker)
+    spied_hardcoded_visit_step = mocker.spy(hardcoded_values_checker, "visit_step")
+    spied_loop_visit_step = mocker.spy(loop_index_checker, "visit_step")
+
+    linter.check(
+        [os.path.join(PATH_TO_XMLS, "hardcoded-aspiration-volume", "rule-disabled-single-active-channel-hardcoded.xml")]
+    )
+
+    assert [call.args[0].step_type_id for call in spied_hardcoded_visit_step.call_args_list] == [ASPIRATE_VVP96_STEP_ID]
+    spied_loop_visit_step.assert_not_called()
+
+
+def test_Given_checker_of_every_step_type__When_steps_dispatched__Then_checker_visits_every_step() -> None:
+    linter = RoboLinter()
+    hardcoded_values_checker = HardcodedValuesChecker(linter)
+    variable_name_checker = VariableNameChecker(linter)
+    dispatcher = StepDispatcher([hardcoded_values_checker, variable_name_checker])
+    steps = utils.parse_steps(
+        os.path.join(PATH_TO_XMLS, "hardcoded-aspiration-volume", "rule-disabled-single-active-channel-hardcoded.xml")
+    )
+
+    assert [dispatcher.checkers_for(step) for step in steps] == [
+        [variable_name_checker],
+        [hardcoded_values_checker, variable_name_checker],
+    ]
+
+
 def test_When_comment_disables_rule__Then_message_is_locally_disabled_and_suppressed(mock_print: MagicMock) -> None:
     linter = RoboLinter()
     linter.register_checker(HardcodedValuesChecker(linter))
@@ -36,6 +104,260 @@ def test_When_comment_disables_rule__Then_message_is_locally_disabled_and_suppre
     assert linter.stats.by_msg == {"suppressed-message": 1, "locally-disabled": 1}
 
 
+def test_Given_stream_steps_enabled__When_comment_disables_rule__Then_same_result_as_without_streaming(
+    mock_print: MagicMock, mocker: MockerFixture
+) -> None:
+    linter = RoboLinter()
+    linter.register_checker(HardcodedValuesChecker(linter))
+    linter.set_option("stream-steps", True)
+    spied_get_ast = mocker.spy(linter, "get_ast")
+
+    linter.check(
+        [os.path.join(PATH_TO_XMLS, "hardcoded-aspiration-volume", "rule-disabled-single-active-channel-hardcoded.xml")]
+    )
+
+    assert isinstance(spied_get_ast.spy_return, StreamedXmlModule)
+    assert linter.stats.by_msg == {"suppressed-message": 1, "locally-disabled": 1}
+
+
+def test_Given_stream_steps_enabled_and_checker_needs_whole_module__When_run__Then_steps_not_streamed(
+    mock_print: MagicMock, mocker: MockerFixture
+) -> None:
+    robolint_overrides()  # the default `labware-rgx` is a verbose regular expression
+    linter = RoboLinter()
+    linter.register_checker(HardcodedValuesChecker(linter))
+    linter.register_checker(LabwareNameChecker(linter))
+    linter.set_option("stream-steps", True)
+    spied_get_ast = mocker.spy(linter, "get_ast")
+
+    linter.check([os.path.join(PATH_TO_XMLS, "labware-names", "single-aspirate-step-with-valid-labware-name.xml")])
+
+    assert not isinstance(spied_get_ast.spy_return, StreamedXmlModule)
+    assert linter.stats.by_msg == {}
+
+
+def test_Given_no_step_of_checked_types_in_method__When_run__Then_tree_not_built(
+    mock_print: MagicMock, mocker: MockerFixture
+) -> None:
+    linter = RoboLinter()
+    linter.register_checker(HardcodedValuesChecker(linter))
+    spied_parse_xml_buffer = mocker.spy(utils, "parse_xml_buffer")
+
+    linter.check([os.path.join(PATH_TO_XMLS, "tip_motion_profile", "load-tips-with-invalid-mid-speed-profile.xml")])
+
+    spied_parse_xml_buffer.assert_not_called()
+    assert linter.stats.by_msg == {}
+
+
+def test_Given_step_of_checked_type_in_method__When_run__Then_tree_built(
+    mock_print: MagicMock, mocker: MockerFixture
+) -> None:
+    linter = RoboLinter()
+    linter.register_checker(HardcodedValuesChecker(linter))
+    linter.register_checker(TipLoadChecker(linter))
+    spied_parse_xml_buffer = mocker.spy(utils, "parse_xml_buffer")
+
+    linter.check([os.path.join(PATH_TO_XMLS, "tip_motion_profile", "load-tips-with-invalid-mid-speed-profile.xml")])
+
+    spied_parse_xml_buffer.assert_called_once()
+    assert linter.stats.by_msg == {"invalid-tip-load-profile": 1}
+
+
+def test_Given_message_of_one_step_type_enabled__When_run__Then_steps_of_other_types_not_checked(
+    mock_print: MagicMock, mocker: MockerFixture
+) -> None:
+    linter = RoboLinter()
+    linter.register_checker(HardcodedValuesChecker(linter))
+    linter.disable("all")
+    linter.enable("hardcoded-aspirate-volume")
+    spied_parse_xml_buffer = mocker.spy(utils, "parse_xml_buffer")
+
+    linter.check([os.path.join(PATH_TO_XMLS, "hardcoded_dispense_volume", "two-channels-hardcoded.xml")])
+
+    spied_parse_xml_buffer.assert_not_called()
+    assert linter.stats.by_msg == {}
+
+
+def test_Given_all_messages_of_checker_disabled__When_run__Then_checker_does_not_analyze_module(
+    mock_print: MagicMock, mocker: MockerFixture
+) -> None:
+    linter = RoboLinter()
+    labware_name_checker = LabwareNameChecker(linter)
+    linter.register_checker(HardcodedValuesChecker(linter))
+    linter.register_checker(labware_name_checker)
+    linter.disable("invalid-labware-name")
+    spied_open_module = mocker.spy(labware_name_checker, "open_module")
+
+    linter.check([os.path.join(PATH_TO_XMLS, "labware-names", "single-aspirate-step-with-invalid-labware-name.xml")])
+
+    spied_open_module.assert_not_called()
+
+
+def test_Given_dispense_and_mix_messages_disabled__When_checked_step_types_collected__Then_only_aspirate() -> None:
+    linter = RoboLinter()
+    hardcoded_values_checker = HardcodedValuesChecker(linter)
+    linter.register_checker(hardcoded_values_checker)
+    linter.disable("hardcoded-dispense-volume")
+    linter.disable("hardcoded-mix-volume")
+
+    assert hardcoded_values_checker.get_checked_step_type_ids() == {ASPIRATE_VVP96_STEP_ID}
+
+
+def test_Given_checker_of_every_step_type__When_prefilter_step_type_ids_collected__Then_no_prefilter() -> None:
+    linter = RoboLinter()
+
+    assert get_prefilter_step_type_ids([HardcodedValuesChecker(linter), VariableNameChecker(linter)]) is None
+
+
+def test_When_prefilter_step_type_ids_collected__Then_comment_steps_included() -> None:
+    linter = RoboLinter()
+
+    assert get_prefilter_step_type_ids([LoopIndexChecker(linter)]) == frozenset({BEGIN_LOOP_STEP_ID, COMMENT_STEPS_ID})
+
+
+def test_Given_entity_expansion_bomb__When_run__Then_parsed_quickly_without_expanding_entities(
+    mock_print: MagicMock, mocker: MockerFixture, tmp_path: Path
+) -> None:
+    bomb_file = tmp_path / "entity-bomb.met"
+    bomb_file.write_text(
+        f'<!DOCTYPE Complex [<!ENTITY big "{"A" * 100000}">]>\n'
+        f'<Complex><Simple name="CommandId" value="{ASPIRATE_VVP96_STEP_ID}" />{"&big;" * 20000}</Complex>\n',
+        encoding="utf-8",
+    )
+    linter = RoboLinter()
+    linter.register_checker(HardcodedValuesChecker(linter))
+    spied_parse_xml_buffer = mocker.spy(utils, "parse_xml_buffer")
+
+    start = time.perf_counter()
+    linter.check([str(bomb_file)])
+
+    assert time.perf_counter() - start < 5
+    # the aspirate step type ID gets the Method past the prefilter, to the hardened parser
+    assert spied_parse_xml_buffer.call_count == 1
+    assert len(tostring(spied_parse_xml_buffer.spy_return)) < 1024 * 1024
+    assert not linter.stats.by_msg
+
+
+@pytest.mark.parametrize("stream_steps", [False, True])
+def test_Given_malformed_xml__When_run__Then_syntax_error_emitted(
+    mock_print: MagicMock, tmp_path: Path, stream_steps: bool
+) -> None:
+    malformed_file = tmp_path / "malformed.met"
+    malformed_file.write_text(
+        f'<Complex><Properties><Simple name="CommandId" value="{ASPIRATE_VVP96_STEP_ID}" /></Complex>\n',
+        encoding="utf-8",
+    )
+    linter = RoboLinter()
+    linter.register_checker(HardcodedValuesChecker(linter))
+    linter.set_option("stream-steps", stream_steps)
+
+    linter.check([str(malformed_file)])
+
+    assert linter.stats.by_msg == {"syntax-error": 1}
+
+
+def test_Given_stream_steps_enabled__When_method_truncated_after_its_first_steps__Then_syntax_error_emitted(
+    mock_print: MagicMock, tmp_path: Path
+) -> None:
+    method_lines = (
+        Path(PATH_TO_XMLS, "robolinter", "rule-disabled-in-block-between-comments.xml")
+        .read_text(encoding="utf-8")
+        .splitlines(keepends=True)
+    )
+    truncated_file = tmp_path / "truncated.met"
+    truncated_file.write_text("".join(method_lines[:300]), encoding="utf-8")  # in the middle of the third step
+    linter = RoboLinter()
+    linter.register_checker(HardcodedValuesChecker(linter))
+    linter.set_option("stream-steps", True)
+
+    linter.check([str(truncated_file)])
+
+    assert linter.stats.by_msg["syntax-error"] == 1
+    assert "astroid-error" not in linter.stats.by_msg
+
+
+@pytest.mark.parametrize("stream_steps", [False, True])
+def test_When_rule_disabled_in_block__Then_only_messages_between_disable_and_enable_suppressed(
+    stream_steps: bool,
+) -> None:
+    reporter = CollectingReporter()
+    linter = RoboLinter(reporter=reporter)
+    linter.register_checker(HardcodedValuesChecker(linter))
+    linter.set_option("stream-steps", stream_steps)
+    linter.enable("suppressed-message")
+
+    linter.check([os.path.join(PATH_TO_XMLS, "robolinter", "rule-disabled-in-block-between-comments.xml")])
+
+    assert sorted((message.symbol, message.line) for message in reporter.messages) == [
+        ("hardcoded-aspirate-volume", 4),
+        ("locally-disabled", 1),
+        ("suppressed-message", 1),
+        ("suppressed-message", 2),
+    ]
+
+
+@pytest.mark.parametrize("stream_steps", [False, True])
+def test_Given_utf16_method__When_rule_disabled_in_block__Then_same_messages_as_utf8_method(
+    stream_steps: bool, tmp_path: Path
+) -> None:
+    utf16_file = tmp_path / "utf16.met"
+    utf16_file.write_text(
+        Path(PATH_TO_XMLS, "robolinter", "rule-disabled-in-block-between-comments.xml").read_text(encoding="utf-8"),
+        encoding="utf-16",  # with a byte order mark
+    )
+    reporter = CollectingReporter()
+    linter = RoboLinter(reporter=reporter)
+    linter.register_checker(HardcodedValuesChecker(linter))
+    linter.set_option("stream-steps", stream_steps)
+    linter.enable("suppressed-message")
+
+    linter.check([str(utf16_file)])
+
+    assert sorted((message.symbol, message.line) for message in reporter.messages) == [
+        ("hardcoded-aspirate-volume", 4),
+        ("locally-disabled", 1),
+        ("suppressed-message", 1),
+        ("suppressed-message", 2),
+    ]
+
+
+@pytest.mark.parametrize(
+    "disabled_ranges,line,expected_start",
+    [
+        (((2, 5),), 1, None),
+        (((2, 5),), 2, 2),
+        (((2, 5),), 4, 2),
+        (((2, 5),), 5, None),
+        (((2, 5), (7, None)), 6, None),
+        (((2, 5), (7, None)), 1000, 7),
+    ],
+)
+def test_When_line_looked_up_in_disabled_intervals__Then_start_of_enclosing_block_returned(
+    disabled_ranges: tuple[tuple[int, Optional[int]], ...], line: int, expected_start: Optional[int]
+) -> None:
+    disabled_intervals = DisabledIntervals()
+    for start, end in disabled_ranges:
+        disabled_intervals.disable_from(start)
+        disabled_intervals.disable_from(start + 1)  # already disabled, so ignored
+        if end is not None:
+            disabled_intervals.enable_from(end)
+
+    assert disabled_intervals.find_start(line) == expected_start
+
+
+def test_Given_robolint_not_in_file__When_run__Then_directives_not_searched_for(
+    mock_print: MagicMock, mocker: MockerFixture
+) -> None:
+    linter = RoboLinter()
+    linter.register_checker(HardcodedValuesChecker(linter))
+    spied_directives = mocker.spy(robolinter, "directives")
+
+    linter.check([os.path.join(PATH_TO_XMLS, "hardcoded-aspiration-volume", "single-active-channel-hardcoded.xml")])
+
+    spied_directives.assert_not_called()
+    assert linter.stats.by_msg == {"hardcoded-aspirate-volume": 1}
+
+
 def test_When_comment_does_not_disable_rule__Then_message_not_supressed(mock_print: MagicMock) -> None:
     linter = RoboLinter()
     linter.register_checker(HardcodedValuesChecker(linter))
@@ -0,0 +1,91 @@
+import os
+from pathlib import Path
+import shutil
+from typing import Union
+
+from pylint.reporters import CollectingReporter
+import pytest
+from robolint.native import NativeRun
+from robolint.run import RobolintRun
+from robolint.scheduling import load_failed_filepaths
+from robolint.scheduling import prioritize
+from robolint.scheduling import save_failed_filepaths
+
+from .fixtures import PATH_TO_XMLS
+
+HARDCODED_FILEPATH = os.path.join(PATH_TO_XMLS, "hardcoded-aspiration-volume", "single-active-channel-hardcoded.xml")
+CLEAN_FILEPATH = os.path.join(PATH_TO_XMLS, "hardcoded-aspiration-volume", "single-active-channel-with-variable.xml")
+
+
+def _copy_methods(tmp_path: Path, filenames_and_sources: list[tuple[str, str]]) -> list[str]:
+    """Copy Methods into `tmp_path`, each modified a second after the previous one."""
+    filepaths = []
+    for mtime, (filename, source_filepath) in enumerate(filenames_and_sources, start=1_700_000_000):
+        filepath = str(tmp_path / filename)
+        shutil.copyfile(source_filepath, filepath)
+        os.utime(filepath, (mtime, mtime))
+        filepaths.append(filepath)
+    return filepaths
+
+
+def test_When_files_prioritized__Then_failed_last_time_first_then_most_recently_modified(tmp_path: Path) -> None:
+    filepaths = _copy_methods(
+        tmp_path, [("old.xml", CLEAN_FILEPATH), ("middle.xml", CLEAN_FILEPATH), ("new.xml", CLEAN_FILEPATH)]
+    )
+    old, middle, new = filepaths[0], filepaths[1], filepaths[2]
+
+    assert prioritize(filepaths, lambda filepath: filepath, {os.path.abspath(old)}) == [old, new, middle]
+
+
+def test_When_failed_filepaths_saved__Then_files_not_linted_keep_their_record() -> None:
+    save_failed_filepaths(["/a.xml", "/b.xml"], ["/a.xml", "/b.xml"])
+
+    save_failed_filepaths(["/a.xml", "/c.xml"], ["/c.xml"])
+
+    assert load_failed_filepaths() == {"/b.xml", "/c.xml"}
+
+
+def test_Given_no_record__When_failed_filepaths_loaded__Then_empty(failed_filepaths_path: str) -> None:
+    assert not os.path.exists(failed_filepaths_path)
+
+    assert load_failed_filepaths() == set()
+
+
+def _run(run_class: Union[type[RobolintRun], type[NativeRun]], args: list[str]) -> list[tuple[str, str]]:
+    reporter = CollectingReporter()
+    with pytest.raises(SystemExit):
+        run_class(["--disable=all", "--enable=hardcoded-aspirate-volume", "--persistent=y", *args], reporter=reporter)
+    return [(os.path.basename(message.path), message.symbol) for message in reporter.messages]
+
+
+@pytest.mark.parametrize("run_class", [RobolintRun, NativeRun])
+def test_Given_fail_fast__When_run__Then_stops_after_first_failing_file_in_priority_order(
+    run_class: Union[type[RobolintRun], type[NativeRun]], tmp_path: Path
+) -> None:
+    filepaths = _copy_methods(
+        tmp_path,
+        [("old.xml", HARDCODED_FILEPATH), ("clean.xml", CLEAN_FILEPATH), ("new.xml", HARDCODED_FILEPATH)],
+    )
+    args = ["--load-plugins=robolint.checkers.hardcoded_values", "--fail-fast=y", *filepaths]
+
+    assert _run(run_class, args) == [("new.xml", "hardcoded-aspirate-volume")]
+    assert load_failed_filepaths() == {os.path.abspath(filepaths[2])}
+
+    os.utime(filepaths[1], None)  # the clean file is now the most recently modified
+    os.utime(filepaths[0], None)  # and the old failing file even more so
+
+    assert _run(run_class, args) == [("new.xml", "hardcoded-aspirate-volume")]  # failed last time, so linted first
+
+
+@pytest.mark.parametrize("run_class", [RobolintRun, NativeRun])
+def test_Given_no_fail_fast__When_run__Then_all_files_linted_in_given_order_and_failures_recorded(
+    run_class: Union[type[RobolintRun], type[NativeRun]], tmp_path: Path
+) -> None:
+    filepaths = _copy_methods(
+        tmp_path, [("a.xml", HARDCODED_FILEPATH), ("b.xml", CLEAN_FILEPATH), ("c.xml", HARDCODED_FILEPATH)]
+    )
+
+    messages = _run(run_class, ["--load-plugins=robolint.checkers.hardcoded_values", *filepaths])
+
+    assert messages == [("a.xml", "hardcoded-aspirate-volume"), ("c.xml", "hardcoded-aspirate-volume")]
+    assert load_failed_filepaths() == {os.path.abspath(filepaths[0]), os.path.abspath(filepaths[2])}
@@ -0,0 +1,119 @@
+import os
+from pathlib import Path
+import shutil
+from typing import Union
+
+from pylint.reporters import CollectingReporter
+import pytest
+from pytest_mock import MockerFixture
+from robolint.native import NativeRun
+from robolint.run import RobolintRun
+from robolint.workspaces import get_option_arguments
+from robolint.workspaces import group_by_workspace_config
+from robolint.workspaces import WorkspaceConfigFinder
+
+from .fixtures import PATH_TO_XMLS
+
+LOOP_STARTING_AT_ZERO_FILEPATH = os.path.join(PATH_TO_XMLS, "invalid_loop_start_index", "loop-starting-at-zero.xml")
+LOOP_STARTING_AT_ONE_FILEPATH = os.path.join(PATH_TO_XMLS, "invalid_loop_start_index", "loop-starting-at-one.xml")
+
+
+def _write_rcfile(directory: Path, loop_start_index: int, filename: str = "robolintrc") -> str:
+    directory.mkdir(parents=True, exist_ok=True)
+    rcfile = directory / filename
+    rcfile.write_text(
+        "[MAIN]\n"
+        "load-plugins=robolint.checkers.looping\n"
+        "disable=all\n"
+        "enable=invalid-loop-start-index\n"
+        f"loop-start-index={loop_start_index}\n"
+        "persistent=no\n",
+        encoding="utf-8",
+    )
+    return str(rcfile)
+
+
+def _copy_method(source_filepath: str, filepath: Path) -> str:
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(source_filepath, filepath)
+    return str(filepath)
+
+
+def test_Given_workspace_robolintrc__When_found__Then_closest_one_used_and_each_directory_looked_up_once(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    run_rcfile = _write_rcfile(tmp_path, 0)
+    workspace_rcfile = _write_rcfile(tmp_path / "B", 1, filename=".robolintrc")
+    finder = WorkspaceConfigFinder(run_rcfile)
+    isfile = mocker.spy(os.path, "isfile")
+
+    assert finder.find(str(tmp_path / "A" / "Methods" / "a.xml")) is None
+    assert finder.find(str(tmp_path / "B" / "Methods" / "Sub" / "b.xml")) == workspace_rcfile
+    assert finder.find(str(tmp_path / "B" / "Methods" / "c.xml")) == workspace_rcfile
+    looked_up_directories = {os.path.dirname(call.args[0]) for call in isfile.call_args_list}
+    # two filenames looked for in each directory, except the run's, whose robolintrc is the first
+    assert len(isfile.call_args_list) == len(looked_up_directories) * 2 - 1
+    assert str(tmp_path.parent) not in looked_up_directories  # not above the run's configuration file
+
+
+def test_When_grouped__Then_directories_left_to_run_and_workspaces_in_order_of_first_method(tmp_path: Path) -> None:
+    run_rcfile = _write_rcfile(tmp_path, 0)
+    b_rcfile = _write_rcfile(tmp_path / "B", 1)
+    c_rcfile = _write_rcfile(tmp_path / "C", 1)
+    c1, a1, b1, c2 = (
+        _copy_method(LOOP_STARTING_AT_ONE_FILEPATH, tmp_path / directory / "Methods" / "m.xml")
+        for directory in ("C", "A", "B", "C/Sub")
+    )
+
+    assert group_by_workspace_config([c1, a1, str(tmp_path / "B"), b1, c2], WorkspaceConfigFinder(run_rcfile)) == (
+        [a1, str(tmp_path / "B")],
+        {c_rcfile: [c1, c2], b_rcfile: [b1]},
+    )
+
+
+def test_When_option_arguments_taken__Then_methods_to_lint_removed() -> None:
+    arguments = ["--disable", "a.xml", "--exit-zero", "a.xml", "--", "b.xml"]
+
+    assert get_option_arguments(arguments, ["a.xml", "--", "b.xml"]) == ["--disable", "a.xml", "--exit-zero"]
+
+
+@pytest.mark.parametrize("run_class", [RobolintRun, NativeRun])
+def test_Given_workspace_config__When_run__Then_each_method_linted_with_its_workspace_robolintrc(
+    run_class: Union[type[RobolintRun], type[NativeRun]], tmp_path: Path
+) -> None:
+    run_rcfile = _write_rcfile(tmp_path, 0)
+    _write_rcfile(tmp_path / "B", 1)
+    filepaths = [
+        _copy_method(source_filepath, tmp_path / directory / "Methods" / filename)
+        for directory, filename, source_filepath in (
+            ("A", "a1.xml", LOOP_STARTING_AT_ONE_FILEPATH),
+            ("B", "b1.xml", LOOP_STARTING_AT_ONE_FILEPATH),
+            ("A", "a0.xml", LOOP_STARTING_AT_ZERO_FILEPATH),
+            ("B", "b0.xml", LOOP_STARTING_AT_ZERO_FILEPATH),
+        )
+    ]
+    reporter = CollectingReporter()
+
+    with pytest.raises(SystemExit) as exc_info:
+        run_class([f"--rcfile={run_rcfile}", "--workspace-config=y", *filepaths], reporter=reporter)
+
+    assert [(message.module, message.msg) for message in reporter.messages] == [
+        ("a1", "The loop start index was 1, please replace with 0."),
+        ("b0", "The loop start index was 0, please replace with 1."),
+    ]
+    assert exc_info.value.code == 16
+
+
+@pytest.mark.parametrize("run_class", [RobolintRun, NativeRun])
+def test_Given_no_workspace_config__When_run__Then_workspace_robolintrc_ignored(
+    run_class: Union[type[RobolintRun], type[NativeRun]], tmp_path: Path
+) -> None:
+    run_rcfile = _write_rcfile(tmp_path, 0)
+    _write_rcfile(tmp_path / "B", 1)
+    filepath = _copy_method(LOOP_STARTING_AT_ONE_FILEPATH, tmp_path / "B" / "Methods" / "b1.xml")
+    reporter = CollectingReporter()
+
+    with pytest.raises(SystemExit):
+        run_class([f"--rcfile={run_rcfile}", filepath], reporter=reporter)
+
+    assert [message.msg for message in reporter.messages] == ["The loop start index was 1, please replace with 0."]
@@ -0,0 +1,52 @@
+import re
+from typing import cast
+
+from lxml.etree import _Element
+from lxml.etree import fromstring
+import pytest
+from robolint.xpaths import get_xpath
+from robolint.xpaths import WELL_VOLUME_VARIABLE_XPATH
+
+
+def test_Given_xpath_already_requested__When_requested_again__Then_same_compiled_xpath_returned() -> None:
+    expression = "Items/Item/Simple[@value='VariableName']/../Simple[2]"
+
+    assert get_xpath(expression) is get_xpath(expression)
+
+
+def test_When_xpath_uses_exslt_regular_expressions__Then_namespace_already_bound() -> None:
+    root = fromstring('<Root><Simple value="Abc" /><Simple value="abc" /></Root>')
+
+    matches = cast(list[_Element], get_xpath("Simple[re:match(@value, '^[A-Z]')]")(root))
+
+    assert [node.get("value") for node in matches] == ["Abc"]
+
+
+@pytest.mark.parametrize(
+    "parameter_name",
+    [
+        "A01.volumeVariable",
+        "AB12.volumeVariable",
+        "H12.volume",
+        "a01.volumeVariable",
+        "ABC01.volumeVariable",
+        "A1.volumeVariable",
+        "A01.volumeVariableX",
+        "A01.volumeVariable.volumeVariable",
+        "A0!.volumeVariable",
+        ".volumeVariable",
+        "plateVariable",
+    ],
+)
+def test_When_well_volume_variable_xpath_evaluated__Then_matches_same_names_as_regular_expression(
+    parameter_name: str,
+) -> None:
+    parameters_node = fromstring(
+        f'<Dictionary name="Parameters"><Items><Item><Simple value="{parameter_name}" />'
+        '<Simple type="System.String, mscorlib" value="SrcVol" /></Item></Items></Dictionary>'
+    )
+    expected = re.match(r"^[A-Z]{1,2}\d{2}\.volumeVariable$", parameter_name) is not None
+
+    actual = len(cast(list[_Element], get_xpath(WELL_VOLUME_VARIABLE_XPATH)(parameters_node))) == 1
+
+    assert actual is expected
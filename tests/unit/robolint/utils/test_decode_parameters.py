@@ -0,0 +1,38 @@
+from uuid import UUID
+
+import pytest
+from robolint.utils import decode_parameter_value
+from robolint.utils import ParameterValue
+
+
+@pytest.mark.parametrize(
+    "value,dotnet_type,expected",
+    [
+        ("5ul-300ul", "System.String, mscorlib", "5ul-300ul"),
+        ("True", "System.Boolean, mscorlib", True),
+        ("false", "System.Boolean, mscorlib", False),
+        ("0", "System.Byte, mscorlib", 0),
+        ("-3", "System.Int32, mscorlib", -3),
+        ("50", "System.UInt32, mscorlib", 50),
+        ("15", "System.Double, mscorlib", 15),
+        ("23.2", "System.Double, mscorlib", 23.2),
+        (
+            "b373a8f8-2f99-4c10-aece-1b9a9273f5f1",
+            "System.Guid, mscorlib",
+            UUID("b373a8f8-2f99-4c10-aece-1b9a9273f5f1"),
+        ),
+        ("Row", "MethodManager.Core.Domain.Direction, MethodManager.Core", "Row"),
+    ],
+)
+def test_When_parameter_value_decoded__Then_native_value_returned(
+    value: str, dotnet_type: str, expected: ParameterValue
+) -> None:
+    actual = decode_parameter_value(value, dotnet_type)
+
+    assert actual == expected
+    assert type(actual) is type(expected)
+
+
+def test_Given_invalid_boolean__When_decoded__Then_error() -> None:
+    with pytest.raises(ValueError, match="System.Boolean"):
+        decode_parameter_value("Yes", "System.Boolean, mscorlib")
@@ -6,6 +6,8 @@ from pytest_mock import MockerFixture
 from robolint import MM4Step
 from robolint import parse_steps
 from robolint import utils
+from robolint.utils import iterparse_steps
+from stdlib_utils import NoMatchingXmlElementError
 
 from ..fixtures import PATH_TO_XMLS
 
@@ -53,3 +55,102 @@ def test_Given_parameter_already_obtained__When_get_parameter_called__Then_cache
     basic_step.get_parameter("A01.enable")
 
     assert spied_find_element.call_count == original_call_count
+
+
+def test_When_parameters_accessed__Then_all_parameters_decoded(basic_step: MM4Step) -> None:
+    parameters = basic_step.parameters
+
+    assert parameters["A01.enable"] == "True"
+    assert parameters["A01.volumeVariable"] == "SrcVol"
+    assert basic_step.parameters is parameters
+
+
+def test_When_has_parameter_called__Then_presence_reported(basic_step: MM4Step) -> None:
+    assert basic_step.has_parameter("A01.enable") is True
+    assert basic_step.has_parameter("H12.volumeVariable") is False
+
+
+def test_Given_parameter_absent__When_get_parameter_called_with_default__Then_default_returned(
+    basic_step: MM4Step,
+) -> None:
+    assert basic_step.get_parameter("H12.volumeVariable", default="") == ""
+
+
+def test_Given_parameter_absent__When_get_parameter_called__Then_error(basic_step: MM4Step) -> None:
+    with pytest.raises(NoMatchingXmlElementError, match="H12.volumeVariable"):
+        basic_step.get_parameter("H12.volumeVariable")
+
+
+def test_Given_parameters_already_decoded__When_absent_parameter_checked__Then_xml_not_searched_again(
+    basic_step: MM4Step, mocker: MockerFixture
+) -> None:
+    basic_step.has_parameter("A01.enable")
+    spied_find_element = mocker.spy(utils, "find_exactly_one_xml_element")
+
+    for _ in range(3):
+        assert basic_step.has_parameter("H12.volumeVariable") is False
+
+    assert spied_find_element.call_count == 0
+
+
+def test_Given_parameters_nested_in_complex_or_collection__When_parameters_accessed__Then_nested_ones_decoded() -> None:
+    file = os.path.join(PATH_TO_XMLS, "parameters", "nested-parameters.xml")
+    step = parse_steps(file)[0]
+
+    assert step.parameters == {
+        "plate": "Waste Hole_01",
+        "height": "15",
+        "A01.enable": "True",
+        "H12.enable": "False",
+        "motionProfileName": "Fast Speed",
+    }
+    assert step.get_typed_parameter("height") == 15
+    assert step.has_parameter("channelSettings") is False  # it holds several values rather than one
+    assert [streamed_step.parameters for streamed_step in iterparse_steps(file)] == [step.parameters]
+
+
+def test_When_parameter_types_accessed__Then_dotnet_types_returned(basic_step: MM4Step) -> None:
+    assert basic_step.parameter_types["A01.enable"] == "System.Boolean, mscorlib"
+
+
+def test_When_converted_to_record__Then_record_has_same_step_and_parameters(basic_step: MM4Step) -> None:
+    record = basic_step.to_record()
+
+    assert record.step_index == basic_step.step_index
+    assert record.step_type_id == basic_step.step_type_id
+    assert record.line == basic_step.xml_node.sourceline  # type: ignore[attr-defined] # the step node is an element
+    assert record.get_parameter("A01.enable") == "True"
+    assert record.parameter_types["A01.enable"] == "System.Boolean, mscorlib"
+    assert record.has_parameter("H12.volumeVariable") is False
+    assert record.get_parameter("H12.volumeVariable", default="") == ""
+    with pytest.raises(KeyError):
+        record.get_parameter("H12.volumeVariable")
+    assert not hasattr(record, "__dict__")
+
+
+def test_When_get_typed_parameter_called__Then_native_value_returned(basic_step: MM4Step) -> None:
+    assert basic_step.get_typed_parameter("A01.enable") is True
+
+
+def test_Given_typed_parameter_already_decoded__When_get_typed_parameter_called__Then_cached_value_used(
+    basic_step: MM4Step, mocker: MockerFixture
+) -> None:
+    basic_step.get_typed_parameter("A01.enable")
+    spied_decode = mocker.spy(utils, "decode_parameter_value")
+
+    basic_step.get_typed_parameter("A01.enable")
+
+    assert spied_decode.call_count == 0
+
+
+def test_Given_number_stored_as_string__When_get_number_parameter_called__Then_number_returned() -> None:
+    file = os.path.join(PATH_TO_XMLS, "invalid_loop_start_index", "loop-starting-at-one.xml")
+    loop_step = parse_steps(file)[0]
+
+    assert loop_step.parameter_types["VariableValue"].startswith("System.String")
+    assert loop_step.get_number_parameter("VariableValue") == 1
+
+
+def test_Given_parameter_not_a_number__When_get_number_parameter_called__Then_error(basic_step: MM4Step) -> None:
+    with pytest.raises(TypeError, match="A01.enable"):
+        basic_step.get_number_parameter("A01.enable")
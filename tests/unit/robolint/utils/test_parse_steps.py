@@ -1,9 +1,23 @@
+import gc
 import os
+import sys
 
+from lxml.etree import _Element
+from lxml.etree import _ElementTree
 from robolint import parse_steps
+from robolint import parse_xml_module_from_file
+from robolint.constants import ASPIRATE_VVP96_STEP_ID
+from robolint.constants import COMMENT_STEPS_ID
+from robolint.constants import IF_STEP_ID
+from robolint.constants import TIP_LOAD_STEP_ID
+from robolint.utils import iterparse_steps
+from robolint.utils import parse_step_records
+from robolint.utils import stream_xml_module_from_file
 
 from ..fixtures import PATH_TO_XMLS
 
+NESTED_STEPS_FILE = os.path.join(PATH_TO_XMLS, "steps", "nested-steps-collection.xml")
+
 
 def test__When_single_step__Then_returns_one_step() -> None:
     file = os.path.join(PATH_TO_XMLS, "hardcoded-aspiration-volume", "single-active-channel-with-variable.xml")
@@ -15,3 +29,124 @@ def test__When_multiple_step__Then_returns_multiple_steps() -> None:
     file = os.path.join(PATH_TO_XMLS, "hardcoded-aspiration-volume", "single-active-channel-hardcoded.xml")
     steps = parse_steps(file)
     assert len(steps) == 2
+
+
+def test__Given_steps_already_accessed__When_steps_accessed_again__Then_same_step_objects_returned() -> None:
+    file = os.path.join(PATH_TO_XMLS, "hardcoded-aspiration-volume", "single-active-channel-hardcoded.xml")
+    xml_module = parse_xml_module_from_file(file)
+
+    first_steps = xml_module.steps
+
+    assert xml_module.steps is first_steps
+    assert len(first_steps) == 2
+
+
+def test__When_steps_iterparsed__Then_same_steps_as_parsing_whole_tree() -> None:
+    file = os.path.join(
+        PATH_TO_XMLS, "hardcoded-aspiration-volume", "rule-disabled-single-active-channel-hardcoded.xml"
+    )
+    expected_steps = parse_steps(file)
+
+    actual = [(step.step_index, step.step_type_id, len(step.parameters_node[0])) for step in iterparse_steps(file)]
+
+    assert actual == [(step.step_index, step.step_type_id, len(step.parameters_node[0])) for step in expected_steps]
+    assert len(actual) == 2
+
+
+def test__When_iteration_moves_to_next_step__Then_previous_step_xml_cleared() -> None:
+    file = os.path.join(PATH_TO_XMLS, "hardcoded-aspiration-volume", "single-active-channel-hardcoded.xml")
+    steps = iterparse_steps(file)
+    first_step = next(steps)
+    assert first_step.xml_node.find("*") is not None
+
+    next(steps)
+
+    assert first_step.xml_node.find("*") is None
+
+
+def test_Given_steps_collection_within_a_step__When_steps_parsed__Then_only_method_steps_returned_by_both_parsers() -> (
+    None
+):
+    expected = [(0, COMMENT_STEPS_ID), (1, IF_STEP_ID), (2, TIP_LOAD_STEP_ID)]
+
+    parsed_steps = parse_steps(NESTED_STEPS_FILE)
+    streamed = [(step.step_index, step.step_type_id, step.parameters) for step in iterparse_steps(NESTED_STEPS_FILE)]
+
+    assert [(step.step_index, step.step_type_id) for step in parsed_steps] == expected
+    assert streamed == [(step.step_index, step.step_type_id, step.parameters) for step in parsed_steps]
+    assert parsed_steps[1].parameters == {"Condition": "TipsLoaded"}
+
+
+def test__When_steps_streamed__Then_data_of_method_before_steps_cleared() -> None:
+    first_step = next(iterparse_steps(NESTED_STEPS_FILE))
+
+    *before_steps, steps_collection = first_step.parameters_node.getroottree().getroot()[0]
+    assert steps_collection.get("name") == "Steps"
+    assert all(len(element) == 0 and not element.attrib for element in before_steps)  # the worktable is emptied
+
+
+def test__When_steps_streamed__Then_same_parameters_as_parsed_steps_and_names_are_interned() -> None:
+    file = os.path.join(PATH_TO_XMLS, "hardcoded-aspiration-volume", "two-active-hardcoded-channels.xml")
+    expected_steps = parse_steps(file)
+
+    streamed_parameters = [step.parameters for step in iterparse_steps(file)]
+
+    assert streamed_parameters == [step.parameters for step in expected_steps]
+    parameter_names = [name for parameters in streamed_parameters for name in parameters]
+    assert all(name is sys.intern(name) for name in parameter_names)
+
+
+def _referenced_objects(roots: list[object]) -> list[object]:
+    referenced: dict[int, object] = {}
+    pending = list(roots)
+    while pending:
+        obj = pending.pop()
+        if id(obj) not in referenced and not isinstance(obj, type):
+            referenced[id(obj)] = obj
+            pending.extend(gc.get_referents(obj))
+    return list(referenced.values())
+
+
+def test__When_step_records_parsed__Then_records_keep_no_xml_alive_and_names_are_interned() -> None:
+    file = os.path.join(PATH_TO_XMLS, "hardcoded-aspiration-volume", "two-active-hardcoded-channels.xml")
+    expected_steps = parse_steps(file)
+
+    records = parse_step_records(file)
+
+    assert [(record.step_index, record.step_type_id, record.parameters) for record in records] == [
+        (step.step_index, step.step_type_id, step.parameters) for step in expected_steps
+    ]
+    assert all(isinstance(record.line, int) for record in records)
+    assert any(isinstance(obj, _Element) for obj in _referenced_objects([expected_steps]))
+    assert not any(isinstance(obj, (_Element, _ElementTree)) for obj in _referenced_objects([records]))
+    parameter_names = [name for record in records for name in record.parameters]
+    assert all(name is sys.intern(name) for name in parameter_names)
+
+
+def test_Given_streamed_module__When_steps_or_tree_accessed__Then_whole_file_parsed() -> None:
+    xml_module = stream_xml_module_from_file(NESTED_STEPS_FILE)
+
+    assert [step.step_type_id for step in xml_module.steps] == [COMMENT_STEPS_ID, IF_STEP_ID, TIP_LOAD_STEP_ID]
+    assert xml_module.tree.getroot().get("name") == "Root"
+    assert [step.step_type_id for step in xml_module.iter_steps()] == [COMMENT_STEPS_ID, IF_STEP_ID, TIP_LOAD_STEP_ID]
+
+
+def test__When_steps_of_several_types_selected__Then_only_those_steps_returned_in_method_order() -> None:
+    file = os.path.join(
+        PATH_TO_XMLS, "hardcoded-aspiration-volume", "rule-disabled-single-active-channel-hardcoded.xml"
+    )
+    xml_module = parse_xml_module_from_file(file)
+
+    comment_steps = xml_module.steps_of_types({COMMENT_STEPS_ID})
+    selected_steps = xml_module.steps_of_types({ASPIRATE_VVP96_STEP_ID, COMMENT_STEPS_ID, TIP_LOAD_STEP_ID})
+
+    assert [step.step_type_id for step in comment_steps] == [COMMENT_STEPS_ID]
+    assert selected_steps == xml_module.steps
+    assert xml_module.steps_of_types({TIP_LOAD_STEP_ID}) == []
+
+
+def test__When_steps_of_no_particular_type_selected__Then_all_steps_returned() -> None:
+    file = os.path.join(PATH_TO_XMLS, "hardcoded-aspiration-volume", "single-active-channel-hardcoded.xml")
+    xml_module = parse_xml_module_from_file(file)
+
+    assert xml_module.steps_of_types(set()) is xml_module.steps
@@ -0,0 +1,112 @@
+import mmap
+import os
+from pathlib import Path
+
+from lxml.etree import tostring
+import pytest
+from robolint import parse_xml_module_from_file
+from robolint import utils
+from robolint.constants import TIP_EJECT_STEP_ID
+from robolint.constants import TIP_LOAD_STEP_ID
+from robolint.utils import count_lines
+from robolint.utils import mentions_any_step_type
+from robolint.utils import open_file_buffer
+from robolint.utils import SkippedXmlModule
+
+from ..fixtures import PATH_TO_XMLS
+
+SINGLE_STEP_FILE = os.path.join(PATH_TO_XMLS, "hardcoded-aspiration-volume", "single-active-channel-with-variable.xml")
+
+
+def _count_lines_in_text_mode(filepath: str) -> int:
+    with open(filepath, encoding="utf-8") as xml_file:
+        return sum(1 for _ in xml_file)
+
+
+@pytest.mark.parametrize(
+    "buffer,expected",
+    [
+        (b"", 0),
+        (b"<a/>", 1),
+        (b"<a/>\n", 1),
+        (b"<a>\n</a>", 2),
+        (b"<a>\r\n</a>\r\n", 2),
+    ],
+)
+def test_When_count_lines__Then_matches_text_mode_iteration(buffer: bytes, expected: int) -> None:
+    assert count_lines(buffer) == expected
+
+
+def test_When_xml_module_parsed__Then_tolineno_matches_text_mode_line_count() -> None:
+    xml_module = parse_xml_module_from_file(SINGLE_STEP_FILE)
+
+    assert xml_module.tolineno == _count_lines_in_text_mode(SINGLE_STEP_FILE) + 1
+    assert xml_module.file == SINGLE_STEP_FILE
+
+
+def test_Given_file_above_mmap_threshold__When_xml_module_parsed__Then_same_tree_as_reading_into_memory(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    in_memory_module = parse_xml_module_from_file(SINGLE_STEP_FILE)
+    monkeypatch.setattr(utils, "MMAP_THRESHOLD_BYTES", 0)
+    with open_file_buffer(SINGLE_STEP_FILE) as buffer:
+        assert isinstance(buffer, mmap.mmap)
+
+    mapped_module = parse_xml_module_from_file(SINGLE_STEP_FILE)
+
+    assert tostring(mapped_module.tree) == tostring(in_memory_module.tree)
+    assert mapped_module.tolineno == in_memory_module.tolineno
+    assert len(mapped_module.steps) == len(in_memory_module.steps)
+
+
+def _write_entity_bomb(directory: str, reference_count: int = 20000) -> str:
+    # a single large entity referenced many times: libxml2's loop detection doesn't catch it, expansion would need ~GBs
+    filepath = os.path.join(directory, "entity-bomb.met")
+    with open(filepath, "w", encoding="utf-8") as method_file:
+        method_file.write(f'<!DOCTYPE Complex [<!ENTITY big "{"A" * 100000}">]>\n')
+        method_file.write(f"<Complex><Properties>{'&big;' * reference_count}</Properties></Complex>\n")
+    return filepath
+
+
+def test_Given_entity_bomb__When_xml_module_parsed__Then_entities_not_expanded(tmp_path: Path) -> None:
+    filepath = _write_entity_bomb(str(tmp_path))
+
+    xml_module = parse_xml_module_from_file(filepath)
+
+    assert len(tostring(xml_module.tree)) < 1024 * 1024
+
+
+def test_Given_external_entity__When_xml_module_parsed__Then_file_not_read(tmp_path: Path) -> None:
+    secret_file = tmp_path / "secret.txt"
+    secret_file.write_text("do-not-read", encoding="utf-8")
+    filepath = tmp_path / "external-entity.met"
+    filepath.write_text(
+        f'<!DOCTYPE Complex [<!ENTITY secret SYSTEM "file://{secret_file}">]>\n<Complex>&secret;</Complex>\n',
+        encoding="utf-8",
+    )
+
+    xml_module = parse_xml_module_from_file(str(filepath))
+
+    assert b"do-not-read" not in tostring(xml_module.tree)
+
+
+@pytest.mark.parametrize(
+    "buffer,expected",
+    [
+        (f'<Simple name="CommandId" value="{TIP_LOAD_STEP_ID}" />'.encode(), True),
+        (f'<Simple name="CommandId" value="{TIP_EJECT_STEP_ID}" />'.encode(), False),
+        (b"\xff\xfe<\x00/\x00>\x00", True),
+    ],
+)
+def test_When_checked_for_step_types__Then_only_files_that_may_contain_them_match(
+    buffer: bytes, expected: bool
+) -> None:
+    assert mentions_any_step_type(buffer, {TIP_LOAD_STEP_ID}) is expected
+
+
+def test_Given_no_step_of_requested_types__When_xml_module_parsed__Then_module_skipped_without_steps() -> None:
+    xml_module = parse_xml_module_from_file(SINGLE_STEP_FILE, step_type_ids={TIP_LOAD_STEP_ID})
+
+    assert isinstance(xml_module, SkippedXmlModule)
+    assert not xml_module.steps
+    assert xml_module.tolineno == _count_lines_in_text_mode(SINGLE_STEP_FILE) + 1